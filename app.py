@@ -1,7 +1,10 @@
 import streamlit as st
 import streamlit.components.v1 as components
-from engine import generate_article_posts, generate_video_posts
+from engine import generate_article_posts_stream, generate_video_posts, warm_up_engine
 from extractor import extract_article
+from temp_uploads import save_upload, sweep_stale_uploads_once, upload_source_id
+from media_workspace import MEDIA_WORKSPACE
+from site_registry import SITE_REGISTRY
 
 # 페이지 설정
 st.set_page_config(
@@ -11,6 +14,13 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# 모델 목록을 백그라운드에서 미리 조회 (화면 렌더링을 막지 않음, 프로세스당 1회)
+warm_up_engine()
+
+# 이전 실행에서 남은 업로드 임시 파일과 영상 작업 디렉토리 정리 (프로세스당 1회)
+sweep_stale_uploads_once()
+MEDIA_WORKSPACE.sweep_once()
+
 # 클립보드 복사 함수
 def copy_to_clipboard(text, button_key):
     """JavaScript를 사용해 클립보드에 텍스트 복사"""
@@ -186,7 +196,7 @@ if 'youtube_video_path' not in st.session_state:
 
 # 타이틀
 st.title("🌐 Global Viralizer")
-st.markdown("K-엔터 기사를 글로벌 바이럴 SNS 콘텐츠로 변환하세요 (텐아시아 · 한국경제)")
+st.markdown(f"K-엔터 기사를 글로벌 바이럴 SNS 콘텐츠로 변환하세요 ({' · '.join(SITE_REGISTRY.names())})")
 
 # 사이드바에 정보 표시
 with st.sidebar:
@@ -197,7 +207,7 @@ with st.sidebar:
 
     st.markdown("""
     **방법 1: 기사 URL 입력** 📰
-    1. 텐아시아/한국경제 기사 URL 입력
+    1. 지원 언론사 기사 URL 입력
     2. 'Extract Article' 버튼 클릭
     3. 자동으로 출처 인식 및 게시물 생성
 
@@ -214,12 +224,10 @@ with st.sidebar:
     - 🌐 English / 🇰🇷 Korean 탭 전환
     - 📋 바이럴 점수 & 근거 확인
     - X, Instagram, Threads 각 6개 생성
-
-    **지원 언론사** 📰
-    - 📰 **텐아시아** (tenasia.co.kr)
-    - 💼 **한국경제** (hankyung.com)
     """)
 
+    st.markdown("**지원 언론사** 📰\n" + "\n".join(f"- 📰 **{site.name}** ({site.domain})" for site in SITE_REGISTRY.sites()))
+
     st.divider()
 
     # 버전 정보
@@ -251,6 +259,12 @@ content_style = st.selectbox(
     help="생성될 SNS 게시물의 전반적인 스타일과 톤을 결정합니다"
 )
 
+force_regenerate = st.checkbox(
+    "🔄 캐시 무시하고 새로 생성",
+    value=False,
+    help="같은 기사와 스타일로 이전에 생성한 결과가 있어도 AI로 다시 생성합니다"
+)
+
 st.markdown("---")
 
 # 메인 컨텐츠 - 반응형 레이아웃
@@ -265,7 +279,7 @@ with col1:
     article_url = st.text_input(
         "기사 URL",
         placeholder="https://www.tenasia.co.kr/article/... 또는 https://www.hankyung.com/...",
-        help="텐아시아 또는 한국경제 기사 URL을 입력하면 자동으로 출처와 내용을 추출합니다"
+        help=f"{', '.join(SITE_REGISTRY.names())} 기사 URL을 입력하면 자동으로 출처와 내용을 추출합니다"
     )
 
     extract_and_generate_article = st.button(
@@ -293,17 +307,26 @@ with col1:
     if uploaded_video_file:
         st.success(f"✅ 파일 업로드 완료: {uploaded_video_file.name} ({uploaded_video_file.size / (1024*1024):.2f} MB)")
 
-        # 업로드된 파일을 임시 파일로 저장
-        import tempfile
-        if 'video_temp_path' not in st.session_state or st.session_state.get('video_filename') != uploaded_video_file.name:
-            temp_video_path = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4").name
-            with open(temp_video_path, "wb") as f:
-                f.write(uploaded_video_file.read())
+        # 업로드된 파일을 청크 단위로 임시 파일에 저장 (내용 해시를 함께 계산)
+        previous_upload = st.session_state.get('video_upload')
+        if previous_upload is None or previous_upload.source_id != upload_source_id(uploaded_video_file) or not previous_upload.exists:
+            if previous_upload is not None:
+                previous_upload.cleanup()  # 교체된 파일 삭제
+
+            video_upload = save_upload(uploaded_video_file)
 
-            # 세션 상태에 저장
-            st.session_state.video_temp_path = temp_video_path
-            st.session_state.video_filename = uploaded_video_file.name
-            st.session_state.video_file_size = uploaded_video_file.size
+            # 세션 상태에 저장 (세션 종료 시 TempUpload가 수거되면서 임시 파일 삭제)
+            st.session_state.video_upload = video_upload
+            st.session_state.video_temp_path = video_upload.path
+            st.session_state.video_filename = video_upload.filename
+            st.session_state.video_file_size = video_upload.size
+            st.session_state.video_content_hash = video_upload.content_hash
+
+    elif st.session_state.get('video_upload') is not None:
+        # 업로드 위젯에서 파일을 제거하면 임시 파일도 삭제
+        st.session_state.video_upload.cleanup()
+        for key in ('video_upload', 'video_temp_path', 'video_filename', 'video_file_size', 'video_content_hash'):
+            st.session_state.pop(key, None)
 
     # 영상 분석 버튼 (업로드된 파일이 있을 때만 활성화)
     analyze_video_button = st.button(
@@ -455,8 +478,9 @@ if should_generate and content_to_use.strip():
 
         try:
             with status_container:
-                progress_bar.progress(10)
+                progress_bar.progress(5)
                 progress_text.text("🤖 AI 모델 초기화 중...")
+                model_used = None
 
                 # 모드별 함수 호출 (관심사 분리)
                 if is_video_mode:
@@ -467,17 +491,58 @@ if should_generate and content_to_use.strip():
                         video_title=title_to_use,
                         site_name=site_name_to_use,
                         tone_mode=tone_mode,
-                        content_style=content_style
+                        content_style=content_style,
+                        content_hash=st.session_state.get('video_content_hash') if video_path == st.session_state.get('video_temp_path') else None
                     )
                 else:
                     progress_text.text("📝 기사 분석 및 SNS 게시물 생성 중...")
-                    result = generate_article_posts(
+
+                    # 플랫폼별 상태 표시 (실시간 스트리밍)
+                    platform_status = {"x": status_x, "instagram": status_instagram, "threads": status_threads}
+                    platform_labels = {"x": "🐦 X (Twitter)", "instagram": "📸 Instagram", "threads": "🧵 Threads"}
+                    completed_posts = {"x": 0, "instagram": 0, "threads": 0}
+
+                    st.write("**👀 실시간 미리보기:**")
+                    preview_area = st.container()
+
+                    def show_retry(attempt, max_retries, wait_time, error):
+                        """재시도 상황을 화면에 표시"""
+                        retry_info.warning(f"⚠️ 재시도 {attempt}/{max_retries} - {wait_time}초 후 다시 시도합니다\n\n{error}")
+
+                    result = None
+                    for event in generate_article_posts_stream(
                         article_text=content_to_use,
                         article_title=title_to_use,
                         site_name=site_name_to_use,
                         tone_mode=tone_mode,
-                        content_style=content_style
-                    )
+                        content_style=content_style,
+                        progress_callback=show_retry,
+                        force_regenerate=force_regenerate
+                    ):
+                        platform = event["platform"]
+
+                        if platform == "all" and event["status"] == "generating":
+                            model_used = event["model"]
+                            retry_info.empty()
+                            progress_bar.progress(10)
+                            progress_text.text(f"✍️ {model_used} 모델이 게시물을 작성하는 중...")
+
+                        elif platform in platform_status and event["status"] == "completed":
+                            # 게시물 하나가 완성되는 즉시 상태와 미리보기 갱신
+                            completed_posts[platform] += 1
+                            platform_status[platform].text(f"{platform_labels[platform]}: ✅ {completed_posts[platform]}/2 완료")
+                            progress_bar.progress(10 + 80 * sum(completed_posts.values()) // 6)
+
+                            language_label = "🇰🇷 Korean" if event["language"] == "korean" else "🇺🇸 English"
+                            with preview_area:
+                                st.markdown(f"**{platform_labels[platform]} · {language_label}**")
+                                st.caption(event["content"])
+
+                        elif platform == "all" and event["status"] == "completed":
+                            result = event["result"]
+                            model_used = event["model"]
+                            if event.get("cached"):
+                                retry_info.info("💾 이전에 생성한 결과를 불러왔습니다 (새로 생성하려면 '캐시 무시하고 새로 생성'을 선택하세요)")
 
                 progress_bar.progress(100)
                 progress_text.text("✅ 생성 완료!")
@@ -512,7 +577,8 @@ if should_generate and content_to_use.strip():
             st.session_state.viral_reasons["threads"]["korean"] = result["viral_analysis"]["kr"]["threads"]["reason"]
 
             # 모델 정보 표시
-            model_used = "gemini-1.5-flash" if is_video_mode else "gemini-2.0-flash"
+            if not model_used:
+                model_used = "gemini-1.5-flash" if is_video_mode else "gemini-2.0-flash"
             model_info.caption(f"🤖 Generated by: {model_used} ({tone_mode.upper()} mode)")
 
             # 결과 표시
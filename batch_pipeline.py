@@ -0,0 +1,316 @@
+"""
+기사 URL 일괄 처리 파이프라인
+
+여러 기사 URL에 대해 기사 추출(extract_article)과 SNS 게시물 생성(generate_article_posts)을
+단계별 동시 실행 수를 제한하여 처리하고, 완료되는 순서대로 결과를 JSONL 파일에 기록합니다.
+출력 파일에 이미 성공으로 기록된 URL은 건너뛰므로, 중단된 작업을 같은 명령으로 재개할 수 있습니다.
+
+사용법:
+    python batch_pipeline.py urls.txt -o results.jsonl
+    python batch_pipeline.py urls.txt -o results.jsonl --extract-workers 8 --generate-workers 3
+    python batch_pipeline.py urls.txt -o results.jsonl --style 감성/팬덤 --force-regenerate
+
+Python API:
+    from batch_pipeline import run_batch
+    summary = run_batch(["https://www.tenasia.co.kr/article/..."], "results.jsonl")
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterable, List, Set
+import config
+from extractor import extract_article
+from engine import generate_article_posts, get_retry_metrics
+from http_cache import canonicalize_url
+from rate_limiter import request_context
+
+
+def read_urls(path: str) -> List[str]:
+    """
+    URL 목록 파일을 읽습니다 (한 줄에 URL 하나, 빈 줄과 # 주석 무시).
+
+    Args:
+        path: URL 목록 파일 경로 ("-"이면 표준 입력)
+
+    Returns:
+        URL 리스트
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+def load_completed_urls(output_path: str) -> Set[str]:
+    """
+    출력 파일에서 이미 성공한 URL(정규화된 URL)을 읽습니다.
+
+    마지막 줄이 중단으로 인해 잘려 있어도 무시하고 진행합니다.
+
+    Args:
+        output_path: JSONL 출력 파일 경로
+
+    Returns:
+        성공으로 기록된 정규화 URL 집합
+    """
+    completed = set()
+
+    if not os.path.exists(output_path):
+        return completed
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+
+            # 이전 버전이나 중단으로 일부만 기록된 줄은 canonical_url이 없을 수 있음
+            if not isinstance(record, dict) or not record.get("canonical_url"):
+                continue
+
+            if record.get("status") == "success":
+                completed.add(record["canonical_url"])
+
+    return completed
+
+
+class JSONLWriter:
+    """완료된 결과를 한 줄씩 즉시 기록하는 JSONL 작성기 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, record: dict):
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            # 중단되더라도 이미 완료된 결과는 남도록 즉시 디스크에 반영
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+def _extract_stage(url: str) -> dict:
+    """1단계: 기사 추출 (소요 시간 포함)"""
+    start = time.perf_counter()
+    article = extract_article(url)
+    article["elapsed"] = time.perf_counter() - start
+    return article
+
+
+def _generate_stage(article: dict, tone_mode: str, content_style: str, force_regenerate: bool, priority: str) -> dict:
+    """2단계: SNS 게시물 생성 (소요 시간 포함)"""
+    start = time.perf_counter()
+
+    # 일괄 처리 요청은 앱의 대화형 요청과 같은 쿼터를 공유하므로 별도 클라이언트로 공정 큐에 등록
+    with request_context(priority=priority, client="batch"):
+        result = generate_article_posts(
+            article_text=article["content"],
+            article_title=article["title"],
+            site_name=article["site_name"],
+            tone_mode=tone_mode,
+            content_style=content_style,
+            force_regenerate=force_regenerate
+        )
+    return {"result": result, "elapsed": time.perf_counter() - start}
+
+
+def run_batch(urls: Iterable[str], output_path: str, extract_workers: int = None, generate_workers: int = None, tone_mode: str = "rich", content_style: str = "심층/분석", force_regenerate: bool = False, resume: bool = True, priority: str = "backlog") -> dict:
+    """
+    여러 기사 URL을 추출 → 생성 파이프라인으로 처리합니다.
+
+    추출과 생성은 각각 별도의 스레드 풀에서 실행되어, 한 기사를 생성하는 동안
+    다음 기사들의 추출이 진행됩니다. 각 URL의 결과는 완료되는 즉시 JSONL로 기록됩니다.
+
+    기록 형식 (한 줄에 하나):
+        {"url", "canonical_url", "status": "success"|"failed", "failed_stage",
+         "title", "site_name", "result", "error",
+         "timing": {"extract", "generate", "total"}, "finished_at"}
+
+    Args:
+        urls: 처리할 기사 URL 목록
+        output_path: JSONL 출력 파일 경로 (추가 모드로 기록)
+        extract_workers: 동시 기사 추출 수 (기본값: config.BATCH_EXTRACT_WORKERS)
+        generate_workers: 동시 게시물 생성 수 (기본값: config.BATCH_GENERATE_WORKERS)
+        tone_mode: 분량 모드 (기본값: "rich")
+        content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        force_regenerate: True이면 결과 캐시를 무시하고 새로 생성
+        resume: True이면 출력 파일에 이미 성공으로 기록된 URL은 건너뜀
+        priority: Gemini 요청 우선순위 클래스 (기본값: "backlog")
+
+    Returns:
+        처리 요약 딕셔너리 {"total", "skipped", "success", "failed", "elapsed", "failures", "retry_metrics"}
+    """
+    if extract_workers is None:
+        extract_workers = config.BATCH_EXTRACT_WORKERS
+    if generate_workers is None:
+        generate_workers = config.BATCH_GENERATE_WORKERS
+
+    completed = load_completed_urls(output_path) if resume else set()
+
+    # 중복 URL 제거 (정규화 기준, 입력 순서 유지)
+    queue = []
+    seen = set()
+    skipped = 0
+    for url in urls:
+        canonical = canonicalize_url(url)
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+
+        if canonical in completed:
+            skipped += 1
+            continue
+        queue.append((url, canonical))
+
+    print(f"\n{'='*70}")
+    print(f"📦 일괄 처리 시작: {len(queue)}개 URL (이미 완료되어 건너뜀: {skipped}개)")
+    print(f"   동시 실행: 추출 {extract_workers}개 / 생성 {generate_workers}개")
+    print(f"   출력 파일: {output_path}")
+    print(f"{'='*70}\n")
+
+    batch_start = time.perf_counter()
+    writer = JSONLWriter(output_path)
+    summary = {"total": len(queue) + skipped, "skipped": skipped, "success": 0, "failed": 0, "failures": []}
+    timings = {"extract": [], "generate": []}
+
+    def finish(url, canonical, started_at, article=None, generated=None, failed_stage=None, error=None):
+        """URL 하나의 처리 결과를 기록합니다."""
+        timing = {
+            "extract": round(article["elapsed"], 3) if article else None,
+            "generate": round(generated["elapsed"], 3) if generated else None,
+            "total": round(time.perf_counter() - started_at, 3)
+        }
+        record = {
+            "url": url,
+            "canonical_url": canonical,
+            "status": "failed" if failed_stage else "success",
+            "failed_stage": failed_stage,
+            "title": article.get("title") if article else None,
+            "site_name": article.get("site_name") if article else None,
+            "result": generated["result"] if generated else None,
+            "error": error,
+            "timing": timing,
+            "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+        }
+        writer.write(record)
+
+        done = summary["success"] + summary["failed"] + 1
+        if failed_stage:
+            summary["failed"] += 1
+            summary["failures"].append({"url": url, "stage": failed_stage, "error": error})
+            print(f"❌ [{done}/{len(queue)}] {url} ({failed_stage} 실패, {timing['total']:.1f}초): {error.splitlines()[0] if error else ''}")
+        else:
+            summary["success"] += 1
+            print(f"✅ [{done}/{len(queue)}] {url} (추출 {timing['extract']:.1f}초 / 생성 {timing['generate']:.1f}초)")
+
+    try:
+        with ThreadPoolExecutor(max_workers=extract_workers, thread_name_prefix="extract") as extract_pool, \
+             ThreadPoolExecutor(max_workers=generate_workers, thread_name_prefix="generate") as generate_pool:
+
+            # future → (단계, url, 정규화 URL, 시작 시각, 추출 결과)
+            pending = {}
+            for url, canonical in queue:
+                future = extract_pool.submit(_extract_stage, url)
+                pending[future] = ("extract", url, canonical, time.perf_counter(), None)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, url, canonical, started_at, article = pending.pop(future)
+
+                    if stage == "extract":
+                        try:
+                            article = future.result()
+                        except Exception as e:
+                            finish(url, canonical, started_at, failed_stage="extract", error=str(e))
+                            continue
+
+                        timings["extract"].append(article["elapsed"])
+
+                        if not article["success"]:
+                            finish(url, canonical, started_at, article=article, failed_stage="extract", error=article["error"])
+                            continue
+
+                        # 추출이 끝난 기사부터 생성 단계로 전달
+                        next_future = generate_pool.submit(_generate_stage, article, tone_mode, content_style, force_regenerate, priority)
+                        pending[next_future] = ("generate", url, canonical, started_at, article)
+
+                    else:
+                        try:
+                            generated = future.result()
+                        except Exception as e:
+                            finish(url, canonical, started_at, article=article, failed_stage="generate", error=str(e))
+                            continue
+
+                        timings["generate"].append(generated["elapsed"])
+                        finish(url, canonical, started_at, article=article, generated=generated)
+
+    finally:
+        writer.close()
+
+    summary["elapsed"] = round(time.perf_counter() - batch_start, 3)
+
+    print(f"\n{'='*70}")
+    print(f"📊 일괄 처리 완료: 성공 {summary['success']}개 / 실패 {summary['failed']}개 / 건너뜀 {summary['skipped']}개")
+    for stage, label in (("extract", "추출"), ("generate", "생성")):
+        if timings[stage]:
+            average = sum(timings[stage]) / len(timings[stage])
+            print(f"   {label} 평균 {average:.2f}초 (최대 {max(timings[stage]):.2f}초, {len(timings[stage])}건)")
+    print(f"   전체 소요 시간: {summary['elapsed']:.1f}초")
+
+    retry_metrics = get_retry_metrics()
+    summary["retry_metrics"] = retry_metrics
+    if retry_metrics["retries"]:
+        print(f"   API 재시도: {retry_metrics['retries']}회 (백오프 대기 합계 {retry_metrics['backoff_seconds']:.1f}초, 에러: {retry_metrics['errors']})")
+    print(f"{'='*70}\n")
+
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 URL 일괄 추출 및 SNS 게시물 생성")
+    parser.add_argument("input", help="URL 목록 파일 (한 줄에 하나, '-'이면 표준 입력)")
+    parser.add_argument("-o", "--output", required=True, help="결과 JSONL 파일 경로")
+    parser.add_argument("--extract-workers", type=int, default=config.BATCH_EXTRACT_WORKERS, help="동시 기사 추출 수")
+    parser.add_argument("--generate-workers", type=int, default=config.BATCH_GENERATE_WORKERS, help="동시 게시물 생성 수")
+    parser.add_argument("--style", default="심층/분석", choices=["심층/분석", "감성/팬덤", "위트/밈", "심플/속보"], help="콘텐츠 스타일")
+    parser.add_argument("--tone", default="rich", choices=["compact", "rich"], help="분량 모드")
+    parser.add_argument("--priority", default="backlog", choices=list(config.RATE_LIMIT_PRIORITIES), help="Gemini 요청 우선순위 (속보는 breaking)")
+    parser.add_argument("--force-regenerate", action="store_true", help="결과 캐시를 무시하고 새로 생성")
+    parser.add_argument("--no-resume", action="store_true", help="출력 파일의 기존 성공 기록을 무시하고 모두 처리")
+    args = parser.parse_args()
+
+    summary = run_batch(
+        read_urls(args.input),
+        args.output,
+        extract_workers=args.extract_workers,
+        generate_workers=args.generate_workers,
+        tone_mode=args.tone,
+        content_style=args.style,
+        force_regenerate=args.force_regenerate,
+        resume=not args.no_resume,
+        priority=args.priority
+    )
+
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+기사 추출 벤치마크
+
+benchmarks/fixtures의 저장된 기사 페이지로 두 추출 경로를 비교합니다.
+
+- 직접 추출: 기사 HTML을 사이트 파서(html_extractor)로 파싱
+- Jina Reader: 같은 페이지의 Jina Reader 마크다운 (생성 전 strip_boilerplate 적용 전/후)
+
+지표:
+- 파싱 시간 (로컬 처리 시간, 네트워크 제외)
+- 재현율: 기대 본문 문단 중 결과에 포함된 비율
+- 정밀도: 결과 문단 중 기대 본문에 속하는 비율 (메뉴, 사진 설명, 광고 등이 섞이면 낮아짐)
+
+--live를 지정하면 실제 URL로 기사 페이지 직접 요청과 r.jina.ai 요청의 네트워크 지연도 측정합니다 (캐시 미사용).
+
+사용 예시:
+    python benchmarks/article_extraction_benchmark.py
+    python benchmarks/article_extraction_benchmark.py --live https://www.tenasia.co.kr/article/2026020679984
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_extractor import HTML_PARSER, parser_for
+from token_budget import strip_boilerplate
+from http_cache import get_session
+from site_registry import SITE_REGISTRY
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 픽스처 이름 접두어 → 도메인
+FIXTURE_DOMAINS = {
+    "tenasia": "tenasia.co.kr",
+    "hankyung": "hankyung.com",
+}
+
+
+def read(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def paragraphs(text: str) -> list:
+    """비교용 문단 목록 (공백 정리, 빈 문단 제외)"""
+    return [" ".join(block.split()) for block in text.split("\n\n") if block.strip()]
+
+
+def fidelity(output: str, expected: str) -> tuple:
+    """(재현율, 정밀도)를 계산합니다."""
+    output_paragraphs = paragraphs(output)
+    expected_paragraphs = paragraphs(expected)
+
+    found = sum(1 for paragraph in expected_paragraphs if paragraph in output_paragraphs)
+    relevant = sum(1 for paragraph in output_paragraphs if paragraph in expected_paragraphs)
+
+    recall = found / len(expected_paragraphs) if expected_paragraphs else 0.0
+    precision = relevant / len(output_paragraphs) if output_paragraphs else 0.0
+    return recall, precision
+
+
+def best_time(func, repeat: int) -> float:
+    """func를 repeat회 실행한 최단 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, elapsed, output: str, expected: str):
+    recall, precision = fidelity(output, expected)
+    timing = f"{elapsed * 1000:8.2f} ms" if elapsed is not None else f"{'-':>8}   "
+    print(f"  {label:<26} {timing}   재현율 {recall:6.1%}   정밀도 {precision:6.1%}   {len(output):6d}자")
+
+
+def run_fixture(name: str, repeat: int):
+    """픽스처 하나에 대해 두 경로를 비교합니다."""
+    html = read(os.path.join(FIXTURE_DIR, f"{name}.html"))
+    markdown = read(os.path.join(FIXTURE_DIR, f"{name}.jina.md"))
+    expected = read(os.path.join(FIXTURE_DIR, f"{name}.expected.txt"))
+
+    parser = parser_for(SITE_REGISTRY.resolve(FIXTURE_DOMAINS[name.split("_", 1)[0]]))
+
+    print(f"\n📰 {name}")
+
+    parsed = parser.parse(html)
+    report("직접 추출 (사이트 파서)", best_time(lambda: parser.parse(html), repeat), parsed["body"], expected)
+    report("Jina Reader (원본)", None, markdown, expected)
+    report("Jina Reader + 잡음 제거", best_time(lambda: strip_boilerplate(markdown), repeat), strip_boilerplate(markdown), expected)
+    print(f"  제목: {parsed['title']} / 기자: {parsed['byline']} / 입력: {parsed['published']}")
+
+
+def run_live(url: str, repeat: int):
+    """실제 URL로 직접 요청과 Jina Reader 요청의 네트워크 지연을 측정합니다."""
+    session = get_session()
+    print(f"\n🌐 {url}")
+
+    for label, fetch_url in (("직접 요청", url), ("r.jina.ai", f"https://r.jina.ai/{url}")):
+        try:
+            elapsed = best_time(lambda: session.get(fetch_url, timeout=60).raise_for_status(), repeat)
+            print(f"  {label:<26} {elapsed * 1000:8.1f} ms")
+        except Exception as e:
+            print(f"  {label:<26} 실패: {type(e).__name__} - {str(e)[:100]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 추출 경로별 속도/정확도 비교")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (기본값: 20, 최단 시간 사용)")
+    parser.add_argument("--live", nargs="*", default=[], metavar="URL", help="네트워크 지연을 측정할 기사 URL")
+    args = parser.parse_args()
+
+    print(f"🧪 HTML 파서: {HTML_PARSER}")
+
+    names = sorted(os.path.basename(path)[:-len(".html")] for path in glob.glob(os.path.join(FIXTURE_DIR, "*.html")))
+    for name in names:
+        run_fixture(name, args.repeat)
+
+    for url in args.live:
+        run_live(url, min(args.repeat, 3))
+
+
+if __name__ == "__main__":
+    main()
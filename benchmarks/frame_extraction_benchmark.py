@@ -0,0 +1,135 @@
+"""
+프레임 추출 벤치마크
+
+위치마다 VideoCapture를 새로 열고 탐색하던 기존 방식과
+캡처를 한 번만 여는 순방향 탐색(extract_frames_from_video), 구간별 병렬 추출
+(extract_frames_parallel)의 초당 추출 프레임 수를 비교합니다.
+
+사용 예시:
+    python benchmarks/frame_extraction_benchmark.py --video sample.mp4 --frames 10
+    python benchmarks/frame_extraction_benchmark.py --duration 60   # 합성 영상으로 측정
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube_processor import RETRY_OFFSETS, _frame_to_image, extract_frames_from_video, extract_frames_parallel, frame_workers
+
+
+def legacy_extract(video_path: str, frame_positions: list) -> list:
+    """기존 방식: 위치마다 캡처를 열고 CAP_PROP_POS_FRAMES로 탐색 (Skip-and-Retry 포함)"""
+    results = []
+
+    for frame_position in frame_positions:
+        cap = cv2.VideoCapture(video_path)
+        image = None
+
+        try:
+            for offset in RETRY_OFFSETS:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_position + offset)
+                ret, frame = cap.read()
+                if ret:
+                    image = _frame_to_image(frame)
+                if image is not None:
+                    break
+        finally:
+            cap.release()
+
+        results.append(image)
+
+    return results
+
+
+def make_sample_video(path: str, duration: int, fps: int = 30, size: tuple = (640, 360)) -> str:
+    """움직이는 도형과 잡음이 있는 합성 mp4 영상을 만듭니다."""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    rng = np.random.default_rng(0)
+    width, height = size
+
+    for index in range(duration * fps):
+        frame = rng.integers(0, 40, (height, width, 3), dtype=np.uint8)
+        x = (index * 7) % width
+        cv2.rectangle(frame, (x, 80), (min(width - 1, x + 120), 280), (0, 200, 255), -1)
+        cv2.putText(frame, str(index), (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        writer.write(frame)
+
+    writer.release()
+    return path
+
+
+def uniform_positions(video_path: str, num_frames: int, max_seconds: float) -> list:
+    """extract_frames_from_youtube와 같은 균등 분포 위치를 계산합니다."""
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    cap.release()
+
+    if fps > 0:
+        total_frames = min(total_frames, int(fps * max_seconds))
+
+    interval = total_frames // num_frames
+    return [i * interval for i in range(num_frames)]
+
+
+def measure(label: str, func, video_path: str, positions: list, repeat: int) -> float:
+    """func를 repeat회 실행하여 가장 빠른 시간 기준의 초당 프레임 수를 출력합니다."""
+    best = float("inf")
+    extracted = 0
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        images = func(video_path, positions)
+        best = min(best, time.perf_counter() - start)
+        extracted = sum(image is not None for image in images)
+
+    fps = extracted / best if best > 0 else 0.0
+    print(f"{label:<28} {best * 1000:9.1f} ms   {fps:8.1f} frames/s   ({extracted}/{len(positions)}개 추출)")
+    return fps
+
+
+def main():
+    import config
+
+    parser = argparse.ArgumentParser(description="프레임 추출 방식별 속도 비교")
+    parser.add_argument("--video", help="측정할 로컬 영상 파일 (없으면 합성 영상 생성)")
+    parser.add_argument("--duration", type=int, default=60, help="합성 영상 길이 (초, 기본값: 60)")
+    parser.add_argument("--frames", type=int, default=config.MAX_FRAMES, help=f"추출할 프레임 수 (기본값: {config.MAX_FRAMES})")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3, 최단 시간 사용)")
+    args = parser.parse_args()
+
+    video_path = args.video
+    temp_path = None
+
+    if not video_path:
+        temp_path = os.path.join(tempfile.gettempdir(), f"frame_benchmark_{os.getpid()}.mp4")
+        print(f"🎞️  합성 영상 생성 중 ({args.duration}초)...")
+        video_path = make_sample_video(temp_path, args.duration)
+
+    try:
+        positions = uniform_positions(video_path, args.frames, config.MAX_VIDEO_LENGTH)
+        print(f"📍 추출 위치: {positions}\n")
+
+        legacy_fps = measure("기존 (위치별 open+seek)", legacy_extract, video_path, positions, args.repeat)
+        sweep_fps = measure("순방향 탐색 (grab/retrieve)", extract_frames_from_video, video_path, positions, args.repeat)
+        # 첫 실행에 워커 시작 비용이 포함되지 않도록 한 번 미리 실행
+        extract_frames_parallel(video_path, positions)
+        parallel_fps = measure(f"구간 병렬 ({frame_workers()}개 프로세스)", extract_frames_parallel, video_path, positions, args.repeat)
+
+        if legacy_fps > 0:
+            print(f"\n⚡ 속도 향상: 순방향 {sweep_fps / legacy_fps:.2f}배, 병렬 {parallel_fps / legacy_fps:.2f}배")
+
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+프롬프트 조립 벤치마크
+
+요청마다 PromptBuilder를 만들고 공통 가이드라인 f-string을 처음부터 렌더링하던 기존 방식과
+조합별로 미리 렌더링해 둔 접두어에 기사 부분만 이어 붙이는 방식(build_article_prompt)의
+조립 시간과 메모리 할당 횟수를 비교합니다.
+
+사용 예시:
+    python benchmarks/prompt_build_benchmark.py
+    python benchmarks/prompt_build_benchmark.py --iterations 5000 --article-chars 8000
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import PromptBuilder
+from site_registry import SITE_REGISTRY
+
+
+SAMPLE_SENTENCE = "그룹 세븐틴이 새 앨범으로 글로벌 차트 정상에 오르며 월드투어 일정을 발표했다. "
+
+
+def legacy_build(site_name: str, tone_mode: str, content_style: str, article_text: str, article_title: str) -> str:
+    """기존 방식: 요청마다 공통 가이드라인을 새로 렌더링"""
+    builder = PromptBuilder(site_name, tone_mode, content_style)
+    return builder._render_common_guidelines("기사") + "\n\n" + builder.build_article_delta(article_text, article_title)
+
+
+def compiled_build(site_name: str, tone_mode: str, content_style: str, article_text: str, article_title: str) -> str:
+    """미리 렌더링한 접두어 + 기사 부분"""
+    return PromptBuilder(site_name, tone_mode, content_style).build_article_prompt(article_text, article_title)
+
+
+def measure(label: str, func, combos: list, article_text: str, article_title: str, iterations: int) -> float:
+    """func를 iterations회 실행하여 호출당 시간, 할당 블록 수, 최대 메모리 사용량을 출력합니다."""
+    start = time.perf_counter()
+    for index in range(iterations):
+        func(*combos[index % len(combos)], article_text, article_title)
+    elapsed = time.perf_counter() - start
+
+    # 메모리는 시간 측정과 분리해 tracemalloc으로 측정 (추적 비용이 시간에 섞이지 않도록)
+    # - 할당 블록: 호출 중 새로 잡힌 메모리 블록 수 (반환된 프롬프트 포함)
+    # - 최대 사용량: 호출 중 임시 문자열까지 포함한 최대 메모리
+    sample = min(iterations, 200)
+    blocks = peak = 0
+    tracemalloc.start()
+    for index in range(sample):
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        base = tracemalloc.get_traced_memory()[0]
+        prompt = func(*combos[index % len(combos)], article_text, article_title)
+        peak += tracemalloc.get_traced_memory()[1] - base
+        blocks += sum(max(stat.count_diff, 0) for stat in tracemalloc.take_snapshot().compare_to(before, "lineno"))
+        del prompt
+    tracemalloc.stop()
+
+    per_call = elapsed / iterations * 1e6
+    print(f"{label:<24} {per_call:9.1f} µs/회   {blocks / sample:6.1f}개 블록/회   최대 {peak / sample / 1024:8.1f} KB/회")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 조립 방식별 속도/할당 비교")
+    parser.add_argument("--iterations", type=int, default=2000, help="반복 횟수 (기본값: 2000)")
+    parser.add_argument("--article-chars", type=int, default=4000, help="합성 기사 길이 (글자 수, 기본값: 4000)")
+    args = parser.parse_args()
+
+    article_text = (SAMPLE_SENTENCE * (args.article_chars // len(SAMPLE_SENTENCE) + 1))[:args.article_chars]
+    article_title = "세븐틴, 새 앨범으로 글로벌 차트 1위"
+
+    combos = [
+        (site_name, tone_mode, content_style)
+        for site_name in SITE_REGISTRY.names()
+        for tone_mode in PromptBuilder.TONE_MODES
+        for content_style in PromptBuilder.CONTENT_STYLES
+    ]
+
+    start = time.perf_counter()
+    count = PromptBuilder.precompile()
+    version = PromptBuilder.template_version()
+    print(f"🧩 사전 렌더링: {count}개 조합, {(time.perf_counter() - start) * 1000:.1f} ms (템플릿 버전 {version})\n")
+
+    legacy = measure("기존 (매번 렌더링)", legacy_build, combos, article_text, article_title, args.iterations)
+    compiled = measure("사전 렌더링 + 접두어", compiled_build, combos, article_text, article_title, args.iterations)
+
+    if compiled > 0:
+        print(f"\n⚡ 속도 향상: {legacy / compiled:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
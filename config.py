@@ -28,6 +28,13 @@ FALLBACK_MODEL = "gemini-1.5-flash"
 # 3. 키워드 매칭 (flash, pro, gemini)
 # 4. 첫 번째 사용 가능한 모델
 
+# 모델 목록 캐시 유지 시간 (초)
+# TTL 이내에는 genai.list_models() 호출 없이 캐시된 목록과 선택 결과를 재사용합니다
+MODEL_CATALOG_TTL = 600
+
+# TTL 경과 후에도 캐시된 목록을 반환하며 백그라운드에서 갱신하는 허용 시간 (초)
+MODEL_CATALOG_STALE_TTL = 3600
+
 
 # ========================================
 # API 설정
@@ -40,9 +47,160 @@ MAX_RETRIES = 3
 API_TIMEOUT = 120
 
 # 지수 백오프 기본 대기 시간 (초)
-# 실제 대기 시간 = BASE_WAIT_TIME * (2 ** attempt)
+# 실제 대기 시간 = random(0, min(RETRY_MAX_DELAY, BASE_WAIT_TIME * (2 ** attempt)))  (Full Jitter)
 BASE_WAIT_TIME = 2
 
+# 재시도 1회 대기 시간 상한 (초)
+RETRY_MAX_DELAY = 30
+
+# 호출 1건의 전체 마감 시간 (초, 재시도 대기 포함)
+RETRY_DEADLINE = 180
+
+# 재시도 예산: RETRY_BUDGET_WINDOW초 동안 전체 재시도 허용 횟수
+RETRY_BUDGET = 30
+RETRY_BUDGET_WINDOW = 60
+
+# 서킷 브레이커: 서버 에러(5xx)가 연속 N회 발생하면 일정 시간 동안 호출 차단 (초)
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30
+
+# 언어별 병렬 생성 모드 (kr/en 요청을 동시에 보내고 결과를 병합)
+# 한 요청이 6개 게시물을 모두 출력할 때보다 전체 소요 시간이 짧아집니다
+PARALLEL_GENERATION = False
+
+# 병렬 생성 모드의 언어별 최대 출력 토큰 수
+PARALLEL_MAX_OUTPUT_TOKENS = 4096
+
+# 일괄 처리(batch_pipeline.py) 단계별 동시 실행 수
+BATCH_EXTRACT_WORKERS = 4
+BATCH_GENERATE_WORKERS = 2
+
+
+# ========================================
+# 프롬프트 캐시 설정
+# ========================================
+
+# 공통 가이드라인을 Gemini cached content로 등록하고 요청에는 기사 부분만 전송
+# 모델별 최소 캐시 토큰 수에 못 미치거나 캐시를 지원하지 않는 모델이면 자동으로 전체 프롬프트를 전송합니다
+PROMPT_CACHE_ENABLED = True
+
+# cached content 유지 시간 (초)
+PROMPT_CACHE_TTL = 3600
+
+# 만료까지 이 시간(초)보다 적게 남으면 사용 시 TTL 연장
+PROMPT_CACHE_REFRESH_MARGIN = 300
+
+# 등록 실패 후 다시 시도하기까지 대기 시간 (초)
+PROMPT_CACHE_RETRY_AFTER = 1800
+
+
+# ========================================
+# 기사 본문 토큰 예산 설정 (token_budget.py)
+# ========================================
+
+# 생성 전에 메뉴/관련 기사/이미지 등 잡음을 제거하고, 예산을 넘으면 중요한 문장만 골라 축약합니다
+ARTICLE_BUDGET_ENABLED = True
+
+# 기사 본문에 허용하는 입력 토큰 수
+ARTICLE_TOKEN_BUDGET = 3000
+
+# 로컬 추정값이 예산의 이 비율 이하면 count_tokens 호출 생략
+ARTICLE_TOKEN_LOCAL_MARGIN = 0.7
+
+# 예산에 가까울 때 모델의 count_tokens로 정확히 계산 (실패 시 로컬 추정)
+TOKEN_COUNT_API_ENABLED = True
+
+
+# ========================================
+# 생성 결과 캐시 설정
+# ========================================
+
+# 동일한 기사/스타일/모델 조합의 생성 결과를 재사용할지 여부
+RESULT_CACHE_ENABLED = True
+
+# 결과 캐시 SQLite 파일 경로
+RESULT_CACHE_PATH = ".cache/result_cache.sqlite3"
+
+# 결과 캐시 최대 크기 (바이트, 초과 시 오래 사용하지 않은 결과부터 삭제)
+RESULT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# 결과 캐시 유지 시간 (초, 기본값: 7일)
+RESULT_CACHE_TTL = 7 * 24 * 3600
+
+
+# ========================================
+# 요청 제한 설정 (rate_limiter.py)
+# ========================================
+
+# 클라이언트 측 요청 제한 사용 여부
+RATE_LIMIT_ENABLED = True
+
+# 모델별 분당 요청 수(rpm) / 분당 토큰 수(tpm)
+# 모델 이름의 가장 긴 접두어가 일치하는 항목을 사용하며, 없으면 "default"를 사용합니다
+# 프로젝트의 실제 쿼터 등급(무료/유료)에 맞게 조정하세요
+RATE_LIMITS = {
+    "default": {"rpm": 15, "tpm": 1_000_000},
+    "gemini-2.0-flash": {"rpm": 15, "tpm": 1_000_000},
+    "gemini-1.5-flash": {"rpm": 15, "tpm": 1_000_000},
+    "gemini-1.5-pro": {"rpm": 2, "tpm": 32_000},
+}
+
+# 우선순위 클래스 (숫자가 작을수록 먼저 처리)
+RATE_LIMIT_PRIORITIES = {
+    "breaking": 0,   # 속보
+    "normal": 1,     # 앱에서의 일반 요청
+    "backlog": 2,    # 일괄 처리
+}
+
+# 우선순위를 지정하지 않은 요청의 기본 우선순위
+RATE_LIMIT_DEFAULT_PRIORITY = "normal"
+
+# 토큰 예약량 추정: 요청당 출력 토큰 예약분, 업로드 파일(영상)당 입력 토큰
+# 실제 사용량은 응답의 usage_metadata로 보정됩니다
+RATE_LIMIT_OUTPUT_TOKENS = 4096
+RATE_LIMIT_MEDIA_TOKENS = 80_000
+
+
+# ========================================
+# HTTP 요청 설정 (기사 추출)
+# ========================================
+
+# 기사 추출 응답 캐시 디렉토리
+HTTP_CACHE_DIR = ".cache/http"
+
+# 기사 추출 응답 캐시 유지 시간 (초)
+# TTL 경과 후에는 ETag/Last-Modified 조건부 요청으로 재검증합니다
+HTTP_CACHE_TTL = 3600
+
+# 기사 추출 응답 캐시 최대 크기 (바이트, 초과 시 오래 사용하지 않은 응답부터 삭제)
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# 이 시간(초) 동안 사용하지 않은 응답은 재검증용으로도 보관하지 않고 삭제 (기본값: 7일)
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# 크기 한도를 넘지 않아도 캐시 디렉토리를 정리하는 주기 (초)
+HTTP_CACHE_SWEEP_INTERVAL = 3600
+
+# 커넥션 풀 설정 (호스트 수, 호스트당 최대 연결 수)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+
+# 기사 HTML 직접 추출 (html_extractor.py)
+# 전용 파서가 있는 사이트는 Jina Reader를 거치지 않고 기사 페이지를 직접 받아 파싱하며,
+# 파싱에 실패하면 Jina Reader로 다시 추출합니다
+DIRECT_EXTRACT_ENABLED = True
+DIRECT_EXTRACT_TIMEOUT = 10           # 기사 페이지 직접 요청 타임아웃 (초)
+DIRECT_EXTRACT_MIN_CHARS = 200        # 본문이 이 글자 수보다 짧으면 파싱 실패로 보고 Jina Reader 사용
+
+
+# ========================================
+# 시작 성능 설정
+# ========================================
+
+# app.py 모듈 import에 허용되는 최대 시간 (초)
+# startup_report.py가 `python -X importtime` 결과를 이 예산과 비교합니다
+STARTUP_TIME_BUDGET = 3.0
+
 
 # ========================================
 # 비디오 처리 설정
@@ -54,9 +212,85 @@ MAX_FRAMES = 10
 # 프레임 추출 간격 (초)
 FRAME_INTERVAL = 5
 
+# 프레임 추출 시 다음 위치까지 이 시간(초) 이하면 grab()으로 순차 이동, 초과하면 탐색
+# 탐색은 직전 키프레임부터 다시 디코딩하므로 키프레임 간격(보통 2~5초)의 절반 정도가 적당
+FRAME_SEEK_THRESHOLD_SECONDS = 2.0
+
+# 장면 전환 기반 키프레임 선택 (False면 균등 간격 추출)
+# 검은 화면/단색 화면과 비슷한 장면을 제외하므로 MAX_FRAMES보다 적게 추출될 수 있음
+SCENE_SELECTION_ENABLED = True
+SCENE_SAMPLE_FPS = 2            # 점수 계산용 초당 샘플 수
+SCENE_CUT_THRESHOLD = 0.3       # 직전 샘플 대비 변화량(0~1)이 이 값 이상이면 새 장면
+SCENE_MIN_BRIGHTNESS = 16       # 평균 밝기(0~255)가 이보다 낮으면 검은 화면으로 제외
+SCENE_MIN_CONTRAST = 8          # 밝기 표준편차가 이보다 낮으면 단색 화면으로 제외
+SCENE_HASH_DISTANCE = 10        # dHash 해밍 거리(0~64)가 이 값 이하면 중복 장면으로 제외
+
+# 긴 영상은 구간별로 나누어 여러 프로세스에서 디코딩 (워커마다 자체 VideoCapture 사용)
+FRAME_PARALLEL_ENABLED = True
+FRAME_PARALLEL_MIN_SECONDS = 60   # 이 길이(초) 이상인 영상만 병렬 처리
+FRAME_PARALLEL_WORKERS = None     # None이면 CPU 코어 수
+FRAME_JPEG_QUALITY = 90           # 워커 → 메인 프로세스 전달용 JPEG 품질
+
 # 최대 비디오 길이 (초)
 MAX_VIDEO_LENGTH = 300
 
+# 업로드 재사용: 같은 영상(내용 해시 기준)의 원격 파일을 재사용할지 여부
+UPLOAD_REUSE_ENABLED = True
+
+# 업로드 기록 파일 경로
+UPLOAD_REGISTRY_PATH = ".cache/uploads.json"
+
+# 보관할 원격 파일 최대 수 (초과 시 오래 사용하지 않은 파일부터 삭제)
+UPLOAD_REGISTRY_MAX_FILES = 20
+
+# 원격 파일 보관 기간 (초, File API 보관 기간 48시간보다 약간 짧게)
+# 서버가 만료 시각(expiration_time)을 알려주면 그 값을 우선 사용합니다
+UPLOAD_FILE_LIFETIME = 47 * 3600
+
+# 만료까지 남은 시간이 이보다 짧으면 재사용하지 않고 새로 업로드 (초)
+UPLOAD_REUSE_MARGIN = 600
+
+# 앱 업로드 영상 임시 파일 (청크 단위 저장, 세션 종료/교체 시 삭제)
+UPLOAD_TEMP_DIR = ".cache/uploads"
+UPLOAD_CHUNK_SIZE = 1024 * 1024       # 1MB
+UPLOAD_TEMP_MAX_AGE = 6 * 3600        # 서버 시작 시 이보다 오래된 임시 파일 삭제 (초)
+
+# 영상 작업 공간 (작업별 디렉토리 + 영상 ID별 공용 영상/정보 저장소)
+MEDIA_WORKSPACE_DIR = ".cache/media"
+MEDIA_WORKSPACE_MAX_BYTES = 2 * 1024 * 1024 * 1024   # 2GB, 초과 시 사용 중이 아닌 영상부터 LRU 삭제
+MEDIA_JOB_MAX_AGE = 6 * 3600                         # 서버 시작 시 이보다 오래된 작업 디렉토리 삭제 (초)
+MEDIA_DETACHED_MAX_JOBS = 32                         # release(경로)를 기다리는 작업 수 상한 (초과 시 가장 오래된 작업부터 종료)
+MEDIA_INFO_TTL = 24 * 3600                           # 저장된 영상 정보(제목/길이 등)를 재사용하는 기간 (초)
+MEDIA_STREAM_URL_MARGIN = 600                        # 저장된 스트림 URL은 만료까지 이 시간(초) 이상 남았을 때만 재사용
+
+# 업로드 전 ffmpeg 변환 (해상도/비트레이트/프레임 수 축소, MAX_VIDEO_LENGTH로 길이 제한)
+TRANSCODE_ENABLED = True
+TRANSCODE_MAX_HEIGHT = 360
+TRANSCODE_FPS = 1              # Gemini는 영상을 초당 1프레임으로 샘플링
+TRANSCODE_CRF = 30
+TRANSCODE_VIDEO_MAXRATE = "400k"
+TRANSCODE_VIDEO_BUFSIZE = "800k"
+TRANSCODE_AUDIO_BITRATE = "48k"
+
+# 변환 최대 소요 시간 (초, 초과 시 원본 업로드)
+TRANSCODE_TIMEOUT = 300
+
+# 영상 처리(PROCESSING) 상태 폴링 설정
+# 처음 POLL_FAST_COUNT회는 POLL_INITIAL_INTERVAL 간격으로 확인한 뒤 POLL_BACKOFF_FACTOR배씩 늘리며,
+# 간격 상한은 파일 크기(MB) × POLL_SECONDS_PER_MB (POLL_MIN_CAP ~ POLL_MAX_CAP 사이)입니다
+POLL_INITIAL_INTERVAL = 0.5
+POLL_FAST_COUNT = 4
+POLL_BACKOFF_FACTOR = 1.5
+POLL_SECONDS_PER_MB = 0.2
+POLL_MIN_CAP = 1.0
+POLL_MAX_CAP = 10.0
+
+# 영상 처리 최대 대기 시간 (초)
+PROCESSING_TIMEOUT = 600
+
+# 파일 크기별 처리 시간 기록 경로 (JSONL, 폴링 설정 튜닝용, None이면 기록하지 않음)
+PROCESSING_METRICS_PATH = ".cache/processing_metrics.jsonl"
+
 
 # ========================================
 # SNS 플랫폼 설정
@@ -89,18 +323,41 @@ PLATFORM_LIMITS = {
 
 SUPPORTED_LANGUAGES = ["kr", "en"]
 
-# 언어별 사이트명 매핑
-SITE_NAME_MAPPING = {
-    "텐아시아": {
-        "kr": "텐아시아",
-        "en": "TenAsia"
+
+# ========================================
+# 지원 언론사 설정 (site_registry.py)
+# ========================================
+
+# 키는 대표 도메인이며 하위 도메인(www., m. 등)도 같은 언론사로 인식합니다
+# - name: 한글 이름 (프롬프트와 결과의 출처 표기)
+# - name_en: 영문 이름
+# - hashtags: 출처 해시태그 ("#" 제외)
+# - parser: 기사 HTML 파서 (html_extractor.PARSER_TEMPLATES의 이름 또는
+#           {"title": [...], "body": [...], "byline": [...], "published": [...], "noise": [...]} 선택자 딕셔너리,
+#           없으면 Jina Reader로만 추출)
+# - rate_limit: 이 언론사 기사 요청의 분당 최대 수 (직접 요청과 Jina Reader 요청 모두, 캐시 사용 시 제외)
+# - aliases: 같은 언론사로 볼 추가 도메인
+SITES = {
+    "tenasia.co.kr": {
+        "name": "텐아시아",
+        "name_en": "TenAsia",
+        "hashtags": ["텐아시아", "TenAsia"],
+        "parser": "hankyung",
+        "rate_limit": 30,
+        "aliases": ["tenasia.hankyung.com"],
+    },
+    "hankyung.com": {
+        "name": "한국경제",
+        "name_en": "hankyung",
+        "hashtags": ["한국경제", "hankyung"],
+        "parser": "hankyung",
+        "rate_limit": 30,
     },
-    "한국경제": {
-        "kr": "한국경제",
-        "en": "hankyung"
-    }
 }
 
+# 추가 언론사 JSON 파일 (SITES와 같은 형식, 파일이 있으면 시작 시 함께 등록)
+SITE_REGISTRY_PATH = "sites.json"
+
 
 # ========================================
 # 품질 검증 설정
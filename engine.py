@@ -1,16 +1,99 @@
 import os
+import sys
 import json
 import time
+import hashlib
+import functools
+import itertools
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
 from dotenv import load_dotenv
 import config
+from json_stream import IncrementalJSONParser
+from result_cache import ResultCache, build_cache_key
+from rate_limiter import RATE_LIMITER, estimate_tokens, parse_retry_delay, response_token_count
+from retry_policy import RetryPolicy, RetryGiveUp, RETRYABLE_ERRORS
+from upload_registry import UPLOAD_REGISTRY
+from media_workspace import MEDIA_WORKSPACE
+from prompt_cache import PROMPT_CACHE, PromptCacheMiss, CACHED_CONTENT_ERRORS
+from token_budget import fit_article
+from site_registry import SITE_REGISTRY
 
 # Load environment variables
 load_dotenv()
 
-# Configure Gemini API
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+
+# ========================================
+# 지연 초기화 (import 시점 네트워크 호출 없음)
+# ========================================
+
+_configure_lock = threading.Lock()
+_is_configured = False
+
+_warm_up_lock = threading.Lock()
+_warm_up_future = None
+
+
+def ensure_configured():
+    """
+    Gemini API 설정을 최초 사용 시점에 한 번만 수행합니다.
+
+    import 시점에는 어떤 설정/네트워크 호출도 하지 않으므로,
+    Streamlit 콜드 스타트나 오프라인 환경에서도 engine을 바로 import할 수 있습니다.
+    """
+    global _is_configured
+
+    if _is_configured:
+        return
+
+    with _configure_lock:
+        if not _is_configured:
+            genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+            _is_configured = True
+
+
+def warm_up_engine(background: bool = True) -> Future:
+    """
+    모델 카탈로그를 미리 조회하여 첫 생성 요청의 대기 시간을 없앱니다.
+
+    여러 번 호출해도 워밍업은 한 번만 실행되며 (Streamlit rerun 대응),
+    background=True면 즉시 반환하고 별도 스레드에서 조회합니다.
+
+    Args:
+        background: True면 백그라운드 스레드에서 실행 (기본값: True)
+
+    Returns:
+        사용 가능한 모델 리스트로 완료되는 Future
+    """
+    global _warm_up_future
+
+    with _warm_up_lock:
+        if _warm_up_future is not None:
+            return _warm_up_future
+        _warm_up_future = Future()
+        future = _warm_up_future
+
+    def worker():
+        try:
+            print("\n🚀 Global Viralizer Engine 시작")
+            # 프롬프트 템플릿을 미리 렌더링해 첫 요청의 프롬프트 조립 시간을 없앰
+            PromptBuilder.precompile()
+            PromptBuilder.template_version()
+            future.set_result(MODEL_CATALOG.get_models())
+        except Exception as e:
+            print(f"⚠️  엔진 워밍업 실패: {str(e)}")
+            future.set_exception(e)
+
+    if background:
+        threading.Thread(target=worker, name="engine-warm-up", daemon=True).start()
+    else:
+        worker()
+
+    return future
 
 
 # ========================================
@@ -25,6 +108,8 @@ def list_available_models():
         사용 가능한 모델 이름 리스트
     """
     try:
+        ensure_configured()
+
         models = genai.list_models()
         available = []
 
@@ -62,9 +147,9 @@ def get_best_available_model(preferred_model, fallback_keywords=['flash', 'pro']
     Returns:
         tuple: (선택된 모델 이름, 선택 이유)
     """
-    # 사용 가능한 모델 목록 가져오기
+    # 사용 가능한 모델 목록 가져오기 (프로세스 캐시 사용)
     if available_models is None:
-        available_models = list_available_models()
+        available_models = MODEL_CATALOG.get_models()
 
     if not available_models:
         return None, "사용 가능한 모델이 없습니다"
@@ -106,9 +191,182 @@ def get_best_available_model(preferred_model, fallback_keywords=['flash', 'pro']
     return first_model, "첫 번째 사용 가능 모델"
 
 
-# 앱 시작 시 모델 목록 진단 실행
-print("\n🚀 Global Viralizer Engine 시작")
-AVAILABLE_MODELS = list_available_models()
+class ModelCatalog:
+    """
+    사용 가능한 모델 목록을 프로세스 단위로 캐시하는 카탈로그
+
+    - TTL 이내: 캐시된 목록을 네트워크 호출 없이 즉시 반환
+    - TTL 경과 후 stale 허용 구간: 캐시된 목록을 반환하고 백그라운드에서 갱신
+      (stale-while-revalidate)
+    - 캐시가 없거나 stale 허용 구간도 지난 경우: 동기적으로 다시 조회
+
+    선호 모델 → 실제 선택된 변형 모델 매핑도 함께 메모이즈하므로,
+    생성 요청의 hot path에서는 모델 선택 비용이 들지 않습니다.
+    """
+
+    def __init__(self, ttl: float = None, stale_ttl: float = None, fetcher=None):
+        """
+        Args:
+            ttl: 캐시 유지 시간 (초, 기본값: config.MODEL_CATALOG_TTL)
+            stale_ttl: TTL 경과 후 stale 캐시를 허용하는 시간 (초, 기본값: config.MODEL_CATALOG_STALE_TTL)
+            fetcher: 모델 목록 조회 함수 (기본값: list_available_models)
+        """
+        self.ttl = config.MODEL_CATALOG_TTL if ttl is None else ttl
+        self.stale_ttl = config.MODEL_CATALOG_STALE_TTL if stale_ttl is None else stale_ttl
+        self._fetcher = fetcher or list_available_models
+        self._lock = threading.Lock()
+        self._models = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._resolved = {}
+
+    def get_models(self, force_refresh: bool = False) -> list:
+        """
+        사용 가능한 모델 목록을 반환합니다.
+
+        Args:
+            force_refresh: True면 캐시를 무시하고 즉시 다시 조회
+
+        Returns:
+            사용 가능한 모델 이름 리스트 (조회 실패 시 빈 리스트)
+        """
+        with self._lock:
+            models = self._models
+            age = time.monotonic() - self._fetched_at
+
+        if models is not None and not force_refresh:
+            if age < self.ttl:
+                return models
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background()
+                return models
+
+        return self.refresh()
+
+    def refresh(self) -> list:
+        """
+        모델 목록을 동기적으로 다시 조회하여 캐시를 갱신합니다.
+        조회에 실패하면 기존 캐시를 유지합니다.
+
+        Returns:
+            갱신된 (또는 기존) 모델 이름 리스트
+        """
+        models = self._fetcher()
+
+        with self._lock:
+            if models:
+                # 목록이 바뀌면 이전 선택 결과는 더 이상 유효하지 않음
+                if models != self._models:
+                    self._resolved.clear()
+                self._models = models
+                self._fetched_at = time.monotonic()
+            return self._models or []
+
+    def _refresh_in_background(self):
+        """백그라운드 스레드에서 목록을 갱신합니다 (동시에 하나만 실행)."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def worker():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️  모델 목록 백그라운드 갱신 실패: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=worker, name="model-catalog-refresh", daemon=True).start()
+
+    def resolve(self, preferred_model: str, fallback_keywords=['flash', 'pro']):
+        """
+        선호 모델에 대한 최적 모델을 선택하고 결과를 메모이즈합니다.
+
+        Args:
+            preferred_model: 선호하는 모델 이름
+            fallback_keywords: fallback 시 검색할 키워드 리스트
+
+        Returns:
+            tuple: (선택된 모델 이름, 선택 이유)
+        """
+        key = (preferred_model, tuple(fallback_keywords))
+
+        with self._lock:
+            cached = self._resolved.get(key)
+
+        if cached:
+            # TTL이 지났으면 목록 갱신을 시작 (stale 구간은 백그라운드, 만료 후는 동기)
+            # 갱신된 목록이 달라지면 refresh()가 선택 결과를 비우므로 그때만 다시 선택
+            self.get_models()
+            with self._lock:
+                if self._resolved.get(key) is cached:
+                    return cached
+
+        result = get_best_available_model(
+            preferred_model,
+            fallback_keywords=fallback_keywords,
+            available_models=self.get_models()
+        )
+
+        # 모델을 찾지 못한 결과는 캐시하지 않음 (다음 요청에서 재시도)
+        if result[0]:
+            with self._lock:
+                self._resolved[key] = result
+
+        return result
+
+    def invalidate(self):
+        """캐시된 목록과 모델 선택 결과를 모두 무효화합니다."""
+        with self._lock:
+            self._models = None
+            self._fetched_at = 0.0
+            self._resolved.clear()
+
+
+# 프로세스 전역 모델 카탈로그 (최초 사용 시 조회)
+MODEL_CATALOG = ModelCatalog()
+
+
+def resolve_model(preferred_model: str, fallback_keywords=['flash', 'pro']):
+    """
+    모델 카탈로그에서 최적 모델을 선택하고, 없으면 안내 에러를 발생시킵니다.
+
+    Args:
+        preferred_model: 선호하는 모델 이름
+        fallback_keywords: fallback 시 검색할 키워드 리스트
+
+    Returns:
+        tuple: (선택된 모델 이름, 선택 이유)
+
+    Raises:
+        Exception: 사용 가능한 모델이 전혀 없는 경우
+    """
+    model_name, selection_reason = MODEL_CATALOG.resolve(preferred_model, fallback_keywords)
+
+    if not model_name:
+        raise Exception(
+            "❌ 사용 가능한 Gemini 모델을 찾을 수 없습니다.\n\n"
+            "💡 해결 방법:\n"
+            "1. API 키가 올바르게 설정되었는지 확인\n"
+            "2. API 키에 Gemini API 접근 권한이 있는지 확인\n"
+            "3. https://makersuite.google.com/app/apikey 에서 키 확인"
+        )
+
+    return model_name, selection_reason
+
+
+def __getattr__(name):
+    """
+    하위 호환용 모듈 속성
+
+    engine.AVAILABLE_MODELS는 더 이상 import 시점에 조회되지 않고,
+    접근 시점에 모델 카탈로그에서 가져옵니다.
+    """
+    if name == "AVAILABLE_MODELS":
+        return MODEL_CATALOG.get_models()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # JSON 스키마 정의
 RESPONSE_SCHEMA = {
@@ -237,6 +495,91 @@ RESPONSE_SCHEMA = {
     "required": ["kr", "en", "review_score", "viral_analysis", "key_takeaway"]
 }
 
+# 언어 코드 (RESPONSE_SCHEMA 키) → 언어 이름
+LANGUAGE_NAMES = {
+    "kr": "한국어(Korean)",
+    "en": "영어(English)"
+}
+
+# 안전 설정 (모든 생성 요청 공통)
+SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+
+def build_generation_config(response_schema: dict = None, max_output_tokens: int = 8192) -> dict:
+    """
+    JSON 응답을 강제하는 생성 설정을 만듭니다.
+
+    Args:
+        response_schema: 응답 JSON 스키마 (기본값: RESPONSE_SCHEMA)
+        max_output_tokens: 최대 출력 토큰 수 (기본값: 8192)
+
+    Returns:
+        genai.GenerativeModel에 전달할 generation_config 딕셔너리
+    """
+    return {
+        "temperature": 0.9,
+        "top_p": 0.95,
+        "top_k": 40,
+        "max_output_tokens": max_output_tokens,
+        "response_mime_type": "application/json",
+        "response_schema": response_schema or RESPONSE_SCHEMA,
+    }
+
+
+def build_language_schema(language: str) -> dict:
+    """
+    RESPONSE_SCHEMA에서 한 언어에 해당하는 부분만 잘라낸 스키마를 만듭니다.
+    병렬 생성 모드에서 언어별 요청의 응답 스키마로 사용됩니다.
+
+    Args:
+        language: 언어 코드 ("kr" 또는 "en")
+
+    Returns:
+        {"posts", "review_score", "viral_analysis", "key_takeaway"} 구조의 JSON 스키마
+    """
+    properties = RESPONSE_SCHEMA["properties"]
+
+    return {
+        "type": "object",
+        "properties": {
+            "posts": properties[language],
+            "review_score": properties["review_score"]["properties"][language],
+            "viral_analysis": properties["viral_analysis"]["properties"][language],
+            "key_takeaway": properties["key_takeaway"]["properties"][language],
+        },
+        "required": ["posts", "review_score", "viral_analysis", "key_takeaway"]
+    }
+
+
+def merge_language_results(slices: dict) -> dict:
+    """
+    언어별 생성 결과를 RESPONSE_SCHEMA 구조로 병합합니다.
+
+    Args:
+        slices: {언어 코드: build_language_schema 구조의 결과} 딕셔너리
+
+    Returns:
+        RESPONSE_SCHEMA를 준수하는 딕셔너리
+    """
+    result = {
+        "review_score": {},
+        "viral_analysis": {},
+        "key_takeaway": {}
+    }
+
+    for language, data in slices.items():
+        result[language] = data["posts"]
+        result["review_score"][language] = data["review_score"]
+        result["viral_analysis"][language] = data["viral_analysis"]
+        result["key_takeaway"][language] = data["key_takeaway"]
+
+    return result
+
 
 # ========================================
 # PromptBuilder 클래스 (관심사 분리)
@@ -253,6 +596,17 @@ class PromptBuilder:
     를 독립적으로 조립합니다.
     """
 
+    # 프롬프트 템플릿 버전 (템플릿 구조를 바꾸면 올림)
+    # 결과/프롬프트 캐시 키에는 템플릿 내용 해시가 붙은 template_version()을 사용하므로
+    # 공통 가이드라인, 기사/영상 요청 부분, 언어 지시문, 언론사별 해시태그 문구만 수정한 경우에도
+    # 기존 캐시가 자동으로 무효화됩니다 (_template_version_hash 참고)
+    TEMPLATE_VERSION = "1"
+
+    # 지원하는 콘텐츠 스타일, 분량 모드, 콘텐츠 종류 (precompile 대상)
+    CONTENT_STYLES = ("심층/분석", "감성/팬덤", "위트/밈", "심플/속보")
+    TONE_MODES = ("compact", "rich")
+    CONTENT_TYPES = ("기사", "영상")
+
     def __init__(self, site_name: str, tone_mode: str = "rich", content_style: str = "심층/분석"):
         """
         Args:
@@ -263,15 +617,11 @@ class PromptBuilder:
         self.site_name = site_name
         self.tone_mode = tone_mode.lower()
         self.content_style = content_style
-        self.site_name_en = self._get_site_name_en()
+        self.site_name_en = SITE_REGISTRY.english_name(site_name)
 
-    def _get_site_name_en(self) -> str:
-        """사이트명 영문 매핑"""
-        mapping = {
-            "텐아시아": "TenAsia",
-            "한국경제": "hankyung"
-        }
-        return mapping.get(self.site_name, self.site_name)
+        # 등록된 언론사면 출처 해시태그를 Instagram 해시태그에 포함하도록 지시
+        site = SITE_REGISTRY.by_name(site_name)
+        self.hashtag_note = f", 출처 태그 {site.hashtag_text()} 포함" if site else ""
 
     def _get_style_persona(self) -> str:
         """
@@ -489,7 +839,53 @@ class PromptBuilder:
 
         return guides.get(self.content_style, guides["심층/분석"])
 
+    @classmethod
+    def precompile(cls, site_names=None) -> int:
+        """
+        사이트 × 분량 모드 × 스타일 × 콘텐츠 종류의 공통 가이드라인을 미리 만들어 둡니다.
+
+        Args:
+            site_names: 대상 사이트 이름 목록 (기본값: SITE_REGISTRY에 등록된 언론사)
+
+        Returns:
+            준비된 조합 수
+        """
+        if site_names is None:
+            site_names = SITE_REGISTRY.names()
+
+        count = 0
+        for site_name in site_names:
+            for tone_mode in cls.TONE_MODES:
+                for content_style in cls.CONTENT_STYLES:
+                    for content_type in cls.CONTENT_TYPES:
+                        _compiled_guidelines(site_name, tone_mode, content_style, content_type)
+                        count += 1
+
+        return count
+
+    @classmethod
+    def template_version(cls) -> str:
+        """
+        템플릿 버전과 템플릿 내용 해시를 합친 문자열 (예: "1-3f2a9c0d1e4b")
+
+        모든 스타일 × 분량 모드 × 콘텐츠 종류 조합의 공통 가이드라인과 요청별 템플릿,
+        등록된 언론사별 문구를 한 번 렌더링해 계산합니다.
+        """
+        return _template_version_hash(cls.TEMPLATE_VERSION)
+
     def build_common_guidelines(self, content_type: str) -> str:
+        """
+        공통 가이드라인 (조합별로 한 번만 렌더링한 결과를 재사용)
+
+        Args:
+            content_type: "기사" 또는 "영상"
+
+        Returns:
+            공통 가이드라인 문자열
+        """
+        return _compiled_guidelines(self.site_name, self.tone_mode, self.content_style, content_type)[0]
+
+    def _render_common_guidelines(self, content_type: str) -> str:
         """
         공통 가이드라인 생성 (JSON 규격, 바이럴 점수, 플랫폼별 상세)
 
@@ -663,7 +1059,7 @@ class PromptBuilder:
   * "rent-free in my head" (머릿속에서 떠나지 않음)
   * "living for this" (이거 정말 좋아)
 
-- **해시태그**: 10개 (관련도 높은 순)
+- **해시태그**: 10개 (관련도 높은 순{self.hashtag_note})
 
 - **예시 구조**:
   ```
@@ -681,7 +1077,7 @@ class PromptBuilder:
 - **구조**: 오프닝 → 전개 → 마무리
 - **어휘**: 고급스럽고 감성적
 - **톤**: 따뜻하고 깊이 있는
-- **해시태그**: 10개
+- **해시태그**: 10개 (관련도 높은 순{self.hashtag_note})
 
 ### 🧵 Threads - Conversational & Engaging
 **목표**: 자연스러운 대화, 커뮤니티 참여 유도
@@ -742,16 +1138,55 @@ class PromptBuilder:
         Returns:
             기사 분석 프롬프트
         """
-        common = self.build_common_guidelines("기사")
+        prefix = _compiled_guidelines(self.site_name, self.tone_mode, self.content_style, "기사")[1]
 
-        article_info = f"""
+        return prefix + self.build_article_delta(article_text, article_title)
+
+    def build_article_delta(self, article_text: str, article_title: str) -> str:
+        """
+        기사 프롬프트 중 요청마다 바뀌는 부분 (공통 가이드라인 제외)
+
+        공통 가이드라인이 프롬프트 캐시(PROMPT_CACHE)에 등록되어 있으면 이 부분만 전송합니다.
+
+        Args:
+            article_text: 기사 본문
+            article_title: 기사 제목
+
+        Returns:
+            기사 정보 문자열
+        """
+        return f"""
 기사 제목: {article_title}
 
 기사 내용:
 {article_text}
 """
 
-        return common + "\n\n" + article_info
+    def build_language_directive(self, language: str) -> str:
+        """
+        병렬 생성 모드에서 한 언어만 생성하도록 범위를 제한하는 지시문
+
+        Args:
+            language: 언어 코드 ("kr" 또는 "en")
+
+        Returns:
+            프롬프트 끝에 덧붙일 지시문
+        """
+        language_name = LANGUAGE_NAMES[language]
+
+        return f"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+## 🎯 이번 요청의 생성 범위 (최우선 적용)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+위 가이드라인 중 **{language_name}** 부분만 적용하여 3개 플랫폼(X, Instagram, Threads)의 {language_name} 게시물 3개만 생성하세요.
+다른 언어의 게시물은 별도 요청에서 독립적으로 생성되므로 작성하지 마세요.
+
+- posts: {language_name} 게시물 (x, insta, threads)
+- review_score: 각 게시물의 완성도 점수 (1-10)
+- viral_analysis: 각 게시물의 바이럴 점수 (1-100)와 근거 한 문장
+- key_takeaway: {language_name} 핵심 요약 한 문장
+"""
 
     def build_video_prompt(self, video_metadata: str, video_title: str) -> str:
         """
@@ -764,7 +1199,7 @@ class PromptBuilder:
         Returns:
             영상 분석 프롬프트
         """
-        common = self.build_common_guidelines("영상")
+        prefix = _compiled_guidelines(self.site_name, self.tone_mode, self.content_style, "영상")[1]
 
         video_info = f"""
 영상 제목: {video_title}
@@ -784,244 +1219,498 @@ class PromptBuilder:
 ✓ **비주얼 반영**: 영상의 비주얼 요소(색감, 분위기, 액션)를 게시물에 반영했는가?
 """
 
-        return common + "\n\n" + video_info
+        return prefix + video_info
 
 
-def safe_generate_content(model, prompt, max_retries=None, progress_callback=None):
+@functools.lru_cache(maxsize=512)
+def _compiled_guidelines(site_name: str, tone_mode: str, content_style: str, content_type: str) -> tuple:
     """
-    안정적인 콘텐츠 생성 래퍼 함수
-
-    500 서버 에러, 429 쿼터 에러, 503 서비스 불가 에러 발생 시
-    Exponential Backoff 방식으로 재시도합니다.
-
-    Args:
-        model: genai.GenerativeModel 인스턴스
-        prompt: 생성할 프롬프트
-        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
-        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+    조합별 공통 가이드라인을 한 번만 렌더링합니다.
 
     Returns:
-        생성된 응답
+        (공통 가이드라인, 공통 가이드라인 + 구분자) - 요청별 프롬프트는 두 번째 값에 한 번만 이어 붙임
+    """
+    guidelines = PromptBuilder(site_name, tone_mode, content_style)._render_common_guidelines(content_type)
+    return sys.intern(guidelines), sys.intern(guidelines + "\n\n")
 
-    Raises:
-        마지막 시도에서 발생한 예외
+
+@functools.lru_cache(maxsize=None)
+def _template_version_hash(template_version: str) -> str:
     """
-    if max_retries is None:
-        max_retries = config.MAX_RETRIES
+    템플릿 버전 + 프롬프트를 이루는 모든 템플릿의 렌더링 결과 해시
 
-    last_exception = None
+    - 모든 조합의 공통 가이드라인 (사이트 이름은 자리표시자)
+    - 조합별 요청 부분: 기사 정보(build_article_delta), 영상 프롬프트(build_video_prompt),
+      병렬 생성 언어 지시문(build_language_directive)
+    - 등록된 언론사별 문구 (영문 이름, 출처 해시태그)
+    """
+    digest = hashlib.sha256(template_version.encode("utf-8"))
 
-    for attempt in range(max_retries):
-        try:
-            # API 호출
-            response = model.generate_content(prompt)
+    for tone_mode in PromptBuilder.TONE_MODES:
+        for content_style in PromptBuilder.CONTENT_STYLES:
+            builder = PromptBuilder("{site_name}", tone_mode, content_style)
+            for content_type in PromptBuilder.CONTENT_TYPES:
+                digest.update(builder._render_common_guidelines(content_type).encode("utf-8"))
+            digest.update(builder.build_article_delta("{article_text}", "{article_title}").encode("utf-8"))
+            digest.update(builder.build_video_prompt("{video_metadata}", "{video_title}").encode("utf-8"))
+            for language in LANGUAGE_NAMES:
+                digest.update(builder.build_language_directive(language).encode("utf-8"))
 
-            # 응답 유효성 검증
-            if not response or not response.text:
-                raise Exception("Empty response from API")
+    for site in SITE_REGISTRY.sites():
+        builder = PromptBuilder(site.name)
+        digest.update(f"{site.name}\0{builder.site_name_en}\0{builder.hashtag_note}".encode("utf-8"))
 
-            return response
+    return f"{template_version}-{digest.hexdigest()[:12]}"
 
-        except (google_exceptions.InternalServerError,      # 500 에러
-                google_exceptions.ResourceExhausted,        # 429 쿼터 에러
-                google_exceptions.ServiceUnavailable,       # 503 에러
-                google_exceptions.DeadlineExceeded) as e:   # 타임아웃 에러
 
-            last_exception = e
-            error_type = type(e).__name__
+def build_article_model(model_name: str, builder: PromptBuilder, article_text: str, article_title: str, use_cache: bool = True):
+    """
+    기사 생성용 모델과 요청 내용을 만듭니다.
 
-            # 마지막 시도인 경우 예외 발생
-            if attempt == max_retries - 1:
-                raise Exception(f"API 호출 실패 (재시도 {max_retries}회 모두 실패): {error_type} - {str(e)}")
-
-            # 지수 백오프: BASE_WAIT_TIME * (2 ** attempt)
-            # 1차: 2초, 2차: 4초, 3차: 8초
-            wait_time = config.BASE_WAIT_TIME * (2 ** attempt)
-
-            # 429 에러(쿼터 초과)의 경우 더 긴 대기
-            if isinstance(e, google_exceptions.ResourceExhausted):
-                wait_time = wait_time * 2  # 2배 더 대기
-
-            # 진행 상황 콜백 호출
-            if progress_callback:
-                progress_callback(
-                    attempt=attempt + 1,
-                    max_retries=max_retries,
-                    wait_time=wait_time,
-                    error=f"{error_type}: {str(e)}"
-                )
-
-            # 대기
-            time.sleep(wait_time)
-
-        except google_exceptions.NotFound as e:
-            # 404 NotFound 에러 (모델을 찾을 수 없음)
-            error_msg = str(e)
-            model_name = "알 수 없음"
-
-            if "models/" in error_msg:
-                try:
-                    model_name = error_msg.split("models/")[1].split(" ")[0]
-                except:
-                    pass
+    공통 가이드라인이 프롬프트 캐시에 등록되어 있으면 캐시를 사용하는 모델과 기사 부분만 반환하고,
+    그렇지 않으면 일반 모델과 전체 프롬프트를 반환합니다.
 
-            # 사용 가능한 모델 목록 가져오기
-            available = list_available_models() if not AVAILABLE_MODELS else AVAILABLE_MODELS
+    Args:
+        model_name: 생성에 사용할 모델 이름
+        builder: PromptBuilder 인스턴스
+        article_text: 기사 본문
+        article_title: 기사 제목
+        use_cache: False면 프롬프트 캐시를 사용하지 않음 (PromptCacheMiss 후 재요청)
 
-            raise Exception(
-                f"❌ 모델을 찾을 수 없습니다: {model_name}\n\n"
-                f"📋 현재 사용 가능한 모델 목록:\n" +
-                "\n".join(f"  ✅ {m}" for m in available[:10]) +
-                (f"\n  ... 외 {len(available)-10}개" if len(available) > 10 else "") +
-                f"\n\n💡 해결 방법:\n"
-                f"1. 위 목록의 모델 중 하나를 config.py에 설정하세요\n"
-                f"2. 자동 모델 선택 로직이 작동하지 않았습니다\n"
-                f"3. API 키 권한을 확인하세요"
-            )
+    Returns:
+        (genai.GenerativeModel, 요청 프롬프트)
+    """
+    cached = PROMPT_CACHE.get(model_name, builder, "기사") if use_cache else None
 
-        except Exception as e:
-            # 재시도 불가능한 에러는 즉시 발생
-            raise Exception(f"재시도 불가능한 에러: {type(e).__name__} - {str(e)}")
+    if cached is not None:
+        model = genai.GenerativeModel.from_cached_content(
+            cached,
+            safety_settings=SAFETY_SETTINGS,
+            generation_config=build_generation_config()
+        )
+        return model, builder.build_article_delta(article_text, article_title)
 
-    # 여기 도달하면 안 되지만, 안전을 위해
-    if last_exception:
-        raise last_exception
+    model = genai.GenerativeModel(
+        model_name,
+        safety_settings=SAFETY_SETTINGS,
+        generation_config=build_generation_config()
+    )
+    return model, builder.build_article_prompt(article_text, article_title)
 
 
-def retry_with_exponential_backoff(func, max_retries=None, progress_callback=None):
+def prompt_cache_miss(model, error: Exception):
     """
-    지수 백오프(Exponential Backoff) 방식으로 함수 실행을 재시도합니다.
+    프롬프트 캐시를 사용하는 모델의 NotFound/PermissionDenied 에러를 PromptCacheMiss로 변환합니다.
 
     Args:
-        func: 실행할 함수
-        max_retries: 최대 재시도 횟수 (기본값: 3)
-        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+        model: genai.GenerativeModel 인스턴스
+        error: 생성 요청에서 발생한 에러
 
     Returns:
-        함수 실행 결과
-
-    Raises:
-        마지막 시도에서 발생한 예외
+        PromptCacheMiss 또는 None (캐시와 무관한 에러)
     """
-    last_exception = None
+    if isinstance(error, CACHED_CONTENT_ERRORS) and getattr(model, "cached_content", None):
+        return PromptCacheMiss(f"프롬프트 캐시를 사용할 수 없음 ({model.cached_content}): {type(error).__name__} - {str(error)}")
+    return None
 
-    for attempt in range(max_retries):
-        try:
-            return func()
-        except (google_exceptions.InternalServerError,
-                google_exceptions.ResourceExhausted,
-                google_exceptions.ServiceUnavailable) as e:
-            last_exception = e
 
-            # 마지막 시도인 경우 예외 발생
-            if attempt == max_retries - 1:
-                raise
+def invalidate_article_prompt_cache(model_name: str, builder: PromptBuilder, error: PromptCacheMiss):
+    """서버에서 사라진 기사 프롬프트 캐시 기록을 지웁니다 (이후 전체 프롬프트로 재요청)."""
+    print(f"⚠️  {error} → 캐시 없이 다시 요청")
+    PROMPT_CACHE.invalidate(PROMPT_CACHE.key_for(model_name, builder, "기사"))
+
 
-            # 지수 백오프: 2^attempt 초 대기 (1차: 2초, 2차: 4초, 3차: 8초)
-            wait_time = 2 ** (attempt + 1)
+def generate_article_response(model_name: str, builder: PromptBuilder, article_text: str, article_title: str, max_retries=None, progress_callback=None):
+    """
+    build_article_model + safe_generate_content
 
-            # 진행 상황 콜백 호출
-            if progress_callback:
-                progress_callback(
-                    attempt=attempt + 1,
-                    max_retries=max_retries,
-                    wait_time=wait_time,
-                    error=str(e)
-                )
+    프롬프트 캐시의 cached content가 서버에서 사라졌으면(PromptCacheMiss) 캐시 기록을 지우고
+    전체 프롬프트로 한 번 다시 요청합니다.
 
-            time.sleep(wait_time)
-        except Exception as e:
-            # 재시도 불가능한 에러는 즉시 발생
-            raise
+    Returns:
+        생성된 응답
+    """
+    model, request_prompt = build_article_model(model_name, builder, article_text, article_title)
+
+    try:
+        return safe_generate_content(model, request_prompt, max_retries=max_retries, progress_callback=progress_callback)
+    except PromptCacheMiss as e:
+        invalidate_article_prompt_cache(model_name, builder, e)
 
-    # 여기 도달하면 안 되지만, 안전을 위해
-    if last_exception:
-        raise last_exception
+    model, request_prompt = build_article_model(model_name, builder, article_text, article_title, use_cache=False)
+    return safe_generate_content(model, request_prompt, max_retries=max_retries, progress_callback=progress_callback)
 
 
-def generate_sns_posts_streaming(article_text: str, article_title: str = "", site_name: str = "해당 매체", video_path=None):
+def build_model_not_found_error(error: Exception) -> Exception:
     """
-    한국어 기사 또는 YouTube 영상을 받아 English와 Korean 버전의 SNS 게시물을 스트리밍 방식으로 생성합니다.
-    단 한 번의 API 호출로 모든 플랫폼/언어 조합의 게시물을 JSON 형식으로 받아옵니다.
+    404 NotFound 에러를 사용 가능한 모델 목록이 포함된 안내 에러로 변환합니다.
+    잘못된 모델 선택 결과가 재사용되지 않도록 모델 카탈로그도 무효화합니다.
 
     Args:
-        article_text: 한국어 기사 내용
-        article_title: 한국어 기사 제목 (선택)
-        site_name: 출처 사이트 이름 (선택, 기본값: "해당 매체")
-        video_path: YouTube 영상 파일 경로 (선택, 제공 시 Google AI에 업로드됨)
+        error: google_exceptions.NotFound 예외
 
-    Yields:
-        각 플랫폼/언어별 결과를 담은 딕셔너리
-        {"platform": "x", "language": "english", "status": "completed", "content": "..."}
+    Returns:
+        사용자 안내 메시지를 담은 Exception
     """
-    try:
-        # 변수 초기화 (NameError 방지)
-        video_frames = None  # 레거시 호환성
+    error_msg = str(error)
+    model_name = "알 수 없음"
 
-        # 모드 판별 플래그
-        import os
-        is_video_mode = video_path is not None and os.path.exists(video_path)
+    if "models/" in error_msg:
+        try:
+            model_name = error_msg.split("models/")[1].split(" ")[0]
+        except:
+            pass
 
-        print(f"\n{'='*70}")
-        print(f"🎯 분석 모드: {'YouTube 영상 전체 분석' if is_video_mode else '텍스트 기사 분석'}")
-        print(f"{'='*70}")
+    # 잘못된 모델 선택 결과가 재사용되지 않도록 캐시 무효화 후 다시 조회
+    MODEL_CATALOG.invalidate()
+    available = MODEL_CATALOG.get_models()
 
-        # 안전 설정 및 생성 설정
-        safety_settings = [
-            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-        ]
+    return Exception(
+        f"❌ 모델을 찾을 수 없습니다: {model_name}\n\n"
+        f"📋 현재 사용 가능한 모델 목록:\n" +
+        "\n".join(f"  ✅ {m}" for m in available[:10]) +
+        (f"\n  ... 외 {len(available)-10}개" if len(available) > 10 else "") +
+        f"\n\n💡 해결 방법:\n"
+        f"1. 위 목록의 모델 중 하나를 config.py에 설정하세요\n"
+        f"2. 자동 모델 선택 로직이 작동하지 않았습니다\n"
+        f"3. API 키 권한을 확인하세요"
+    )
 
-        generation_config = {
-            "temperature": 0.9,
-            "top_p": 0.95,
-            "top_k": 40,
-            "max_output_tokens": 8192,  # Instagram 긴 게시물 대응 (4096 → 8192)
-            "response_mime_type": "application/json",  # JSON 응답 강제
-            "response_schema": RESPONSE_SCHEMA,  # JSON 스키마 정의
-        }
 
-        # 영상 파일 업로드 및 처리 대기
-        uploaded_video_file = None
-        if is_video_mode:
-            try:
-                import time
-                import os
+# 모든 Gemini 호출 지점이 공유하는 재시도 정책 (Full Jitter, 마감 시간, 재시도 예산, 서킷 브레이커)
+GEMINI_RETRY_POLICY = RetryPolicy()
 
-                print(f"\n{'='*70}")
-                print(f"📤 Google AI 서버에 영상 업로드 중...")
-                print(f"   파일: {video_path}")
-                print(f"   크기: {os.path.getsize(video_path) / (1024*1024):.2f} MB")
-                print(f"{'='*70}")
-
-                # Google AI에 파일 업로드
-                uploaded_video_file = genai.upload_file(path=video_path)
-                print(f"✅ 업로드 완료!")
-                print(f"   파일 이름: {uploaded_video_file.name}")
-                print(f"   URI: {uploaded_video_file.uri}")
-
-                # 영상 처리 완료 대기 (ACTIVE 상태까지)
-                print(f"\n⏳ 영상 처리 중...")
-                while uploaded_video_file.state.name == "PROCESSING":
-                    print(f"   상태: {uploaded_video_file.state.name} - 대기 중...", end="\r")
-                    time.sleep(2)
-                    uploaded_video_file = genai.get_file(uploaded_video_file.name)
-
-                if uploaded_video_file.state.name == "FAILED":
-                    raise Exception(f"영상 처리 실패: {uploaded_video_file.state.name}")
-
-                print(f"✅ 영상 처리 완료! 상태: {uploaded_video_file.state.name}")
-                print(f"{'='*70}\n")
+
+def get_retry_metrics() -> dict:
+    """
+    Gemini 호출 재시도 지표를 반환합니다.
+
+    Returns:
+        RetryMetrics.snapshot() 결과 (재시도 횟수, 백오프 소요 시간, 에러 종류별 횟수, 포기 사유)
+    """
+    return GEMINI_RETRY_POLICY.metrics.snapshot()
+
+
+def get_quota_wait_time(model, error: Exception, backoff_time: float) -> float:
+    """
+    429(ResourceExhausted) 에러 후 대기 시간을 결정하고 요청 제한기에 알립니다.
+
+    서버가 재시도 지연 힌트를 보냈으면 그 값을, 없으면 지수 백오프의 2배를 사용합니다.
+    같은 모델을 사용하는 다른 요청도 이 시간 동안 함께 대기하여,
+    여러 작업이 동시에 429를 받고 동시에 재시도하는 상황을 막습니다.
+
+    Args:
+        model: genai.GenerativeModel 인스턴스
+        error: ResourceExhausted 예외
+        backoff_time: 지수 백오프로 계산한 대기 시간 (초)
+
+    Returns:
+        대기 시간 (초)
+    """
+    retry_delay = parse_retry_delay(error)
+    wait_time = retry_delay if retry_delay is not None else backoff_time * 2
+
+    RATE_LIMITER.penalize(model, wait_time)
+    return wait_time
+
+
+def build_delay_hook(model):
+    """재시도 정책에 전달할 대기 시간 조정 함수 (429 에러만 get_quota_wait_time 적용)"""
+    def delay_hook(error, wait_time):
+        if isinstance(error, google_exceptions.ResourceExhausted):
+            return get_quota_wait_time(model, error, wait_time)
+        return wait_time
+
+    return delay_hook
+
+
+def build_request_options(timeout: float) -> dict:
+    """남은 마감 시간을 API 요청 타임아웃으로 변환합니다 (API_TIMEOUT 이하, 최소 1초)."""
+    return {"timeout": max(1.0, min(config.API_TIMEOUT, timeout))}
+
+
+def safe_generate_content(model, prompt, max_retries=None, progress_callback=None):
+    """
+    안정적인 콘텐츠 생성 래퍼 함수
+
+    500 서버 에러, 429 쿼터 에러, 503 서비스 불가 에러, 타임아웃 발생 시
+    GEMINI_RETRY_POLICY(Full Jitter 백오프, 마감 시간, 재시도 예산, 서킷 브레이커)로 재시도합니다.
+
+    Args:
+        model: genai.GenerativeModel 인스턴스
+        prompt: 생성할 프롬프트
+        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
+        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+
+    Returns:
+        생성된 응답
+
+    Raises:
+        RetryGiveUp: 재시도 가능한 에러로 최종 실패한 경우
+        Exception: 재시도 불가능한 에러
+    """
+    estimated_tokens = estimate_tokens(prompt)
+
+    def call(timeout):
+        # 모델별 RPM/TPM 한도 내에서 호출 (우선순위 공정 큐)
+        RATE_LIMITER.acquire(model, estimated_tokens)
+
+        # API 호출
+        response = model.generate_content(prompt, request_options=build_request_options(timeout))
+        RATE_LIMITER.record_usage(model, estimated_tokens, response_token_count(response))
+
+        # 응답 유효성 검증
+        if not response or not response.text:
+            raise Exception("Empty response from API")
+
+        return response
+
+    try:
+        return GEMINI_RETRY_POLICY.run(
+            call,
+            max_retries=max_retries,
+            progress_callback=progress_callback,
+            delay_hook=build_delay_hook(model)
+        )
+
+    except RetryGiveUp:
+        raise
+
+    except google_exceptions.NotFound as e:
+        # 404 NotFound 에러 (프롬프트 캐시가 사라졌거나 모델을 찾을 수 없음)
+        raise prompt_cache_miss(model, e) or build_model_not_found_error(e)
+
+    except Exception as e:
+        # 재시도 불가능한 에러는 즉시 발생
+        raise prompt_cache_miss(model, e) or Exception(f"재시도 불가능한 에러: {type(e).__name__} - {str(e)}")
+
+
+def retry_with_exponential_backoff(func, max_retries=None, progress_callback=None):
+    """
+    GEMINI_RETRY_POLICY로 임의의 함수 실행을 재시도합니다.
+
+    Args:
+        func: 실행할 함수 (인자 없음)
+        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
+        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+
+    Returns:
+        함수 실행 결과
+
+    Raises:
+        RetryGiveUp: 재시도 가능한 에러로 최종 실패한 경우
+        Exception: 재시도 불가능한 에러는 그대로 발생
+    """
+    return GEMINI_RETRY_POLICY.run(
+        lambda timeout: func(),
+        max_retries=max_retries,
+        progress_callback=progress_callback
+    )
+
+
+# ========================================
+# 실시간 스트리밍 생성
+# ========================================
+
+# RESPONSE_SCHEMA 키 → 화면 표시용 키
+PLATFORM_KEYS = {"x": "x", "insta": "instagram", "threads": "threads"}
+LANGUAGE_KEYS = {"kr": "korean", "en": "english"}
+
+
+def iter_response_text(response):
+    """스트리밍 응답에서 비어있지 않은 텍스트 조각만 yield합니다."""
+    for chunk in response:
+        try:
+            text = chunk.text
+        except ValueError:
+            # 텍스트 파트가 없는 조각 (종료 신호 등)
+            continue
+
+        if text:
+            yield text
+
+
+def safe_generate_content_stream(model, contents, max_retries=None, progress_callback=None):
+    """
+    stream=True로 콘텐츠를 생성하며 텍스트 조각을 도착 즉시 yield합니다.
+
+    첫 조각이 도착하기 전에 발생한 500/429/503/타임아웃 에러는 safe_generate_content와
+    같은 GEMINI_RETRY_POLICY로 재시도합니다. 출력이 시작된 뒤의 에러는
+    중복 출력을 막기 위해 재시도하지 않고 그대로 발생시킵니다.
+
+    Args:
+        model: genai.GenerativeModel 인스턴스
+        contents: 프롬프트 (문자열 또는 멀티모달 콘텐츠 리스트)
+        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
+        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+
+    Yields:
+        응답 텍스트 조각
+
+    Raises:
+        Exception: 재시도 불가능한 에러 또는 모든 재시도 실패 시
+    """
+    estimated_tokens = estimate_tokens(contents)
+
+    def open_stream(timeout):
+        # 첫 조각까지 받아야 출력이 시작된 것으로 보고, 그 전의 에러만 재시도
+        RATE_LIMITER.acquire(model, estimated_tokens)
+        response = model.generate_content(contents, stream=True, request_options=build_request_options(timeout))
+        texts = iter_response_text(response)
+
+        first_text = next(texts, None)
+        if first_text is None:
+            raise Exception("Empty response from API")
+
+        return response, texts, first_text
+
+    try:
+        response, texts, first_text = GEMINI_RETRY_POLICY.run(
+            open_stream,
+            max_retries=max_retries,
+            progress_callback=progress_callback,
+            delay_hook=build_delay_hook(model)
+        )
+    except google_exceptions.NotFound as e:
+        # 404 NotFound 에러 (프롬프트 캐시가 사라졌거나 모델을 찾을 수 없음)
+        raise prompt_cache_miss(model, e) or build_model_not_found_error(e)
+    except google_exceptions.PermissionDenied as e:
+        raise prompt_cache_miss(model, e) or e
+
+    yield first_text
+
+    try:
+        yield from texts
+    except RETRYABLE_ERRORS as e:
+        raise Exception(f"스트리밍 도중 API 에러 발생: {type(e).__name__} - {str(e)}")
+
+    RATE_LIMITER.record_usage(model, estimated_tokens, response_token_count(response))
+
+
+def stream_post_events(model, contents, progress_callback=None):
+    """
+    스트리밍 응답을 증분 파싱하여 게시물 단위 이벤트를 yield합니다.
+
+    각 게시물(kr.x, en.insta 등) 문자열이 닫히는 즉시 "completed" 이벤트를,
+    해당 게시물의 바이럴 점수와 근거가 모두 도착하면 "scored" 이벤트를 보냅니다.
+
+    Args:
+        model: genai.GenerativeModel 인스턴스 (RESPONSE_SCHEMA JSON 응답 설정)
+        contents: 프롬프트 (문자열 또는 멀티모달 콘텐츠 리스트)
+        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+
+    Yields:
+        {"platform": "x", "language": "english", "status": "completed", "content": "..."}
+        {"platform": "x", "language": "english", "status": "scored", "viral_score": 85, "viral_reason": "..."}
+        {"platform": "all", "status": "parsed", "result": {...}}  (마지막, RESPONSE_SCHEMA 준수)
+
+    Raises:
+        Exception: 생성 또는 JSON 파싱 실패 시
+    """
+    parser = IncrementalJSONParser()
+    chunks = []
+    viral_fields = {}
+
+    for text in safe_generate_content_stream(model, contents, progress_callback=progress_callback):
+        chunks.append(text)
+
+        for path, value in parser.feed(text):
+            # 게시물 본문: (언어, 플랫폼)
+            if len(path) == 2 and path[0] in LANGUAGE_KEYS and path[1] in PLATFORM_KEYS:
+                yield {
+                    "platform": PLATFORM_KEYS[path[1]],
+                    "language": LANGUAGE_KEYS[path[0]],
+                    "status": "completed",
+                    "content": value
+                }
+
+            # 바이럴 분석: ("viral_analysis", 언어, 플랫폼, "score"|"reason")
+            elif len(path) == 4 and path[0] == "viral_analysis" and path[1] in LANGUAGE_KEYS and path[2] in PLATFORM_KEYS:
+                fields = viral_fields.setdefault((path[1], path[2]), {})
+                fields[path[3]] = value
+
+                if "score" in fields and "reason" in fields:
+                    yield {
+                        "platform": PLATFORM_KEYS[path[2]],
+                        "language": LANGUAGE_KEYS[path[1]],
+                        "status": "scored",
+                        "viral_score": fields["score"],
+                        "viral_reason": fields["reason"]
+                    }
+
+    response_text = "".join(chunks)
+
+    try:
+        result = json.loads(response_text)
+    except json.JSONDecodeError as e:
+        error_msg = f"Failed to parse JSON response: {str(e)}\n\n"
+        error_msg += f"Response length: {len(response_text)} characters\n"
+        error_msg += f"Error position: line {e.lineno}, column {e.colno}\n\n"
+        error_msg += f"Full response text:\n{response_text}\n"
+        raise Exception(error_msg)
+
+    yield {"platform": "all", "status": "parsed", "result": result}
+
+
+def generate_sns_posts_streaming(article_text: str, article_title: str = "", site_name: str = "해당 매체", video_path=None):
+    """
+    한국어 기사 또는 YouTube 영상을 받아 English와 Korean 버전의 SNS 게시물을 스트리밍 방식으로 생성합니다.
+    단 한 번의 API 호출로 모든 플랫폼/언어 조합의 게시물을 JSON 형식으로 받아옵니다.
+
+    Args:
+        article_text: 한국어 기사 내용
+        article_title: 한국어 기사 제목 (선택)
+        site_name: 출처 사이트 이름 (선택, 기본값: "해당 매체")
+        video_path: YouTube 영상 파일 경로 (선택, 제공 시 Google AI에 업로드됨)
+
+    Yields:
+        각 플랫폼/언어별 결과를 담은 딕셔너리 (stream_post_events 참고)
+        {"platform": "x", "language": "english", "status": "completed", "content": "..."}
+        {"platform": "x", "language": "english", "status": "scored", "viral_score": 85, "viral_reason": "..."}
+    """
+    try:
+        # 변수 초기화 (NameError 방지)
+        video_frames = None  # 레거시 호환성
+
+        # 모드 판별 플래그
+        import os
+        is_video_mode = video_path is not None and os.path.exists(video_path)
+
+        ensure_configured()
+
+        print(f"\n{'='*70}")
+        print(f"🎯 분석 모드: {'YouTube 영상 전체 분석' if is_video_mode else '텍스트 기사 분석'}")
+        print(f"{'='*70}")
+
+        # 안전 설정 및 생성 설정
+        safety_settings = [
+            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+        ]
+
+        generation_config = {
+            "temperature": 0.9,
+            "top_p": 0.95,
+            "top_k": 40,
+            "max_output_tokens": 8192,  # Instagram 긴 게시물 대응 (4096 → 8192)
+            "response_mime_type": "application/json",  # JSON 응답 강제
+            "response_schema": RESPONSE_SCHEMA,  # JSON 스키마 정의
+        }
+
+        # 영상 파일 업로드 및 처리 대기
+        uploaded_video_file = None
+        if is_video_mode:
+            try:
+                print(f"\n{'='*70}")
+
+                # Google AI에 파일 업로드 (같은 영상의 ACTIVE 파일이 있으면 재사용, 실패 시 원격 파일 정리)
+                uploaded_video_file = UPLOAD_REGISTRY.get_or_upload(video_path)
+
+                print(f"{'='*70}\n")
 
             except Exception as e:
-                # 업로드 실패 시 클린업
-                if uploaded_video_file:
-                    try:
-                        genai.delete_file(uploaded_video_file.name)
-                    except:
-                        pass
                 raise Exception(f"영상 업로드 실패: {str(e)}")
 
         # 비디오 모드면 VIDEO_MODEL, 기사 모드면 ARTICLE_MODEL 사용
@@ -1032,10 +1721,9 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
         print(f"🎬 컨텐츠 타입: {'YouTube 영상 전체 분석' if is_video_mode else '텍스트 기사 분석'}")
         print(f"{'='*70}")
 
-        model_name, selection_reason = get_best_available_model(
+        model_name, selection_reason = MODEL_CATALOG.resolve(
             preferred_model,
-            fallback_keywords=['flash', 'pro', 'gemini'],
-            available_models=AVAILABLE_MODELS
+            fallback_keywords=['flash', 'pro', 'gemini']
         )
 
         if not model_name:
@@ -1063,22 +1751,20 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
             print(f"⚠️  {model_name} 모델 로드 실패: {str(e)}")
 
             # 사용 가능한 모델 목록 출력
+            available = MODEL_CATALOG.get_models()
             print("\n📋 사용 가능한 모델 목록:")
-            for i, m in enumerate(AVAILABLE_MODELS, 1):
+            for i, m in enumerate(available, 1):
                 print(f"   {i}. {m}")
 
             raise Exception(
                 f"❌ 모델 로드 실패: {model_name}\n\n"
                 f"💡 사용 가능한 모델 목록:\n" +
-                "\n".join(f"  • {m}" for m in AVAILABLE_MODELS[:5]) +
-                (f"\n  ... 외 {len(AVAILABLE_MODELS)-5}개" if len(AVAILABLE_MODELS) > 5 else "")
+                "\n".join(f"  • {m}" for m in available[:5]) +
+                (f"\n  ... 외 {len(available)-5}개" if len(available) > 5 else "")
             )
 
-        # 영문 사이트명 매핑
-        site_name_en = {
-            "텐아시아": "TenAsia",
-            "한국경제": "hankyung"
-        }.get(site_name, site_name)
+        # 영문 사이트명
+        site_name_en = SITE_REGISTRY.english_name(site_name)
 
         # 모드별 콘텐츠 정보 구성 (엄격하게 분리)
         if is_video_mode:
@@ -1108,6 +1794,9 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
 {article_text}
 """
             content_type = "기사"
+        # 비디오 프레임 분석 가이드 (Python 3.11 f-string 제약상 별도 변수로 분리)
+        video_frame_guide = "### 🎬 비디오 프레임 분석 가이드 (Video Analysis Guide)\n\n제공된 프레임들을 분석하여 다음 요소들을 파악하고 게시물에 반영하세요:\n\n1. **핵심 비주얼 요소**:\n   - 주요 인물의 표정, 동작, 포즈\n   - 색감과 분위기 (밝고 경쾌한지, 어둡고 감성적인지)\n   - 배경과 세트 (무대, 스튜디오, 야외 등)\n   - 특별한 의상이나 소품\n\n2. **영상의 흐름과 하이라이트**:\n   - 프레임들의 순서를 보고 영상의 전체적인 흐름 파악\n   - 가장 임팩트 있는 장면 (클라이맥스) 식별\n   - 반복되는 동작이나 패턴\n\n3. **감정과 에너지**:\n   - 영상에서 느껴지는 전반적인 감정 (즐거움, 슬픔, 흥분, 차분함)\n   - 에너지 레벨 (고에너지 댄스, 차분한 발라드 등)\n\n4. **게시물 반영**:\n   - 비주얼 요소를 구체적으로 언급 (예: '그 빨간 드레스', 'iconic stage presence')\n   - 감정과 에너지를 텍스트로 전달 (예: 'serving high energy', '감성 폭발')\n   - 특별한 순간을 강조 (예: 'that moment when...', '그 장면에서...')\n\n" if video_frames else ""
+
         unified_prompt = f"""당신은 {site_name}의 수석 글로벌 SNS 에디터입니다.
 아래 {content_type}를 바탕으로 3개 플랫폼(X, Instagram, Threads) x 2개 언어(English, Korean) = 총 6개의 SNS 게시물을 생성하세요.
 
@@ -1143,7 +1832,7 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
 
 ## 📱 플랫폼별 상세 가이드라인
 
-{"### 🎬 비디오 프레임 분석 가이드 (Video Analysis Guide)\n\n제공된 프레임들을 분석하여 다음 요소들을 파악하고 게시물에 반영하세요:\n\n1. **핵심 비주얼 요소**:\n   - 주요 인물의 표정, 동작, 포즈\n   - 색감과 분위기 (밝고 경쾌한지, 어둡고 감성적인지)\n   - 배경과 세트 (무대, 스튜디오, 야외 등)\n   - 특별한 의상이나 소품\n\n2. **영상의 흐름과 하이라이트**:\n   - 프레임들의 순서를 보고 영상의 전체적인 흐름 파악\n   - 가장 임팩트 있는 장면 (클라이맥스) 식별\n   - 반복되는 동작이나 패턴\n\n3. **감정과 에너지**:\n   - 영상에서 느껴지는 전반적인 감정 (즐거움, 슬픔, 흥분, 차분함)\n   - 에너지 레벨 (고에너지 댄스, 차분한 발라드 등)\n\n4. **게시물 반영**:\n   - 비주얼 요소를 구체적으로 언급 (예: '그 빨간 드레스', 'iconic stage presence')\n   - 감정과 에너지를 텍스트로 전달 (예: 'serving high energy', '감성 폭발')\n   - 특별한 순간을 강조 (예: 'that moment when...', '그 장면에서...')\n\n" if video_frames else ""}
+{video_frame_guide}
 
 ### 🐦 X (Twitter) - Punchy & Viral
 
@@ -1323,121 +2012,32 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
                 "error": error
             })
 
-        # YouTube 영상 모드일 경우 멀티모달 콘텐츠 구성
+        # YouTube 영상 모드일 경우 프롬프트와 업로드된 영상 파일을 함께 전달
         if is_video_mode and uploaded_video_file:
-            # 프롬프트와 업로드된 영상 파일을 함께 전달
-            content_parts = [
-                unified_prompt,
-                uploaded_video_file  # Google AI에 업로드된 영상 파일
-            ]
+            contents = [unified_prompt, uploaded_video_file]
 
             print(f"\n🤖 Gemini가 영상을 전체적으로 감상하는 중...")
             print(f"   이 과정은 영상 길이에 따라 시간이 걸릴 수 있습니다.\n")
-
-            # 안전한 API 호출 (Exponential Backoff 포함)
-            response = safe_generate_content(
-                model,
-                content_parts,
-                max_retries=config.MAX_RETRIES,
-                progress_callback=progress_callback
-            )
         else:
-            # 텍스트만 있을 경우 기존 방식
-            response = safe_generate_content(
-                model,
-                unified_prompt,
-                max_retries=config.MAX_RETRIES,
-                progress_callback=progress_callback
-            )
-
-        # 재시도 발생 시 알림
-        for retry_info in retry_attempts:
-            yield {
-                "platform": "retry",
-                "status": "retrying",
-                "attempt": retry_info["attempt"],
-                "max_retries": retry_info["max_retries"],
-                "wait_time": retry_info["wait_time"],
-                "error": retry_info["error"]
-            }
-
-        # JSON 파싱
-        try:
-            result = json.loads(response.text)
-        except json.JSONDecodeError as e:
-            # 더 자세한 에러 정보 출력
-            error_msg = f"Failed to parse JSON response: {str(e)}\n\n"
-            error_msg += f"Response length: {len(response.text)} characters\n"
-            error_msg += f"Error position: line {e.lineno}, column {e.colno}\n\n"
-            error_msg += f"Full response text:\n{response.text}\n"
-            raise Exception(error_msg)
-
-        # 각 플랫폼/언어별로 순차적으로 yield
-        # X (Twitter) - English
-        yield {"platform": "x", "language": "english", "status": "generating", "content": None}
-        yield {
-            "platform": "x",
-            "language": "english",
-            "status": "completed",
-            "content": result["en"]["x"],
-            "viral_score": result["viral_analysis"]["en"]["x"]["score"],
-            "viral_reason": result["viral_analysis"]["en"]["x"]["reason"]
-        }
-
-        # X (Twitter) - Korean
-        yield {"platform": "x", "language": "korean", "status": "generating", "content": None}
-        yield {
-            "platform": "x",
-            "language": "korean",
-            "status": "completed",
-            "content": result["kr"]["x"],
-            "viral_score": result["viral_analysis"]["kr"]["x"]["score"],
-            "viral_reason": result["viral_analysis"]["kr"]["x"]["reason"]
-        }
-
-        # Instagram - English
-        yield {"platform": "instagram", "language": "english", "status": "generating", "content": None}
-        yield {
-            "platform": "instagram",
-            "language": "english",
-            "status": "completed",
-            "content": result["en"]["insta"],
-            "viral_score": result["viral_analysis"]["en"]["insta"]["score"],
-            "viral_reason": result["viral_analysis"]["en"]["insta"]["reason"]
-        }
-
-        # Instagram - Korean
-        yield {"platform": "instagram", "language": "korean", "status": "generating", "content": None}
-        yield {
-            "platform": "instagram",
-            "language": "korean",
-            "status": "completed",
-            "content": result["kr"]["insta"],
-            "viral_score": result["viral_analysis"]["kr"]["insta"]["score"],
-            "viral_reason": result["viral_analysis"]["kr"]["insta"]["reason"]
-        }
-
-        # Threads - English
-        yield {"platform": "threads", "language": "english", "status": "generating", "content": None}
-        yield {
-            "platform": "threads",
-            "language": "english",
-            "status": "completed",
-            "content": result["en"]["threads"],
-            "viral_score": result["viral_analysis"]["en"]["threads"]["score"],
-            "viral_reason": result["viral_analysis"]["en"]["threads"]["reason"]
-        }
+            contents = unified_prompt
+
+        # 실시간 스트리밍: 각 게시물 문자열이 완성되는 즉시 yield
+        # (바이럴 점수는 게시물 이후에 생성되므로 "scored" 이벤트로 별도 전달)
+        for event in stream_post_events(model, contents, progress_callback=progress_callback):
+            # 재시도 발생 시 알림
+            while retry_attempts:
+                retry_info = retry_attempts.pop(0)
+                yield {
+                    "platform": "retry",
+                    "status": "retrying",
+                    "attempt": retry_info["attempt"],
+                    "max_retries": retry_info["max_retries"],
+                    "wait_time": retry_info["wait_time"],
+                    "error": retry_info["error"]
+                }
 
-        # Threads - Korean
-        yield {"platform": "threads", "language": "korean", "status": "generating", "content": None}
-        yield {
-            "platform": "threads",
-            "language": "korean",
-            "status": "completed",
-            "content": result["kr"]["threads"],
-            "viral_score": result["viral_analysis"]["kr"]["threads"]["score"],
-            "viral_reason": result["viral_analysis"]["kr"]["threads"]["reason"]
-        }
+            if event["status"] != "parsed":
+                yield event
 
         # 최종 완료 신호
         yield {"platform": "all", "status": "completed", "model": model_name}
@@ -1453,16 +2053,15 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
             print(f"\n{'='*70}")
             print(f"🧹 클린업 시작...")
 
-            # 1. Google AI 서버의 파일 삭제
+            # 1. Google AI 서버의 파일 정리 (재사용 기록에 없는 파일만 삭제)
             if uploaded_video_file:
-                try:
-                    genai.delete_file(uploaded_video_file.name)
-                    print(f"✅ Google Cloud 파일 삭제 완료: {uploaded_video_file.name}")
-                except Exception as e:
-                    print(f"⚠️  Google Cloud 파일 삭제 실패: {str(e)}")
+                UPLOAD_REGISTRY.release(uploaded_video_file)
 
-            # 2. 로컬 임시 파일 삭제
-            if os.path.exists(video_path):
+            # 2. 로컬 임시 파일 삭제 (작업 공간의 영상은 작업만 종료하고 공용 영상은 보관)
+            if MEDIA_WORKSPACE.owns(video_path):
+                MEDIA_WORKSPACE.release(video_path)
+                print(f"✅ 작업 공간 작업 종료: {video_path}")
+            elif os.path.exists(video_path):
                 try:
                     os.remove(video_path)
                     print(f"✅ 로컬 임시 파일 삭제 완료: {video_path}")
@@ -1474,84 +2073,308 @@ def generate_sns_posts_streaming(article_text: str, article_title: str = "", sit
 
 
 # ========================================
-# 독립된 생성 함수 (관심사 분리)
+# 언어별 병렬 생성 (fan-out / merge)
 # ========================================
 
-def generate_article_posts(article_text: str, article_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석"):
+def generate_language_slice(model_name: str, prompt: str, language: str, media=None, max_retries=None) -> dict:
     """
-    기사 텍스트에 최적화된 SNS 게시물 생성
+    한 언어의 게시물/점수/요약만 생성합니다.
 
-    gemini-2.0-flash 모델을 사용하여 텍스트 분석에 특화된 처리를 수행합니다.
+    API 에러는 safe_generate_content가 재시도하고, JSON 파싱 실패는
+    이 언어 요청만 다시 보냅니다 (다른 언어 결과에는 영향 없음).
 
     Args:
-        article_text: 기사 본문
-        article_title: 기사 제목
-        site_name: 출처 사이트 이름 (기본값: "텐아시아")
-        tone_mode: 분량 모드 ("compact" 또는 "rich", 기본값: "rich")
-        content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        model_name: 사용할 모델 이름
+        prompt: 언어 지시문이 포함된 프롬프트
+        language: 언어 코드 ("kr" 또는 "en")
+        media: 함께 전달할 업로드 파일 (선택, 영상 모드)
+        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
 
     Returns:
-        JSON 형식의 SNS 게시물 딕셔너리 (RESPONSE_SCHEMA 준수)
+        build_language_schema 구조의 딕셔너리
 
     Raises:
-        Exception: 생성 실패 시 명확한 에러 메시지와 함께 발생
+        Exception: 모든 재시도 실패 시
     """
-    try:
-        print(f"\n{'='*70}")
-        print(f"📝 기사 분석 모드 시작")
-        print(f"   사이트: {site_name}")
-        print(f"   분량 모드: {tone_mode.upper()}")
-        print(f"   콘텐츠 스타일: {content_style}")
-        print(f"{'='*70}\n")
+    if max_retries is None:
+        max_retries = config.MAX_RETRIES
 
-        # PromptBuilder로 프롬프트 조립
-        builder = PromptBuilder(site_name, tone_mode, content_style)
-        prompt = builder.build_article_prompt(article_text, article_title)
+    model = genai.GenerativeModel(
+        model_name,
+        safety_settings=SAFETY_SETTINGS,
+        generation_config=build_generation_config(
+            build_language_schema(language),
+            max_output_tokens=config.PARALLEL_MAX_OUTPUT_TOKENS
+        )
+    )
+    contents = [prompt, media] if media is not None else prompt
 
-        # 모델 선택: gemini-2.0-flash (텍스트 분석 최적화)
-        print(f"🤖 모델 선택 중...")
-        model_name, selection_reason = get_best_available_model(config.ARTICLE_MODEL)
+    for attempt in range(max_retries):
+        response = safe_generate_content(model, contents, max_retries=max_retries)
 
-        if not model_name:
-            raise Exception(
-                "❌ 사용 가능한 Gemini 모델을 찾을 수 없습니다.\n\n"
-                "💡 해결 방법:\n"
-                "1. API 키가 올바르게 설정되었는지 확인\n"
-                "2. API 키에 Gemini API 접근 권한이 있는지 확인\n"
-                "3. https://makersuite.google.com/app/apikey 에서 키 확인"
-            )
+        try:
+            return json.loads(response.text)
+        except json.JSONDecodeError as e:
+            if attempt == max_retries - 1:
+                raise Exception(f"JSON 파싱 실패 (재시도 {max_retries}회 모두 실패): {str(e)}")
+            print(f"⚠️  [{language}] JSON 파싱 실패 - 해당 언어만 재시도 ({attempt + 1}/{max_retries})")
 
-        print(f"✅ 선택된 모델: {model_name} ({selection_reason})")
 
-        # 모델 초기화
-        safety_settings = [
-            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-        ]
+def generate_posts_parallel(model_name: str, builder: PromptBuilder, prompt: str, media=None, languages=None) -> dict:
+    """
+    언어별 요청을 동시에 보내고 결과를 RESPONSE_SCHEMA 구조로 병합합니다.
 
-        generation_config = {
-            "temperature": 0.9,
-            "top_p": 0.95,
-            "top_k": 40,
-            "max_output_tokens": 8192,
-            "response_mime_type": "application/json",
-            "response_schema": RESPONSE_SCHEMA,
-        }
+    하나의 요청이 6개 게시물을 모두 출력하는 대신 언어별로 절반씩 출력하므로,
+    전체 소요 시간이 단일 요청의 전체 출력 시간에서 언어별 출력 시간으로 줄어듭니다.
 
-        model = genai.GenerativeModel(
-            model_name,
-            safety_settings=safety_settings,
-            generation_config=generation_config
-        )
+    Args:
+        model_name: 사용할 모델 이름
+        builder: 언어 지시문 생성에 사용할 PromptBuilder
+        prompt: 공통 프롬프트 (기사/영상 정보 포함)
+        media: 함께 전달할 업로드 파일 (선택, 영상 모드)
+        languages: 생성할 언어 코드 리스트 (기본값: config.SUPPORTED_LANGUAGES)
 
-        # API 호출 (Exponential Backoff)
-        print(f"\n🎨 SNS 게시물 생성 중...")
-        response = safe_generate_content(model, prompt, max_retries=config.MAX_RETRIES)
+    Returns:
+        RESPONSE_SCHEMA를 준수하는 딕셔너리
 
-        # JSON 파싱
-        result = json.loads(response.text)
+    Raises:
+        Exception: 하나 이상의 언어 생성 실패 시 (언어별 에러 포함)
+    """
+    if languages is None:
+        languages = config.SUPPORTED_LANGUAGES
+
+    slices = {}
+    errors = []
+
+    with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+        # 요청 우선순위(request_context)를 작업 스레드에 전달
+        futures = {
+            language: executor.submit(
+                contextvars.copy_context().run,
+                generate_language_slice,
+                model_name,
+                prompt + "\n\n" + builder.build_language_directive(language),
+                language,
+                media
+            )
+            for language in languages
+        }
+
+        for language, future in futures.items():
+            try:
+                slices[language] = future.result()
+                print(f"   ✅ {LANGUAGE_NAMES[language]} 생성 완료")
+            except Exception as e:
+                errors.append(f"[{LANGUAGE_NAMES[language]}] {str(e)}")
+
+    if errors:
+        raise Exception("언어별 병렬 생성 실패\n" + "\n".join(errors))
+
+    return merge_language_results(slices)
+
+
+# ========================================
+# 생성 결과 캐시
+# ========================================
+
+RESULT_CACHE = ResultCache()
+
+
+def prepare_article_text(article_text: str, article_title: str, model_name: str) -> str:
+    """
+    기사 본문의 잡음을 제거하고 config.ARTICLE_TOKEN_BUDGET을 넘으면 중요한 문장만 남깁니다.
+
+    Args:
+        article_text: 기사 본문
+        article_title: 기사 제목
+        model_name: count_tokens에 사용할 모델 이름
+
+    Returns:
+        생성에 사용할 본문 (비활성화 시 원본)
+    """
+    if not config.ARTICLE_BUDGET_ENABLED:
+        return article_text
+
+    fitted = fit_article(article_text, article_title, model_name)
+    if fitted["condensed"]:
+        print(f"✂️  본문 축약: 약 {fitted['original_tokens']} → {fitted['tokens']} 토큰 ({fitted['counter']} 기준, 예산 {config.ARTICLE_TOKEN_BUDGET})")
+    elif fitted["original_tokens"] > fitted["tokens"]:
+        print(f"🧹 본문 정리: 약 {fitted['original_tokens']} → {fitted['tokens']} 토큰")
+
+    return fitted["text"]
+
+
+def build_article_cache_key(article_text: str, article_title: str, site_name: str, tone_mode: str, content_style: str, model_name: str) -> str:
+    """
+    기사 생성 결과의 캐시 키를 계산합니다 (프롬프트 템플릿 버전, 토큰 예산 포함).
+
+    축약 결과는 count_tokens 성공 여부(API/로컬 비율)에 따라 달라질 수 있으므로
+    prepare_article_text 전의 원본 본문으로 계산하고, 축약 전에 조회합니다.
+
+    Args:
+        article_text: 원본 기사 본문 (prepare_article_text 적용 전)
+        article_title: 기사 제목
+        site_name: 출처 사이트 이름
+        tone_mode: 분량 모드
+        content_style: 콘텐츠 스타일
+        model_name: 실제 선택된 모델 이름
+
+    Returns:
+        캐시 키 문자열
+    """
+    budget = config.ARTICLE_TOKEN_BUDGET if config.ARTICLE_BUDGET_ENABLED else "off"
+
+    return build_cache_key(
+        article_text, article_title, site_name, tone_mode.lower(), content_style,
+        model_name, f"{PromptBuilder.template_version()}-budget-{budget}"
+    )
+
+
+def get_cached_result(cache_key: str, force_regenerate: bool = False):
+    """
+    캐시된 생성 결과를 조회합니다.
+
+    Args:
+        cache_key: build_article_cache_key로 계산한 키
+        force_regenerate: True이면 캐시를 무시 (새로 생성)
+
+    Returns:
+        생성 결과 딕셔너리 또는 None
+    """
+    if force_regenerate or not config.RESULT_CACHE_ENABLED:
+        return None
+
+    try:
+        result = RESULT_CACHE.get(cache_key)
+    except Exception as e:
+        # 캐시 오류는 생성을 막지 않음
+        print(f"⚠️  결과 캐시 조회 실패: {str(e)}")
+        return None
+
+    if result is not None:
+        print(f"💾 캐시된 생성 결과 사용 (key: {cache_key[:12]})")
+
+    return result
+
+
+def store_cached_result(cache_key: str, result: dict, model_name: str):
+    """
+    생성 결과를 캐시에 저장합니다 (실패해도 예외를 발생시키지 않음).
+
+    Args:
+        cache_key: build_article_cache_key로 계산한 키
+        result: 생성 결과 딕셔너리
+        model_name: 결과를 생성한 모델 이름
+    """
+    if not config.RESULT_CACHE_ENABLED:
+        return
+
+    try:
+        RESULT_CACHE.put(cache_key, result, model_name)
+    except Exception as e:
+        print(f"⚠️  결과 캐시 저장 실패: {str(e)}")
+
+
+def result_to_post_events(result: dict):
+    """
+    완성된 생성 결과를 stream_post_events와 같은 형식의 이벤트로 변환합니다.
+    (캐시된 결과를 스트리밍 UI에 그대로 표시하기 위함)
+
+    Args:
+        result: RESPONSE_SCHEMA를 준수하는 딕셔너리
+
+    Yields:
+        "completed" / "scored" 게시물 이벤트
+    """
+    for language_key, language in LANGUAGE_KEYS.items():
+        for platform_key, platform in PLATFORM_KEYS.items():
+            yield {
+                "platform": platform,
+                "language": language,
+                "status": "completed",
+                "content": result[language_key][platform_key]
+            }
+
+            analysis = result["viral_analysis"][language_key][platform_key]
+            yield {
+                "platform": platform,
+                "language": language,
+                "status": "scored",
+                "viral_score": analysis["score"],
+                "viral_reason": analysis["reason"]
+            }
+
+
+# ========================================
+# 독립된 생성 함수 (관심사 분리)
+# ========================================
+
+def generate_article_posts(article_text: str, article_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석", parallel: bool = None, force_regenerate: bool = False):
+    """
+    기사 텍스트에 최적화된 SNS 게시물 생성
+
+    gemini-2.0-flash 모델을 사용하여 텍스트 분석에 특화된 처리를 수행합니다.
+
+    Args:
+        article_text: 기사 본문
+        article_title: 기사 제목
+        site_name: 출처 사이트 이름 (기본값: "텐아시아")
+        tone_mode: 분량 모드 ("compact" 또는 "rich", 기본값: "rich")
+        content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        parallel: 언어별 병렬 생성 모드 사용 여부 (기본값: config.PARALLEL_GENERATION)
+        force_regenerate: True이면 결과 캐시를 무시하고 새로 생성 (기본값: False)
+
+    Returns:
+        JSON 형식의 SNS 게시물 딕셔너리 (RESPONSE_SCHEMA 준수)
+
+    Raises:
+        Exception: 생성 실패 시 명확한 에러 메시지와 함께 발생
+    """
+    if parallel is None:
+        parallel = config.PARALLEL_GENERATION
+
+    try:
+        ensure_configured()
+
+        print(f"\n{'='*70}")
+        print(f"📝 기사 분석 모드 시작")
+        print(f"   사이트: {site_name}")
+        print(f"   분량 모드: {tone_mode.upper()}")
+        print(f"   콘텐츠 스타일: {content_style}")
+        print(f"   생성 방식: {'언어별 병렬' if parallel else '단일 요청'}")
+        print(f"{'='*70}\n")
+
+        # 모델 선택: gemini-2.0-flash (텍스트 분석 최적화)
+        print(f"🤖 모델 선택 중...")
+        model_name, selection_reason = resolve_model(config.ARTICLE_MODEL)
+
+        print(f"✅ 선택된 모델: {model_name} ({selection_reason})")
+
+        # 동일한 기사/스타일/모델 조합의 결과가 있으면 재사용 (원본 본문 기준, 축약 전에 조회)
+        cache_key = build_article_cache_key(article_text, article_title, site_name, tone_mode, content_style, model_name)
+        cached_result = get_cached_result(cache_key, force_regenerate)
+        if cached_result is not None:
+            print(f"{'='*70}\n")
+            return cached_result
+
+        # 본문 정리 및 토큰 예산 적용 후 PromptBuilder로 프롬프트 조립
+        article_text = prepare_article_text(article_text, article_title, model_name)
+        builder = PromptBuilder(site_name, tone_mode, content_style)
+        prompt = builder.build_article_prompt(article_text, article_title)
+
+        if parallel:
+            # 언어별 병렬 생성 후 병합 (실패한 언어만 재시도)
+            print(f"\n🎨 SNS 게시물 병렬 생성 중... (언어별 {len(config.SUPPORTED_LANGUAGES)}개 요청)")
+            result = generate_posts_parallel(model_name, builder, prompt)
+        else:
+            # API 호출 (Exponential Backoff, 공통 가이드라인은 프롬프트 캐시 사용 시 기사 부분만 전송)
+            print(f"\n🎨 SNS 게시물 생성 중...")
+            response = generate_article_response(model_name, builder, article_text, article_title, max_retries=config.MAX_RETRIES)
+
+            # JSON 파싱
+            result = json.loads(response.text)
+
+        store_cached_result(cache_key, result, model_name)
 
         print(f"\n✅ 기사 분석 완료!")
         print(f"   생성된 게시물: 6개 (X, Instagram, Threads x 2개 언어)")
@@ -1573,13 +2396,108 @@ def generate_article_posts(article_text: str, article_title: str = "", site_name
         error_msg = f"기사 분석 실패\n\n"
         error_msg += f"에러: {str(e)}\n\n"
         error_msg += "해결 방법:\n"
-        error_msg += "1. 기사 내용이 너무 길지 않은지 확인 (8000자 이하 권장)\n"
+        error_msg += f"1. 기사 내용이 올바른지 확인 (본문은 약 {config.ARTICLE_TOKEN_BUDGET} 토큰 이내로 자동 축약)\n"
+        error_msg += "2. API 키가 유효한지 확인\n"
+        error_msg += "3. 네트워크 연결 확인"
+        raise Exception(error_msg)
+
+
+def generate_article_posts_stream(article_text: str, article_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석", progress_callback=None, force_regenerate: bool = False):
+    """
+    generate_article_posts의 실시간 스트리밍 버전
+
+    응답 전체를 기다리지 않고, 각 게시물이 완성되는 즉시 이벤트를 yield합니다.
+    X 게시물을 Instagram 게시물이 작성되는 동안 먼저 표시할 수 있습니다.
+
+    Args:
+        article_text: 기사 본문
+        article_title: 기사 제목
+        site_name: 출처 사이트 이름 (기본값: "텐아시아")
+        tone_mode: 분량 모드 ("compact" 또는 "rich", 기본값: "rich")
+        content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+        force_regenerate: True이면 결과 캐시를 무시하고 새로 생성 (기본값: False)
+
+    Yields:
+        {"platform": "all", "status": "generating", "model": "..."}  (모델 선택 완료)
+        stream_post_events의 "completed" / "scored" 이벤트
+        {"platform": "all", "status": "completed", "model": "...", "result": {...}, "cached": bool}  (마지막)
+
+    Raises:
+        Exception: 생성 실패 시 명확한 에러 메시지와 함께 발생
+    """
+    try:
+        ensure_configured()
+
+        print(f"\n{'='*70}")
+        print(f"📝 기사 분석 모드 시작 (실시간 스트리밍)")
+        print(f"   사이트: {site_name}")
+        print(f"   분량 모드: {tone_mode.upper()}")
+        print(f"   콘텐츠 스타일: {content_style}")
+        print(f"{'='*70}\n")
+
+        # PromptBuilder 준비 (프롬프트는 모델 선택 후 프롬프트 캐시 사용 여부에 따라 조립)
+        builder = PromptBuilder(site_name, tone_mode, content_style)
+
+        # 모델 선택
+        print(f"🤖 모델 선택 중...")
+        model_name, selection_reason = resolve_model(config.ARTICLE_MODEL)
+
+        print(f"✅ 선택된 모델: {model_name} ({selection_reason})")
+
+        yield {"platform": "all", "status": "generating", "model": model_name}
+
+        # 캐시된 결과가 있으면 API 호출 없이 같은 이벤트 순서로 재생 (원본 본문 기준, 축약 전에 조회)
+        cache_key = build_article_cache_key(article_text, article_title, site_name, tone_mode, content_style, model_name)
+        cached_result = get_cached_result(cache_key, force_regenerate)
+        if cached_result is not None:
+            yield from result_to_post_events(cached_result)
+            yield {"platform": "all", "status": "completed", "model": model_name, "result": cached_result, "cached": True}
+            return
+
+        # 본문 정리 및 토큰 예산 적용
+        article_text = prepare_article_text(article_text, article_title, model_name)
+
+        model, request_prompt = build_article_model(model_name, builder, article_text, article_title)
+
+        print(f"\n🎨 SNS 게시물 스트리밍 생성 중...")
+        result = None
+
+        try:
+            events = stream_post_events(model, request_prompt, progress_callback=progress_callback)
+            first_event = next(events)
+        except PromptCacheMiss as e:
+            # 첫 조각 전에만 발생하므로 아직 보낸 이벤트 없음 → 전체 프롬프트로 다시 요청
+            invalidate_article_prompt_cache(model_name, builder, e)
+            model, request_prompt = build_article_model(model_name, builder, article_text, article_title, use_cache=False)
+            events = stream_post_events(model, request_prompt, progress_callback=progress_callback)
+            first_event = next(events)
+
+        for event in itertools.chain([first_event], events):
+            if event["status"] == "parsed":
+                result = event["result"]
+            else:
+                yield event
+
+        store_cached_result(cache_key, result, model_name)
+
+        print(f"\n✅ 기사 분석 완료!")
+        print(f"   생성된 게시물: 6개 (X, Instagram, Threads x 2개 언어)")
+        print(f"{'='*70}\n")
+
+        yield {"platform": "all", "status": "completed", "model": model_name, "result": result, "cached": False}
+
+    except Exception as e:
+        error_msg = f"기사 분석 실패\n\n"
+        error_msg += f"에러: {str(e)}\n\n"
+        error_msg += "해결 방법:\n"
+        error_msg += f"1. 기사 내용이 올바른지 확인 (본문은 약 {config.ARTICLE_TOKEN_BUDGET} 토큰 이내로 자동 축약)\n"
         error_msg += "2. API 키가 유효한지 확인\n"
         error_msg += "3. 네트워크 연결 확인"
         raise Exception(error_msg)
 
 
-def generate_video_posts(video_path: str, video_metadata: str, video_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석"):
+def generate_video_posts(video_path: str, video_metadata: str, video_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석", parallel: bool = None, cancel_event: threading.Event = None, content_hash: str = None):
     """
     YouTube 영상에 최적화된 SNS 게시물 생성
 
@@ -1592,6 +2510,9 @@ def generate_video_posts(video_path: str, video_metadata: str, video_title: str
         site_name: 출처 사이트 이름 (기본값: "텐아시아")
         tone_mode: 분량 모드 ("compact" 또는 "rich", 기본값: "rich")
         content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        parallel: 언어별 병렬 생성 모드 사용 여부 (기본값: config.PARALLEL_GENERATION)
+        cancel_event: 설정되면 영상 처리 대기를 중단하는 이벤트 (선택)
+        content_hash: 미리 계산한 영상 내용 해시 (선택, 업로드 재사용 키)
 
     Returns:
         JSON 형식의 SNS 게시물 딕셔너리 (RESPONSE_SCHEMA 준수)
@@ -1601,8 +2522,11 @@ def generate_video_posts(video_path: str, video_metadata: str, video_title: str
     """
     uploaded_video_file = None
 
+    if parallel is None:
+        parallel = config.PARALLEL_GENERATION
+
     try:
-        import time
+        ensure_configured()
 
         print(f"\n{'='*70}")
         print(f"🎬 영상 분석 모드 시작")
@@ -1615,27 +2539,8 @@ def generate_video_posts(video_path: str, video_metadata: str, video_title: str
         if not os.path.exists(video_path):
             raise Exception(f"영상 파일을 찾을 수 없습니다: {video_path}")
 
-        # Google AI에 영상 업로드
-        print(f"📤 Google AI 서버에 영상 업로드 중...")
-        print(f"   파일: {video_path}")
-        print(f"   크기: {os.path.getsize(video_path) / (1024*1024):.2f} MB")
-
-        uploaded_video_file = genai.upload_file(path=video_path)
-        print(f"✅ 업로드 완료!")
-        print(f"   파일 이름: {uploaded_video_file.name}")
-        print(f"   URI: {uploaded_video_file.uri}")
-
-        # 영상 처리 완료 대기 (ACTIVE 상태까지)
-        print(f"\n⏳ 영상 처리 중...")
-        while uploaded_video_file.state.name == "PROCESSING":
-            print(f"   상태: {uploaded_video_file.state.name} - 대기 중...", end="\r")
-            time.sleep(2)
-            uploaded_video_file = genai.get_file(uploaded_video_file.name)
-
-        if uploaded_video_file.state.name == "FAILED":
-            raise Exception(f"영상 처리 실패: {uploaded_video_file.state.name}")
-
-        print(f"✅ 영상 처리 완료! 상태: {uploaded_video_file.state.name}\n")
+        # Google AI에 영상 업로드 (같은 영상의 ACTIVE 파일이 있으면 재사용)
+        uploaded_video_file = UPLOAD_REGISTRY.get_or_upload(video_path, content_hash=content_hash, cancel_event=cancel_event)
 
         # PromptBuilder로 프롬프트 조립 (비디오 전용)
         builder = PromptBuilder(site_name, tone_mode, content_style)
@@ -1643,53 +2548,32 @@ def generate_video_posts(video_path: str, video_metadata: str, video_title: str
 
         # 모델 선택: gemini-1.5-flash (멀티모달 최적화)
         print(f"🤖 모델 선택 중...")
-        model_name, selection_reason = get_best_available_model(config.VIDEO_MODEL)
-
-        if not model_name:
-            raise Exception(
-                "❌ 사용 가능한 Gemini 모델을 찾을 수 없습니다.\n\n"
-                "💡 해결 방법:\n"
-                "1. API 키가 올바르게 설정되었는지 확인\n"
-                "2. API 키에 Gemini API 접근 권한이 있는지 확인\n"
-                "3. https://makersuite.google.com/app/apikey 에서 키 확인"
-            )
+        model_name, selection_reason = resolve_model(config.VIDEO_MODEL)
 
         print(f"✅ 선택된 모델: {model_name} ({selection_reason})")
 
-        # 모델 초기화
-        safety_settings = [
-            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-        ]
-
-        generation_config = {
-            "temperature": 0.9,
-            "top_p": 0.95,
-            "top_k": 40,
-            "max_output_tokens": 8192,
-            "response_mime_type": "application/json",
-            "response_schema": RESPONSE_SCHEMA,
-        }
-
-        model = genai.GenerativeModel(
-            model_name,
-            safety_settings=safety_settings,
-            generation_config=generation_config
-        )
-
-        # 멀티모달 콘텐츠 구성
-        content_parts = [prompt, uploaded_video_file]
-
         # API 호출 (Exponential Backoff)
         print(f"\n🎨 Gemini가 영상을 전체적으로 감상하는 중...")
         print(f"   이 과정은 영상 길이에 따라 시간이 걸릴 수 있습니다.\n")
 
-        response = safe_generate_content(model, content_parts, max_retries=config.MAX_RETRIES)
+        if parallel:
+            # 언어별 병렬 생성 후 병합 (업로드된 영상은 두 요청이 공유)
+            result = generate_posts_parallel(model_name, builder, prompt, media=uploaded_video_file)
+        else:
+            # 모델 초기화
+            model = genai.GenerativeModel(
+                model_name,
+                safety_settings=SAFETY_SETTINGS,
+                generation_config=build_generation_config()
+            )
+
+            # 멀티모달 콘텐츠 구성
+            content_parts = [prompt, uploaded_video_file]
 
-        # JSON 파싱
-        result = json.loads(response.text)
+            response = safe_generate_content(model, content_parts, max_retries=config.MAX_RETRIES)
+
+            # JSON 파싱
+            result = json.loads(response.text)
 
         print(f"\n✅ 영상 분석 완료!")
         print(f"   생성된 게시물: 6개 (X, Instagram, Threads x 2개 언어)")
@@ -1718,13 +2602,358 @@ def generate_video_posts(video_path: str, video_metadata: str, video_title: str
         raise Exception(error_msg)
 
     finally:
-        # 클린업: Google Cloud 파일 삭제
+        # 클린업: 재사용 기록에 없는 원격 파일만 삭제 (재사용 파일은 만료/LRU 정리 시 삭제)
         if uploaded_video_file:
-            try:
-                genai.delete_file(uploaded_video_file.name)
-                print(f"🧹 Google Cloud 파일 삭제 완료: {uploaded_video_file.name}")
-            except Exception as e:
-                print(f"⚠️  Google Cloud 파일 삭제 실패: {str(e)}")
+            UPLOAD_REGISTRY.release(uploaded_video_file)
+
+
+# ========================================
+# 비동기(asyncio) 생성 API
+# ========================================
+
+async def safe_generate_content_async(model, prompt, max_retries=None, progress_callback=None):
+    """
+    safe_generate_content의 asyncio 버전
+
+    SDK의 generate_content_async를 사용하고, 재시도 대기는 GEMINI_RETRY_POLICY.run_async가
+    asyncio.sleep으로 처리하므로 대기 중에도 이벤트 루프가 다른 생성 요청을 계속 진행할 수 있습니다.
+
+    Args:
+        model: genai.GenerativeModel 인스턴스
+        prompt: 생성할 프롬프트
+        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
+        progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+
+    Returns:
+        생성된 응답
+
+    Raises:
+        RetryGiveUp: 재시도 가능한 에러로 최종 실패한 경우
+        Exception: 재시도 불가능한 에러
+    """
+    estimated_tokens = estimate_tokens(prompt)
+
+    async def call(timeout):
+        # 요청 제한 대기는 이벤트 루프에서 (스레드를 점유하지 않고, 취소 시 대기열에서 빠짐)
+        await RATE_LIMITER.acquire_async(model, estimated_tokens)
+        response = await model.generate_content_async(prompt, request_options=build_request_options(timeout))
+        RATE_LIMITER.record_usage(model, estimated_tokens, response_token_count(response))
+
+        # 응답 유효성 검증
+        if not response or not response.text:
+            raise Exception("Empty response from API")
+
+        return response
+
+    try:
+        return await GEMINI_RETRY_POLICY.run_async(
+            call,
+            max_retries=max_retries,
+            progress_callback=progress_callback,
+            delay_hook=build_delay_hook(model)
+        )
+
+    except RetryGiveUp:
+        raise
+
+    except google_exceptions.NotFound as e:
+        # 404 NotFound 에러 (프롬프트 캐시가 사라졌거나 모델을 찾을 수 없음)
+        raise prompt_cache_miss(model, e) or await asyncio.to_thread(build_model_not_found_error, e)
+
+    except Exception as e:
+        # 재시도 불가능한 에러는 즉시 발생
+        raise prompt_cache_miss(model, e) or Exception(f"재시도 불가능한 에러: {type(e).__name__} - {str(e)}")
+
+
+async def agenerate_article_response(model_name: str, builder: PromptBuilder, article_text: str, article_title: str, max_retries=None, progress_callback=None):
+    """
+    generate_article_response의 asyncio 버전
+
+    프롬프트 캐시 등록/연장은 네트워크 호출이므로 스레드에서 실행합니다.
+    """
+    model, request_prompt = await asyncio.to_thread(build_article_model, model_name, builder, article_text, article_title)
+
+    try:
+        return await safe_generate_content_async(model, request_prompt, max_retries=max_retries, progress_callback=progress_callback)
+    except PromptCacheMiss as e:
+        invalidate_article_prompt_cache(model_name, builder, e)
+
+    model, request_prompt = build_article_model(model_name, builder, article_text, article_title, use_cache=False)
+    return await safe_generate_content_async(model, request_prompt, max_retries=max_retries, progress_callback=progress_callback)
+
+
+async def upload_video_file_async(video_path: str, content_hash: str = None):
+    """
+    UPLOAD_REGISTRY.get_or_upload의 asyncio 버전
+
+    SDK의 파일 API는 동기 함수뿐이므로 업로드/상태 조회/재사용 확인을 스레드에서 실행합니다.
+    태스크가 취소되면 스레드의 처리 대기도 함께 중단됩니다.
+
+    Args:
+        video_path: 업로드할 영상 파일 경로
+        content_hash: 미리 계산한 영상 내용 해시 (선택)
+
+    Returns:
+        ACTIVE 상태의 업로드 파일 객체 (같은 영상의 기존 파일일 수 있음)
+
+    Raises:
+        Exception: 업로드 또는 영상 처리 실패 시 (업로드된 파일은 삭제됨)
+    """
+    cancel_event = threading.Event()
+
+    try:
+        return await asyncio.to_thread(UPLOAD_REGISTRY.get_or_upload, video_path, content_hash, cancel_event)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        raise
+
+
+async def agenerate_language_slice(model_name: str, prompt: str, language: str, media=None, max_retries=None) -> dict:
+    """
+    generate_language_slice의 asyncio 버전
+
+    Args:
+        model_name: 사용할 모델 이름
+        prompt: 언어 지시문이 포함된 프롬프트
+        language: 언어 코드 ("kr" 또는 "en")
+        media: 함께 전달할 업로드 파일 (선택, 영상 모드)
+        max_retries: 최대 재시도 횟수 (기본값: config.MAX_RETRIES)
+
+    Returns:
+        build_language_schema 구조의 딕셔너리
+
+    Raises:
+        Exception: 모든 재시도 실패 시
+    """
+    if max_retries is None:
+        max_retries = config.MAX_RETRIES
+
+    model = genai.GenerativeModel(
+        model_name,
+        safety_settings=SAFETY_SETTINGS,
+        generation_config=build_generation_config(
+            build_language_schema(language),
+            max_output_tokens=config.PARALLEL_MAX_OUTPUT_TOKENS
+        )
+    )
+    contents = [prompt, media] if media is not None else prompt
+
+    for attempt in range(max_retries):
+        response = await safe_generate_content_async(model, contents, max_retries=max_retries)
+
+        try:
+            return json.loads(response.text)
+        except json.JSONDecodeError as e:
+            if attempt == max_retries - 1:
+                raise Exception(f"JSON 파싱 실패 (재시도 {max_retries}회 모두 실패): {str(e)}")
+            print(f"⚠️  [{language}] JSON 파싱 실패 - 해당 언어만 재시도 ({attempt + 1}/{max_retries})")
+
+
+async def agenerate_posts_parallel(model_name: str, builder: PromptBuilder, prompt: str, media=None, languages=None) -> dict:
+    """
+    generate_posts_parallel의 asyncio 버전 (언어별 요청을 asyncio.gather로 동시 실행)
+
+    Args:
+        model_name: 사용할 모델 이름
+        builder: 언어 지시문 생성에 사용할 PromptBuilder
+        prompt: 공통 프롬프트 (기사/영상 정보 포함)
+        media: 함께 전달할 업로드 파일 (선택, 영상 모드)
+        languages: 생성할 언어 코드 리스트 (기본값: config.SUPPORTED_LANGUAGES)
+
+    Returns:
+        RESPONSE_SCHEMA를 준수하는 딕셔너리
+
+    Raises:
+        Exception: 하나 이상의 언어 생성 실패 시 (언어별 에러 포함)
+    """
+    if languages is None:
+        languages = config.SUPPORTED_LANGUAGES
+
+    outcomes = await asyncio.gather(
+        *(
+            agenerate_language_slice(
+                model_name,
+                prompt + "\n\n" + builder.build_language_directive(language),
+                language,
+                media
+            )
+            for language in languages
+        ),
+        return_exceptions=True
+    )
+
+    slices = {}
+    errors = []
+
+    for language, outcome in zip(languages, outcomes):
+        if isinstance(outcome, Exception):
+            errors.append(f"[{LANGUAGE_NAMES[language]}] {str(outcome)}")
+        else:
+            slices[language] = outcome
+
+    if errors:
+        raise Exception("언어별 병렬 생성 실패\n" + "\n".join(errors))
+
+    return merge_language_results(slices)
+
+
+async def agenerate_article_posts(article_text: str, article_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석", parallel: bool = None, force_regenerate: bool = False) -> dict:
+    """
+    generate_article_posts의 asyncio 버전
+
+    반환 형식과 에러 메시지는 generate_article_posts와 같습니다.
+    하나의 이벤트 루프에서 여러 기사를 동시에 생성할 수 있습니다:
+
+        results = await asyncio.gather(*(agenerate_article_posts(text) for text in articles))
+
+    Args:
+        article_text: 기사 본문
+        article_title: 기사 제목
+        site_name: 출처 사이트 이름 (기본값: "텐아시아")
+        tone_mode: 분량 모드 ("compact" 또는 "rich", 기본값: "rich")
+        content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        parallel: 언어별 병렬 생성 모드 사용 여부 (기본값: config.PARALLEL_GENERATION)
+        force_regenerate: True이면 결과 캐시를 무시하고 새로 생성 (기본값: False)
+
+    Returns:
+        JSON 형식의 SNS 게시물 딕셔너리 (RESPONSE_SCHEMA 준수)
+
+    Raises:
+        Exception: 생성 실패 시 명확한 에러 메시지와 함께 발생
+    """
+    if parallel is None:
+        parallel = config.PARALLEL_GENERATION
+
+    try:
+        ensure_configured()
+
+        # 모델 목록이 캐시되지 않은 경우 네트워크 조회가 발생하므로 스레드에서 실행
+        model_name, selection_reason = await asyncio.to_thread(resolve_model, config.ARTICLE_MODEL)
+        print(f"📝 [async] 기사 분석 시작 - {model_name} ({selection_reason})")
+
+        # 원본 본문 기준으로 축약 전에 조회
+        cache_key = build_article_cache_key(article_text, article_title, site_name, tone_mode, content_style, model_name)
+        cached_result = await asyncio.to_thread(get_cached_result, cache_key, force_regenerate)
+        if cached_result is not None:
+            return cached_result
+
+        # 예산에 가까운 본문은 count_tokens 네트워크 호출이 발생하므로 스레드에서 실행
+        article_text = await asyncio.to_thread(prepare_article_text, article_text, article_title, model_name)
+        builder = PromptBuilder(site_name, tone_mode, content_style)
+        prompt = builder.build_article_prompt(article_text, article_title)
+
+        if parallel:
+            result = await agenerate_posts_parallel(model_name, builder, prompt)
+        else:
+            response = await agenerate_article_response(model_name, builder, article_text, article_title, max_retries=config.MAX_RETRIES)
+            result = json.loads(response.text)
+
+        await asyncio.to_thread(store_cached_result, cache_key, result, model_name)
+
+        print(f"✅ [async] 기사 분석 완료: {article_title[:30] or '제목 없음'}")
+        return result
+
+    except json.JSONDecodeError as e:
+        error_msg = f"JSON 파싱 실패 (기사 분석 모드)\n\n"
+        error_msg += f"에러: {str(e)}\n"
+        error_msg += f"응답 길이: {len(response.text)} characters\n\n"
+        error_msg += "가능한 원인:\n"
+        error_msg += "1. 응답이 JSON 형식이 아님\n"
+        error_msg += "2. max_output_tokens 부족\n"
+        error_msg += "3. 모델이 스키마를 준수하지 않음"
+        raise Exception(error_msg)
+
+    except Exception as e:
+        error_msg = f"기사 분석 실패\n\n"
+        error_msg += f"에러: {str(e)}\n\n"
+        error_msg += "해결 방법:\n"
+        error_msg += f"1. 기사 내용이 올바른지 확인 (본문은 약 {config.ARTICLE_TOKEN_BUDGET} 토큰 이내로 자동 축약)\n"
+        error_msg += "2. API 키가 유효한지 확인\n"
+        error_msg += "3. 네트워크 연결 확인"
+        raise Exception(error_msg)
+
+
+async def agenerate_video_posts(video_path: str, video_metadata: str, video_title: str = "", site_name: str = "텐아시아", tone_mode: str = "rich", content_style: str = "심층/분석", parallel: bool = None, content_hash: str = None) -> dict:
+    """
+    generate_video_posts의 asyncio 버전
+
+    업로드와 처리 상태 폴링을 비동기로 대기하므로, 영상 처리를 기다리는 동안
+    같은 이벤트 루프의 다른 생성 요청이 계속 진행됩니다.
+
+    Args:
+        video_path: 다운로드된 영상 파일 경로
+        video_metadata: 영상 메타데이터 (길이, 조회수 등)
+        video_title: 영상 제목
+        site_name: 출처 사이트 이름 (기본값: "텐아시아")
+        tone_mode: 분량 모드 ("compact" 또는 "rich", 기본값: "rich")
+        content_style: 콘텐츠 스타일 (기본값: "심층/분석")
+        parallel: 언어별 병렬 생성 모드 사용 여부 (기본값: config.PARALLEL_GENERATION)
+        content_hash: 미리 계산한 영상 내용 해시 (선택, 업로드 재사용 키)
+
+    Returns:
+        JSON 형식의 SNS 게시물 딕셔너리 (RESPONSE_SCHEMA 준수)
+
+    Raises:
+        Exception: 생성 실패 시 명확한 에러 메시지와 함께 발생
+    """
+    uploaded_video_file = None
+
+    if parallel is None:
+        parallel = config.PARALLEL_GENERATION
+
+    try:
+        ensure_configured()
+
+        # 파일 존재 확인
+        if not os.path.exists(video_path):
+            raise Exception(f"영상 파일을 찾을 수 없습니다: {video_path}")
+
+        uploaded_video_file = await upload_video_file_async(video_path, content_hash)
+
+        builder = PromptBuilder(site_name, tone_mode, content_style)
+        prompt = builder.build_video_prompt(video_metadata, video_title)
+
+        model_name, selection_reason = await asyncio.to_thread(resolve_model, config.VIDEO_MODEL)
+        print(f"🎬 [async] 영상 분석 시작 - {model_name} ({selection_reason})")
+
+        if parallel:
+            result = await agenerate_posts_parallel(model_name, builder, prompt, media=uploaded_video_file)
+        else:
+            model = genai.GenerativeModel(
+                model_name,
+                safety_settings=SAFETY_SETTINGS,
+                generation_config=build_generation_config()
+            )
+            response = await safe_generate_content_async(model, [prompt, uploaded_video_file], max_retries=config.MAX_RETRIES)
+            result = json.loads(response.text)
+
+        print(f"✅ [async] 영상 분석 완료: {video_title[:30] or '제목 없음'}")
+        return result
+
+    except json.JSONDecodeError as e:
+        error_msg = f"JSON 파싱 실패 (영상 분석 모드)\n\n"
+        error_msg += f"에러: {str(e)}\n"
+        error_msg += f"응답 길이: {len(response.text)} characters\n\n"
+        error_msg += "가능한 원인:\n"
+        error_msg += "1. 응답이 JSON 형식이 아님\n"
+        error_msg += "2. max_output_tokens 부족\n"
+        error_msg += "3. 모델이 스키마를 준수하지 않음"
+        raise Exception(error_msg)
+
+    except Exception as e:
+        error_msg = f"영상 분석 실패\n\n"
+        error_msg += f"에러: {str(e)}\n\n"
+        error_msg += "해결 방법:\n"
+        error_msg += "1. 영상 파일이 손상되지 않았는지 확인\n"
+        error_msg += "2. 영상 길이가 너무 길지 않은지 확인 (5분 이하 권장)\n"
+        error_msg += "3. API 키가 유효한지 확인\n"
+        error_msg += "4. 네트워크 연결 확인"
+        raise Exception(error_msg)
+
+    finally:
+        # 클린업: 재사용 기록에 없는 원격 파일만 삭제
+        if uploaded_video_file:
+            await asyncio.to_thread(UPLOAD_REGISTRY.release, uploaded_video_file)
 
 
 def generate_sns_posts(article_text: str, article_title: str = "") -> dict:
@@ -1739,6 +2968,8 @@ def generate_sns_posts(article_text: str, article_title: str = "") -> dict:
         각 플랫폼별 게시물을 담은 딕셔너리
     """
     try:
+        ensure_configured()
+
         # Gemini 모델 초기화
         model = genai.GenerativeModel(config.ARTICLE_MODEL)
 
@@ -1,7 +1,9 @@
 import requests
 from typing import Dict, Optional
-from urllib.parse import urlparse
 import config
+from http_cache import cached_get, canonicalize_url
+from html_extractor import ArticleParseError, parser_for, to_markdown
+from site_registry import SITE_REGISTRY, Site
 
 
 def get_site_name(url: str) -> str:
@@ -12,37 +14,61 @@ def get_site_name(url: str) -> str:
         url: 기사 URL
 
     Returns:
-        사이트 이름 (한글)
+        사이트 이름 (한글, 지원하지 않는 사이트면 None)
     """
-    # 지원 언론사 도메인 매핑
-    site_mapping = {
-        "tenasia.co.kr": "텐아시아",
-        "hankyung.com": "한국경제"
-    }
+    site = SITE_REGISTRY.resolve(url)
+    return site.name if site else None
 
-    try:
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
 
-        # www. 제거
-        if domain.startswith("www."):
-            domain = domain[4:]
+def extract_direct(url: str, site: Site) -> Optional[Dict[str, Optional[str]]]:
+    """
+    전용 파서가 있는 사이트의 기사 페이지를 직접 받아 파싱합니다.
 
-        # 도메인 매핑에서 찾기
-        for key, name in site_mapping.items():
-            if key in domain:
-                return name
+    Args:
+        url: 기사 URL
+        site: URL의 언론사 (SITE_REGISTRY.resolve 결과)
 
-        # 지원하지 않는 사이트
+    Returns:
+        {"title", "content", "byline", "published"} 또는 None (전용 파서가 없거나 비활성화된 경우, 실패한 경우)
+    """
+    if not config.DIRECT_EXTRACT_ENABLED:
         return None
 
-    except Exception:
+    try:
+        # 파서 설정 오류(알 수 없는 템플릿 이름, "body" 누락 등)도 파싱 실패로 보고 Jina Reader 사용
+        parser = parser_for(site)
+        if parser is None:
+            return None
+
+        # Jina Reader 응답과 캐시 키가 겹치지 않도록 접두어 사용
+        response = cached_get(url, cache_key=f"direct:{canonicalize_url(url)}", timeout=config.DIRECT_EXTRACT_TIMEOUT, throttle=site.throttle)
+        if response["status_code"] != 200:
+            raise ArticleParseError(f"HTTP {response['status_code']}")
+
+        parsed = parser.parse(response["text"])
+
+    except Exception as e:
+        # ArticleParseError, 네트워크 오류, 파서 설정/HTML 파서 오류 모두 Jina Reader로 대체
+        print(f"⚠️  직접 추출 실패, Jina Reader 사용: {type(e).__name__} - {str(e)[:200]}")
         return None
 
+    return {
+        "title": parsed["title"],
+        "content": to_markdown(parsed),
+        "byline": parsed["byline"],
+        "published": parsed["published"],
+    }
+
 
 def extract_article(url: str) -> Dict[str, Optional[str]]:
     """
-    Jina Reader API를 사용하여 URL에서 기사 내용을 추출합니다.
+    URL에서 기사 내용을 추출합니다.
+
+    전용 파서가 있는 사이트는 기사 페이지를 직접 받아 파싱하고(extract_direct),
+    파싱에 실패하면 Jina Reader API를 사용합니다.
+
+    공용 커넥션 풀을 사용하며, 정규화된 기사 URL 기준으로 응답을 캐시합니다.
+    같은 URL을 동시에 여러 번 추출하면 하나의 요청으로 병합됩니다.
 
     Args:
         url: 기사 URL
@@ -54,41 +80,56 @@ def extract_article(url: str) -> Dict[str, Optional[str]]:
             "title": str or None,
             "content": str or None,
             "site_name": str or None,
+            "source": "direct" 또는 "jina" (성공 시),
             "error": str or None
         }
     """
     try:
-        # URL에서 사이트 이름 추출
-        site_name = get_site_name(url)
+        # URL의 언론사 확인
+        site = SITE_REGISTRY.resolve(url)
 
         # 지원하지 않는 사이트인 경우
-        if site_name is None:
+        if site is None:
             return {
                 "success": False,
                 "title": None,
                 "content": None,
                 "site_name": None,
-                "error": "지원하지 않는 언론사입니다. 현재 텐아시아와 한국경제만 지원합니다."
+                "error": f"지원하지 않는 언론사입니다. 현재 {', '.join(SITE_REGISTRY.names())}만 지원합니다."
+            }
+
+        site_name = site.name
+
+        # 기사 페이지 직접 파싱 (실패 시 Jina Reader)
+        direct = extract_direct(url, site)
+        if direct is not None:
+            return {
+                "success": True,
+                "title": direct["title"],
+                "content": direct["content"],
+                "site_name": site_name,
+                "source": "direct",
+                "error": None
             }
 
         # Jina Reader API 사용
         jina_url = f"https://r.jina.ai/{url}"
 
-        # 타임아웃 설정
-        response = requests.get(jina_url, timeout=config.API_TIMEOUT)
+        # 캐시 + 커넥션 풀 (캐시 키는 정규화된 기사 URL)
+        response = cached_get(jina_url, cache_key=canonicalize_url(url), timeout=config.API_TIMEOUT, throttle=site.throttle)
 
         # 응답 확인
-        if response.status_code != 200:
+        if response["status_code"] != 200:
             return {
                 "success": False,
                 "title": None,
                 "content": None,
                 "site_name": site_name,
-                "error": f"HTTP {response.status_code}: 기사를 가져올 수 없습니다."
+                "error": f"HTTP {response['status_code']}: 기사를 가져올 수 없습니다."
             }
 
         # 텍스트 추출
-        content = response.text.strip()
+        content = response["text"].strip()
 
         # 최소 길이 체크
         if not content or len(content) < 50:
@@ -110,6 +151,7 @@ def extract_article(url: str) -> Dict[str, Optional[str]]:
             "title": title,
             "content": content,
             "site_name": site_name,
+            "source": "jina",
             "error": None
         }
 
@@ -145,7 +187,7 @@ if __name__ == "__main__":
     # 테스트 코드
     test_url = "https://www.tenasia.co.kr/article/2026020679984"
     print("=" * 60)
-    print("Jina Reader API 기사 추출 테스트")
+    print("기사 추출 테스트")
     print("=" * 60)
     print(f"\nURL: {test_url}\n")
     print("추출 중...")
@@ -154,6 +196,7 @@ if __name__ == "__main__":
 
     if result["success"]:
         print(f"\n[SUCCESS] 추출 성공!")
+        print(f"\n추출 방식: {result['source']}")
         print(f"\n제목: {result['title']}")
         print(f"\n본문 (처음 500자):\n{result['content'][:500]}...")
         print(f"\n전체 길이: {len(result['content'])}자")
@@ -0,0 +1,244 @@
+"""
+장면 전환 기반 키프레임 선택 모듈
+
+균등 간격(total_frames // num_frames)으로 프레임을 고르면 정적인 인트로, 검은 화면,
+비슷한 장면이 MAX_FRAMES 예산을 차지합니다. 이 모듈은 영상을 저해상도로 한 번 훑어
+NumPy로 밝기 히스토그램 차이와 축소 이미지 차이를 한꺼번에 계산해 장면 전환을 찾고,
+장면마다 가장 정보량이 많은(히스토그램 엔트로피가 높은) 프레임을 후보로 삼습니다.
+후보 중 지각 해시(dHash)가 비슷한 프레임은 중복으로 제외하므로, 서로 다른 장면이 적은
+영상에서는 요청한 개수보다 적은 프레임만 반환합니다.
+"""
+
+import cv2
+import numpy as np
+from typing import List, Dict, Optional
+import config
+
+
+# 점수 계산용 축소 크기 (너비, 높이)와 히스토그램 구간 수
+THUMB_SIZE = (64, 36)
+HIST_BINS = 16
+
+# dHash 크기 (8x8 = 64비트)
+HASH_SIZE = 8
+
+
+def dhash(gray) -> np.ndarray:
+    """
+    흑백 이미지의 차이 해시(dHash)를 계산합니다.
+
+    Args:
+        gray: 흑백 이미지 (2차원 uint8 배열)
+
+    Returns:
+        64개의 bool 배열 (가로로 인접한 픽셀의 밝기 증감)
+    """
+    small = cv2.resize(gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    return (small[:, 1:] > small[:, :-1]).ravel()
+
+
+def sample_video(video_path: str, start: int = 0, end: Optional[int] = None, step: int = 1) -> Dict:
+    """
+    영상을 순방향으로 훑으며 step 프레임마다 저해상도 흑백 썸네일을 만듭니다.
+
+    디코딩은 grab()으로 진행하고 샘플 위치에서만 retrieve()하므로 색 변환과 축소는
+    샘플 프레임에만 적용됩니다.
+
+    Args:
+        video_path: 로컬 비디오 파일 경로
+        start: 시작 프레임 번호
+        end: 끝 프레임 번호 (포함하지 않음, None이면 영상 끝까지)
+        step: 샘플 간격 (프레임 수)
+
+    Returns:
+        {
+            "positions": 샘플 프레임 번호 배열 (n,),
+            "thumbs": 흑백 썸네일 배열 (n, 높이, 너비),
+            "hashes": dHash 배열 (n, 64)
+        }
+    """
+    positions, thumbs, hashes = [], [], []
+
+    cap = cv2.VideoCapture(video_path)
+
+    try:
+        if not cap.isOpened():
+            raise Exception("영상 파일을 열 수 없습니다")
+
+        if start > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+        position = start
+        while end is None or position < end:
+            if not cap.grab():
+                break
+
+            if (position - start) % step == 0:
+                ret, frame = cap.retrieve()
+                if ret and frame is not None and frame.size > 0:
+                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                    positions.append(position)
+                    thumbs.append(cv2.resize(gray, THUMB_SIZE, interpolation=cv2.INTER_AREA))
+                    hashes.append(dhash(gray))
+
+            position += 1
+
+    finally:
+        cap.release()
+
+    width, height = THUMB_SIZE
+    return {
+        "positions": np.array(positions, dtype=np.int64),
+        "thumbs": np.array(thumbs, dtype=np.uint8).reshape(-1, height, width),
+        "hashes": np.array(hashes, dtype=bool).reshape(-1, HASH_SIZE * HASH_SIZE),
+    }
+
+
+def score_samples(thumbs: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    썸네일 배열 전체에 대해 장면 전환 점수와 정보량을 한 번에 계산합니다.
+
+    Args:
+        thumbs: 흑백 썸네일 배열 (n, 높이, 너비)
+
+    Returns:
+        {
+            "cut": 직전 샘플 대비 변화량 (0~1, 첫 샘플은 1),
+            "entropy": 밝기 히스토그램 엔트로피 (0~1, 정보량),
+            "brightness": 평균 밝기 (0~255),
+            "contrast": 밝기 표준편차
+        }
+    """
+    n = len(thumbs)
+    flat = thumbs.reshape(n, -1)
+
+    # 샘플별 히스토그램: 샘플마다 구간 번호를 오프셋하여 bincount 한 번으로 계산
+    bins = (flat.astype(np.int64) * HIST_BINS) // 256
+    bins += (np.arange(n) * HIST_BINS)[:, None]
+    hist = np.bincount(bins.ravel(), minlength=n * HIST_BINS).reshape(n, HIST_BINS)
+    hist = hist / flat.shape[1]
+
+    # 히스토그램 차이(전체 색조 변화)와 픽셀 차이(구도/움직임 변화)를 함께 사용
+    cut = np.ones(n)
+    if n > 1:
+        hist_diff = 0.5 * np.abs(np.diff(hist, axis=0)).sum(axis=1)
+        pixel_diff = np.abs(np.diff(flat.astype(np.int16), axis=0)).mean(axis=1) / 255.0
+        cut[1:] = np.clip(0.5 * hist_diff + 2.0 * pixel_diff, 0.0, 1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy = -np.where(hist > 0, hist * np.log2(hist), 0.0).sum(axis=1) / np.log2(HIST_BINS)
+
+    return {
+        "cut": cut,
+        "entropy": entropy,
+        "brightness": flat.mean(axis=1),
+        "contrast": flat.std(axis=1),
+    }
+
+
+def rank_candidates(scores: Dict[str, np.ndarray]) -> List[int]:
+    """
+    장면별 대표 샘플을 정보량 순으로 정렬한 인덱스를 반환합니다.
+
+    검은 화면이나 단색 화면(밝기·대비가 기준 미만)은 제외합니다. 장면 대표가 먼저 오고,
+    그 뒤에 나머지 샘플이 정보량 순으로 이어집니다 (장면 수가 부족할 때 보충용).
+
+    Args:
+        scores: score_samples 결과
+
+    Returns:
+        샘플 인덱스 리스트
+    """
+    usable = (scores["brightness"] >= config.SCENE_MIN_BRIGHTNESS) & (scores["contrast"] >= config.SCENE_MIN_CONTRAST)
+
+    # 변화량이 기준을 넘는 샘플에서 새 장면이 시작
+    scene_ids = np.cumsum(scores["cut"] >= config.SCENE_CUT_THRESHOLD)
+
+    # 장면 대표의 점수에는 장면 전환의 세기를 더해, 뚜렷한 장면이 먼저 선택되도록 함
+    value = scores["entropy"]
+    representatives = []
+    for scene_id in np.unique(scene_ids):
+        members = np.flatnonzero((scene_ids == scene_id) & usable)
+        if len(members) == 0:
+            continue
+        best = members[np.argmax(value[members])]
+        strength = scores["cut"][np.flatnonzero(scene_ids == scene_id)[0]]
+        representatives.append((value[best] + strength, int(best)))
+
+    ordered = [index for _, index in sorted(representatives, reverse=True)]
+    chosen = set(ordered)
+    ordered += [int(index) for index in np.argsort(-value) if usable[index] and index not in chosen]
+    return ordered
+
+
+def sample_video_parallel(video_path: str, end: int, step: int, executor, segment_count: int) -> Dict:
+    """
+    영상을 segment_count개 구간으로 나누어 executor의 워커마다 sample_video를 실행하고 결과를 이어 붙입니다.
+
+    구간 경계를 step의 배수로 맞추어 순차 실행과 같은 위치가 샘플링됩니다.
+
+    Args:
+        video_path: 로컬 비디오 파일 경로
+        end: 끝 프레임 번호 (포함하지 않음)
+        step: 샘플 간격 (프레임 수)
+        executor: concurrent.futures 실행기 (ProcessPoolExecutor)
+        segment_count: 구간 수
+
+    Returns:
+        sample_video와 같은 형식의 딕셔너리
+    """
+    size = -(-end // segment_count)
+    size = -(-size // step) * step
+    bounds = [(start, min(end, start + size)) for start in range(0, end, size)]
+
+    futures = [executor.submit(sample_video, video_path, start, stop, step) for start, stop in bounds]
+    parts = [future.result() for future in futures]
+
+    return {key: np.concatenate([part[key] for part in parts]) for key in ("positions", "thumbs", "hashes")}
+
+
+def select_keyframes(video_path: str, num_frames: int, max_frame: Optional[int] = None, executor=None, segments: int = 1) -> List[int]:
+    """
+    장면 전환과 정보량을 기준으로 서로 다른 프레임 위치를 최대 num_frames개 선택합니다.
+
+    Args:
+        video_path: 로컬 비디오 파일 경로
+        num_frames: 최대 선택 개수
+        max_frame: 이 프레임 번호 이전까지만 분석 (None이면 영상 끝까지)
+        executor: 지정하면 구간별로 나누어 병렬 샘플링 (ProcessPoolExecutor)
+        segments: 병렬 샘플링 구간 수 (보통 워커 수)
+
+    Returns:
+        시간 순으로 정렬된 프레임 위치 리스트 (쓸 만한 프레임이 없으면 빈 리스트)
+    """
+    cap = cv2.VideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    step = max(1, int(round(fps / config.SCENE_SAMPLE_FPS)))
+    end = min(total_frames, max_frame) if max_frame else total_frames
+
+    if executor is not None and segments > 1 and end > 0:
+        samples = sample_video_parallel(video_path, end, step, executor, segments)
+    else:
+        samples = sample_video(video_path, end=max_frame, step=step)
+
+    if len(samples["positions"]) == 0:
+        return []
+
+    scores = score_samples(samples["thumbs"])
+    hashes = samples["hashes"]
+
+    # 지각 해시가 이미 선택된 프레임과 가까우면 중복으로 보고 제외
+    selected = []
+    for index in rank_candidates(scores):
+        if len(selected) >= num_frames:
+            break
+        if selected:
+            distances = np.count_nonzero(hashes[selected] != hashes[index], axis=1)
+            if distances.min() <= config.SCENE_HASH_DISTANCE:
+                continue
+        selected.append(index)
+
+    return sorted(int(samples["positions"][index]) for index in selected)
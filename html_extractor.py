@@ -0,0 +1,193 @@
+"""
+기사 HTML 직접 추출 모듈
+
+텐아시아와 한국경제의 기사 페이지는 서버에서 렌더링된 HTML이라 본문이 응답에 그대로 들어 있습니다.
+Jina Reader(r.jina.ai)를 거치면 원격 렌더링 단계가 한 번 더 생기므로, 이 모듈은 기사 URL을 직접 받아
+언론사별 선택자(config.SITES의 "parser")로 제목, 본문, 기자, 입력 시각을 파싱합니다.
+파싱에 실패하면(필수 요소가 없거나 본문이 너무 짧으면) ArticleParseError를 발생시키고,
+extractor.extract_article이 Jina Reader로 다시 추출합니다.
+
+BeautifulSoup 파서는 lxml이 설치되어 있으면 lxml을, 없으면 내장 html.parser를 사용합니다.
+"""
+
+import re
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+import config
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+
+BLOCK_TAGS = ["p", "div", "li", "h2", "h3", "h4", "blockquote"]
+
+
+class ArticleParseError(Exception):
+    """기사 HTML에서 필수 요소(제목, 본문)를 찾지 못했을 때 발생"""
+
+
+class SiteParser:
+    """
+    CSS 선택자 후보 목록으로 기사 요소를 찾는 파서
+
+    각 항목은 후보 선택자를 순서대로 시도하여 처음 찾은 값을 사용하고,
+    없으면 Open Graph / article 메타 태그를 사용합니다.
+    """
+
+    def __init__(self, title: List[str], body: List[str], byline: List[str], published: List[str], noise: List[str] = ()):
+        """
+        Args:
+            title: 제목 선택자 후보
+            body: 본문 컨테이너 선택자 후보
+            byline: 기자 이름 선택자 후보
+            published: 입력 시각 선택자 후보
+            noise: 본문에서 제거할 요소 선택자 (사진 설명, 광고, 관련 기사 등)
+        """
+        self.title = title
+        self.body = body
+        self.byline = byline
+        self.published = published
+        self.noise = ["script", "style", "noscript", "iframe", "figure", "figcaption", "table"] + list(noise)
+
+    def parse(self, html: str) -> Dict[str, Optional[str]]:
+        """
+        기사 HTML을 파싱합니다.
+
+        Args:
+            html: 기사 페이지 HTML
+
+        Returns:
+            {"title": str, "body": str, "byline": str or None, "published": str or None}
+
+        Raises:
+            ArticleParseError: 제목 또는 본문을 찾지 못했거나 본문이 너무 짧을 때
+        """
+        soup = BeautifulSoup(html, HTML_PARSER)
+
+        title = self._first_text(soup, self.title) or self._meta(soup, "og:title")
+        if not title:
+            raise ArticleParseError("제목을 찾을 수 없습니다")
+
+        container = self._first(soup, self.body)
+        if container is None:
+            raise ArticleParseError("본문 영역을 찾을 수 없습니다")
+
+        body = self._body_text(container)
+        if len(body) < config.DIRECT_EXTRACT_MIN_CHARS:
+            raise ArticleParseError(f"본문이 너무 짧습니다 ({len(body)}자)")
+
+        published = self._meta(soup, "article:published_time") or self._first_text(soup, self.published)
+
+        return {
+            "title": title,
+            "body": body,
+            "byline": self._first_text(soup, self.byline) or self._meta(soup, "dable:author"),
+            "published": published,
+        }
+
+    def _first(self, soup, selectors: List[str]):
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element is not None:
+                return element
+        return None
+
+    def _first_text(self, soup, selectors: List[str]) -> Optional[str]:
+        for selector in selectors:
+            element = soup.select_one(selector)
+            if element is not None:
+                text = " ".join(element.get_text(" ", strip=True).split())
+                if text:
+                    return text
+        return None
+
+    def _meta(self, soup, name: str) -> Optional[str]:
+        element = soup.find("meta", attrs={"property": name}) or soup.find("meta", attrs={"name": name})
+        content = element.get("content", "").strip() if element is not None else ""
+        return content or None
+
+    def _body_text(self, container) -> str:
+        """본문 컨테이너에서 잡음 요소를 제거하고 문단 단위 텍스트를 만듭니다 (<br>과 블록 요소 끝은 줄바꿈)."""
+        for selector in self.noise:
+            for element in container.select(selector):
+                element.decompose()
+
+        for br in container.find_all("br"):
+            br.replace_with("\n")
+
+        # 문장 중간의 <a>, <b> 등 인라인 요소에서는 줄을 나누지 않도록 블록 요소 끝에만 줄바꿈 삽입
+        for block in container.find_all(BLOCK_TAGS):
+            block.append("\n")
+
+        text = container.get_text()
+        lines = [" ".join(line.split()) for line in text.split("\n")]
+
+        # 본문 끝의 "홍길동 기자 abc@site.com" 같은 기자 서명 줄은 byline으로 따로 제공하므로 제외
+        lines = [line for line in lines if line and not (len(line) < 60 and EMAIL_PATTERN.search(line))]
+        return "\n\n".join(lines)
+
+
+# 이름으로 참조하는 파서 템플릿 (config.SITES의 "parser")
+PARSER_TEMPLATES = {
+    # 한국경제 계열 기사 템플릿 (텐아시아도 같은 기사 템플릿을 사용)
+    "hankyung": {
+        "title": ["h1.headline", "h1.news-tit", ".article-tit h1", "h1"],
+        "body": ["#articletxt", "div.article-body", "[itemprop=articleBody]"],
+        "byline": [".author .item", ".author-info .name", ".byline", "[rel=author]"],
+        "published": [".datetime .txt-date", ".article-timestamp .txt-date", "time"],
+        "noise": [".article-ad", ".ad-wrap", ".related-article", ".article-copyright", ".figure-caption"],
+    },
+}
+
+_parsers: Dict[str, SiteParser] = {}
+
+
+def parser_for(site) -> Optional[SiteParser]:
+    """
+    언론사에 맞는 파서를 반환합니다 (언론사별로 한 번만 생성).
+
+    Args:
+        site: site_registry.Site (parser가 템플릿 이름 또는 선택자 딕셔너리)
+
+    Returns:
+        SiteParser 또는 None (전용 파서가 없는 언론사)
+    """
+    if site is None or not site.parser:
+        return None
+
+    parser = _parsers.get(site.domain)
+    if parser is None:
+        spec = PARSER_TEMPLATES[site.parser] if isinstance(site.parser, str) else site.parser
+        parser = SiteParser(
+            title=spec.get("title", ["h1"]),
+            body=spec["body"],
+            byline=spec.get("byline", []),
+            published=spec.get("published", []),
+            noise=spec.get("noise", []),
+        )
+        _parsers[site.domain] = parser
+
+    return parser
+
+
+def to_markdown(parsed: Dict[str, Optional[str]]) -> str:
+    """
+    파싱 결과를 Jina Reader 결과와 같은 형태(첫 줄이 제목인 마크다운)로 만듭니다.
+
+    Args:
+        parsed: SiteParser.parse 결과
+
+    Returns:
+        "# 제목\\n\\n(기자, 입력 시각)\\n\\n본문" 형식의 텍스트
+    """
+    meta = " | ".join(value for value in (parsed.get("byline"), parsed.get("published")) if value)
+    parts = [f"# {parsed['title']}"]
+    if meta:
+        parts.append(meta)
+    parts.append(parsed["body"])
+    return "\n\n".join(parts)
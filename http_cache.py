@@ -0,0 +1,340 @@
+"""
+HTTP 요청 캐시 및 커넥션 풀 모듈
+
+- 공용 requests.Session (keep-alive 커넥션 재사용, TLS 핸드셰이크 절약)
+- 정규화된 URL 기준 디스크 응답 캐시 (TTL, ETag/Last-Modified 조건부 요청, 크기/사용 시각 기준 정리)
+- 같은 URL에 대한 동시 요청을 하나의 실제 요청으로 병합 (single-flight)
+- Content-Type에 charset이 없는 응답은 <meta charset> 또는 본문으로 추정한 인코딩으로 디코딩
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+from requests.adapters import HTTPAdapter
+import config
+
+
+# 캐시 키에서 제외할 광고/분석 추적 파라미터 (utm_*는 canonicalize_url에서 접두어로 제외)
+# ref 같은 일반적인 이름은 사이트에 따라 다른 페이지를 가리킬 수 있으므로 제외하지 않음
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "igshid", "mc_cid", "mc_eid"}
+
+# HTML 앞부분의 <meta charset="..."> / <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_PATTERN = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+
+_session = None
+_session_lock = threading.Lock()
+
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    공용 requests.Session을 반환합니다 (최초 호출 시 생성).
+
+    Returns:
+        커넥션 풀이 설정된 requests.Session
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=config.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=config.HTTP_POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    캐시 키로 사용할 정규화된 URL을 반환합니다.
+
+    스킴/호스트 소문자화, www. 제거, 프래그먼트 제거, 추적용 파라미터(utm_* 등) 제거,
+    쿼리 파라미터 정렬, 경로 끝의 슬래시 제거를 수행합니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(sorted(query)), ""))
+
+
+class HTTPResponseCache:
+    """
+    디스크 기반 HTTP 응답 캐시
+
+    캐시 키마다 JSON 파일 하나에 본문과 검증 헤더(ETag, Last-Modified)를 저장합니다.
+    TTL 이내의 항목은 그대로 사용하고, TTL이 지난 항목은 조건부 요청으로 재검증합니다.
+
+    파일의 수정 시각을 마지막 사용 시각으로 사용하며 (load 시 갱신), save() 후
+    전체 크기가 max_bytes를 넘거나 정리 주기가 지나면 sweep()으로
+    max_age 동안 사용하지 않은 항목과 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, directory: str = None, ttl: float = None, max_bytes: int = None, max_age: float = None):
+        self.directory = directory or config.HTTP_CACHE_DIR
+        self.ttl = config.HTTP_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = config.HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.max_age = config.HTTP_CACHE_MAX_AGE if max_age is None else max_age
+        self._lock = threading.Lock()
+        # 디렉토리 전체 크기 추정값 (첫 save 시 sweep으로 계산, 이후 기록한 크기만큼 증가)
+        self._total_bytes = None
+        self._next_sweep = 0.0
+
+    def _path(self, cache_key: str) -> str:
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def load(self, cache_key: str) -> Optional[dict]:
+        """
+        캐시 항목을 읽습니다.
+
+        Args:
+            cache_key: 정규화된 URL
+
+        Returns:
+            {"url", "text", "etag", "last_modified", "fetched_at"} 또는 None
+        """
+        try:
+            with open(self._path(cache_key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # 해시 충돌 방지
+        if entry.get("url") != cache_key:
+            return None
+
+        # 마지막 사용 시각 갱신 (정리 시 LRU 기준)
+        try:
+            os.utime(self._path(cache_key))
+        except OSError:
+            pass
+
+        return entry
+
+    def save(self, cache_key: str, entry: dict):
+        """
+        캐시 항목을 저장합니다 (임시 파일에 쓴 뒤 교체하여 부분 기록 방지).
+
+        Args:
+            cache_key: 정규화된 URL
+            entry: load()와 같은 형식의 딕셔너리
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(cache_key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(entry, url=cache_key), f, ensure_ascii=False)
+            size = f.tell()
+
+        os.replace(temp_path, path)
+
+        now = time.time()
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            needs_sweep = self._total_bytes is None or self._total_bytes > self.max_bytes or now >= self._next_sweep
+
+        if needs_sweep:
+            self.sweep()
+
+    def sweep(self):
+        """만료된 항목을 삭제하고, 크기 한도를 넘으면 오래 사용하지 않은 항목부터 삭제합니다."""
+        now = time.time()
+        entries = []
+
+        with self._lock:
+            self._next_sweep = now + config.HTTP_CACHE_SWEEP_INTERVAL
+
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                self._total_bytes = 0
+                return
+
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+
+            for mtime, size, path in entries:
+                if now - mtime <= self.max_age and total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                evicted += 1
+
+            self._total_bytes = total
+
+        if evicted:
+            print(f"🧹 HTTP 캐시 정리: {evicted}개 항목 삭제 (현재 {total / 1024:.1f} KB)")
+
+    def is_fresh(self, entry: dict) -> bool:
+        """TTL 이내의 항목인지 확인합니다."""
+        return time.time() - entry["fetched_at"] <= self.ttl
+
+
+HTTP_CACHE = HTTPResponseCache()
+
+
+def decode_response(response: requests.Response) -> str:
+    """
+    응답 본문을 문자열로 디코딩합니다.
+
+    requests는 Content-Type에 charset이 없는 text/* 응답을 ISO-8859-1로 디코딩하므로
+    한국어 페이지가 깨진 글자가 됩니다. 이 경우 HTML의 <meta charset>을, 없으면
+    본문 내용으로 추정한 인코딩(apparent_encoding)을 사용합니다.
+
+    Args:
+        response: requests 응답
+
+    Returns:
+        디코딩된 본문
+    """
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        return response.text
+
+    match = META_CHARSET_PATTERN.search(response.content[:4096])
+    encoding = match.group(1).decode("ascii") if match else response.apparent_encoding
+
+    try:
+        return response.content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return response.content.decode("utf-8", errors="replace")
+
+
+def _fetch(fetch_url: str, cache_key: str, timeout: float, throttle=None) -> dict:
+    """캐시를 확인하고 필요할 때만 네트워크 요청을 보냅니다 (single-flight 내부)."""
+    entry = HTTP_CACHE.load(cache_key)
+
+    if entry and HTTP_CACHE.is_fresh(entry):
+        print(f"💾 HTTP 캐시 사용: {cache_key}")
+        return {"status_code": 200, "text": entry["text"], "from_cache": True}
+
+    # 만료된 항목은 조건부 요청으로 재검증
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    if throttle is not None:
+        throttle()
+
+    response = get_session().get(fetch_url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and entry:
+        print(f"♻️  HTTP 캐시 재검증 완료 (304 Not Modified): {cache_key}")
+        entry["fetched_at"] = time.time()
+        try:
+            HTTP_CACHE.save(cache_key, entry)
+        except OSError as e:
+            # 캐시 저장 실패는 요청 결과에 영향을 주지 않음
+            print(f"⚠️  HTTP 캐시 저장 실패: {str(e)}")
+        return {"status_code": 200, "text": entry["text"], "from_cache": True}
+
+    text = decode_response(response)
+
+    if response.status_code == 200:
+        try:
+            HTTP_CACHE.save(cache_key, {
+                "text": text,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time()
+            })
+        except OSError as e:
+            # 캐시 저장 실패는 요청 결과에 영향을 주지 않음
+            print(f"⚠️  HTTP 캐시 저장 실패: {str(e)}")
+
+    return {"status_code": response.status_code, "text": text, "from_cache": False}
+
+
+def cached_get(fetch_url: str, cache_key: str = None, timeout: float = None, throttle=None) -> dict:
+    """
+    캐시와 커넥션 풀을 사용하여 GET 요청을 보냅니다.
+
+    같은 cache_key로 진행 중인 요청이 있으면 새 요청을 보내지 않고 그 결과를 기다립니다.
+
+    Args:
+        fetch_url: 실제로 요청할 URL
+        cache_key: 캐시 키 (기본값: canonicalize_url(fetch_url))
+        timeout: 요청 타임아웃 (초, 기본값: config.API_TIMEOUT)
+        throttle: 실제 네트워크 요청 직전에 호출할 함수 (예: 언론사별 속도 제한, 캐시 사용 시 호출 안 함)
+
+    Returns:
+        {"status_code": int, "text": str, "from_cache": bool}
+
+    Raises:
+        requests.exceptions.RequestException: 네트워크 오류 시
+    """
+    if cache_key is None:
+        cache_key = canonicalize_url(fetch_url)
+    if timeout is None:
+        timeout = config.API_TIMEOUT
+
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[cache_key] = future
+
+    if not is_leader:
+        print(f"⏳ 진행 중인 동일 요청 대기: {cache_key}")
+        return future.result()
+
+    try:
+        result = _fetch(fetch_url, cache_key, timeout, throttle)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
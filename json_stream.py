@@ -0,0 +1,156 @@
+"""
+증분(incremental) JSON 파서
+
+Gemini 스트리밍 응답처럼 JSON 텍스트가 조각(chunk) 단위로 도착할 때,
+전체 응답을 기다리지 않고 값이 완성되는 즉시 (경로, 값) 쌍을 돌려줍니다.
+
+예시:
+    parser = IncrementalJSONParser()
+    parser.feed('{"kr": {"x": "안녕')    # → []
+    parser.feed('하세요", "insta"')      # → [(("kr", "x"), "안녕하세요")]
+"""
+
+import json
+from typing import Any, List, Tuple
+
+
+# 스칼라 값(숫자, true/false/null)을 끝내는 문자
+_SCALAR_TERMINATORS = set(",}] \t\r\n")
+
+
+class IncrementalJSONParser:
+    """
+    조각 단위로 입력되는 JSON 텍스트에서 완성된 스칼라 값을 추출하는 파서
+
+    문자열은 닫는 따옴표가 도착한 순간, 숫자/불리언/null은 구분자가 도착한 순간
+    (경로, 값) 쌍으로 반환됩니다. 경로는 객체 키와 배열 인덱스의 튜플입니다.
+    """
+
+    def __init__(self):
+        # 컨테이너 스택: [{"type": "object"|"array", "key": str|None, "index": int}]
+        self._stack = []
+        self._in_string = False
+        self._is_key = False
+        self._escape = False
+        self._buffer = []
+        self._scalar = []
+        self.text_length = 0
+
+    def feed(self, chunk: str) -> List[Tuple[tuple, Any]]:
+        """
+        JSON 텍스트 조각을 입력합니다.
+
+        Args:
+            chunk: 새로 도착한 JSON 텍스트
+
+        Returns:
+            이번 조각에서 완성된 (경로 튜플, 값) 리스트
+
+        Raises:
+            ValueError: JSON 구조가 잘못된 경우
+        """
+        completed = []
+        self.text_length += len(chunk)
+
+        for char in chunk:
+            if self._in_string:
+                self._consume_string_char(char, completed)
+                continue
+
+            if self._scalar:
+                if char not in _SCALAR_TERMINATORS:
+                    self._scalar.append(char)
+                    continue
+                self._finish_scalar(completed)
+
+            if char in " \t\r\n":
+                continue
+            elif char == '"':
+                top = self._stack[-1] if self._stack else None
+                self._is_key = top is not None and top["type"] == "object" and top["key"] is None
+                self._in_string = True
+                self._buffer = []
+            elif char == "{":
+                self._stack.append({"type": "object", "key": None, "index": 0})
+            elif char == "[":
+                self._stack.append({"type": "array", "key": None, "index": 0})
+            elif char in "}]":
+                if not self._stack:
+                    raise ValueError(f"예상치 못한 닫는 괄호: {char}")
+                self._stack.pop()
+            elif char == ":":
+                continue
+            elif char == ",":
+                if not self._stack:
+                    raise ValueError("최상위 레벨의 쉼표")
+                top = self._stack[-1]
+                if top["type"] == "object":
+                    top["key"] = None
+                else:
+                    top["index"] += 1
+            else:
+                # 숫자, true, false, null 시작
+                self._scalar.append(char)
+
+        return completed
+
+    def _consume_string_char(self, char: str, completed: list):
+        """문자열 내부 문자를 처리합니다 (이스케이프 포함)."""
+        if self._escape:
+            self._buffer.append(char)
+            self._escape = False
+        elif char == "\\":
+            self._buffer.append(char)
+            self._escape = True
+        elif char == '"':
+            self._in_string = False
+            # 이스케이프 시퀀스(\n, \uXXXX 등)는 표준 json 모듈로 디코딩
+            value = json.loads('"' + "".join(self._buffer) + '"')
+            self._buffer = []
+
+            if self._is_key:
+                self._stack[-1]["key"] = value
+            else:
+                completed.append((self._current_path(), value))
+        else:
+            self._buffer.append(char)
+
+    def _finish_scalar(self, completed: list):
+        """누적된 숫자/불리언/null 토큰을 값으로 변환합니다."""
+        token = "".join(self._scalar)
+        self._scalar = []
+
+        try:
+            value = json.loads(token)
+        except json.JSONDecodeError:
+            raise ValueError(f"잘못된 JSON 값: {token}")
+
+        completed.append((self._current_path(), value))
+
+    def _current_path(self) -> tuple:
+        """현재 값의 경로를 계산합니다."""
+        path = []
+        for container in self._stack:
+            if container["type"] == "object":
+                path.append(container["key"])
+            else:
+                path.append(container["index"])
+        return tuple(path)
+
+    def close(self) -> List[Tuple[tuple, Any]]:
+        """
+        입력 종료를 알리고 남아있는 스칼라 값을 반환합니다.
+        (최상위 값이 숫자인 경우처럼 구분자 없이 끝나는 경우 대비)
+
+        Returns:
+            완성된 (경로 튜플, 값) 리스트
+        """
+        completed = []
+        if self._scalar:
+            self._finish_scalar(completed)
+        return completed
+
+    @property
+    def is_complete(self) -> bool:
+        """최상위 JSON 값이 모두 닫혔는지 여부"""
+        return not self._stack and not self._in_string and self.text_length > 0
@@ -0,0 +1,432 @@
+"""
+영상 처리 작업 공간(workspace) 관리 모듈
+
+같은 Streamlit 서버 프로세스의 세션들은 PID가 같으므로, PID로 만든 임시 파일 이름은
+동시에 실행된 YouTube 분석끼리 서로 덮어씁니다. 이 모듈은 작업(job)마다 고유한 디렉토리를
+만들어 주고, 다운로드한 영상은 YouTube 영상 ID를 키로 공용 저장소에 보관해 같은 영상을
+참조하는 작업끼리 재사용합니다.
+
+디렉토리 구조 (config.MEDIA_WORKSPACE_DIR 아래):
+- jobs/<pid>-<임의값>/   작업별 임시 파일 (작업 종료 시 삭제)
+- videos/<영상 ID>.mp4        공용 영상 (사용 중이 아닌 영상부터 LRU로 삭제)
+- videos/<영상 ID>.info.json  yt-dlp 정보 (메타데이터 조회를 네트워크 없이 처리, 영상과 함께 삭제)
+
+전체 디스크 사용량은 config.MEDIA_WORKSPACE_MAX_BYTES로 제한되며, 서버 시작 시에는
+이전 실행에서 남은 작업 디렉토리를 정리합니다.
+"""
+
+import os
+import json
+import time
+import uuid
+import shutil
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import config
+
+
+VIDEO_EXTENSION = ".mp4"
+INFO_EXTENSION = ".info.json"
+
+
+def _remove_tree(path: str):
+    """디렉토리를 삭제합니다 (이미 없으면 무시)."""
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _path_size(path: str) -> int:
+    """파일 또는 디렉토리 전체의 크기를 반환합니다 (바이트)."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+class MediaJob:
+    """
+    작업 하나의 전용 디렉토리와 사용 중인 공용 영상 목록
+
+    with 문으로 사용하면 블록을 벗어날 때 close()가 호출됩니다.
+    close()를 호출하지 않아도 객체가 수거되거나 프로세스가 종료될 때 디렉토리는 삭제됩니다.
+
+    Attributes:
+        job_id: 작업 식별자
+        dir: 작업 전용 디렉토리 경로
+    """
+
+    def __init__(self, workspace: "MediaWorkspace", job_id: str, path: str):
+        self.workspace = workspace
+        self.job_id = job_id
+        self.dir = path
+        self._videos: List[str] = []
+        self._closed = False
+        self._finalizer = weakref.finalize(self, _remove_tree, path)
+
+    def path(self, filename: str) -> str:
+        """작업 디렉토리 안의 파일 경로를 반환합니다."""
+        return os.path.join(self.dir, filename)
+
+    def acquire_video(self, video_id: str, download: Callable[[str], None]) -> str:
+        """
+        공용 저장소의 영상을 사용합니다 (없으면 download로 받아서 저장).
+
+        Args:
+            video_id: YouTube 영상 ID
+            download: 주어진 경로에 영상을 저장하는 함수
+
+        Returns:
+            공용 영상 파일 경로 (작업 종료 전까지 삭제되지 않음)
+        """
+        path = self.workspace._acquire_video(self, video_id, download)
+        self._videos.append(video_id)
+        return path
+
+    def close(self):
+        """사용 중인 영상을 반환하고 작업 디렉토리를 삭제합니다 (여러 번 호출해도 안전)."""
+        if self._closed:
+            return
+        self._closed = True
+
+        for video_id in self._videos:
+            self.workspace._release_video(video_id)
+        self._videos = []
+
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MediaWorkspace:
+    """
+    작업별 디렉토리와 영상 ID 기준 공용 영상 저장소를 관리합니다.
+
+    같은 프로세스 안에서는 영상 ID마다 잠금을 두어 같은 영상을 동시에 요청한 작업이
+    다운로드를 한 번만 하도록 하고, 참조 수가 0인 영상만 LRU 삭제 대상으로 삼습니다.
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = None):
+        self.root = root or config.MEDIA_WORKSPACE_DIR
+        self.max_bytes = max_bytes or config.MEDIA_WORKSPACE_MAX_BYTES
+        self.jobs_dir = os.path.join(self.root, "jobs")
+        self.videos_dir = os.path.join(self.root, "videos")
+
+        self._lock = threading.Lock()
+        self._video_locks: Dict[str, threading.Lock] = {}
+        self._refcounts: Dict[str, int] = {}
+        # 경로만 받은 호출자를 위한 작업 (release(path)로 종료, job_id → (경로, 작업), 오래된 순)
+        self._detached: "OrderedDict[str, Tuple[str, MediaJob]]" = OrderedDict()
+
+        self._startup_swept = False
+
+    def video_path(self, video_id: str) -> str:
+        """영상 ID의 공용 영상 파일 경로"""
+        return os.path.join(self.videos_dir, f"{video_id}{VIDEO_EXTENSION}")
+
+    def info_path(self, video_id: str) -> str:
+        """영상 ID의 정보(yt-dlp info dict) 파일 경로"""
+        return os.path.join(self.videos_dir, f"{video_id}{INFO_EXTENSION}")
+
+    def has_video(self, video_id: str) -> bool:
+        """공용 저장소에 영상 파일이 있는지 확인합니다."""
+        path = self.video_path(video_id)
+        return os.path.exists(path) and os.path.getsize(path) > 0
+
+    def load_info(self, video_id: str, max_age: float = None) -> Optional[dict]:
+        """
+        저장된 영상 정보를 읽습니다 (네트워크 접근 없음).
+
+        Args:
+            video_id: YouTube 영상 ID
+            max_age: 저장된 지 이보다 오래된 정보는 무시 (초, 기본값: config.MEDIA_INFO_TTL)
+
+        Returns:
+            정보 딕셔너리 또는 None (없거나 만료되었거나 읽을 수 없는 경우)
+        """
+        if max_age is None:
+            max_age = config.MEDIA_INFO_TTL
+
+        path = self.info_path(video_id)
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - record.get("saved_at", 0) > max_age:
+            return None
+
+        try:
+            os.utime(path)  # LRU 순서 갱신
+        except OSError:
+            pass
+
+        return record.get("info")
+
+    def save_info(self, video_id: str, info: dict):
+        """
+        영상 정보를 저장합니다 (임시 파일에 쓴 뒤 원자적으로 교체).
+
+        Args:
+            video_id: YouTube 영상 ID
+            info: JSON으로 저장 가능한 정보 딕셔너리
+        """
+        os.makedirs(self.videos_dir, exist_ok=True)
+
+        path = self.info_path(video_id)
+        temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"saved_at": time.time(), "info": info}, f, ensure_ascii=False, default=str)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️  영상 정보 저장 실패: {str(e)}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def start_job(self) -> MediaJob:
+        """
+        고유한 디렉토리를 가진 새 작업을 시작합니다.
+
+        Returns:
+            MediaJob 객체
+        """
+        self.sweep_once()
+
+        job_id = f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+        path = os.path.join(self.jobs_dir, job_id)
+        os.makedirs(path)
+
+        return MediaJob(self, job_id, path)
+
+    def detach(self, job: MediaJob, path: str) -> str:
+        """
+        경로만 넘겨받는 호출자를 위해 작업을 경로에 연결합니다.
+
+        호출자는 처리가 끝나면 release(path)를 호출해 작업을 종료합니다.
+        release되지 않은 작업이 config.MEDIA_DETACHED_MAX_JOBS개를 넘으면 가장 오래된 작업부터 종료하여
+        영상 참조 수가 영원히 남지 않도록 합니다.
+
+        Returns:
+            path (그대로)
+        """
+        with self._lock:
+            self._detached[job.job_id] = (os.path.abspath(path), job)
+            overflow = []
+            while len(self._detached) > config.MEDIA_DETACHED_MAX_JOBS:
+                overflow.append(self._detached.popitem(last=False)[1])
+
+        for old_path, old_job in overflow:
+            print(f"⚠️  release되지 않은 작업 종료: {old_job.job_id} ({old_path})")
+            old_job.close()
+
+        return path
+
+    def owns(self, path: str) -> bool:
+        """경로가 작업 공간 안에 있는지 확인합니다 (호출자가 직접 삭제하면 안 되는 파일)."""
+        root = os.path.abspath(self.root)
+        try:
+            return os.path.commonpath([root, os.path.abspath(path)]) == root
+        except ValueError:
+            return False  # 다른 드라이브 (Windows)
+
+    def release(self, path: str) -> bool:
+        """
+        detach로 경로에 연결된 작업 하나를 종료합니다.
+
+        Returns:
+            종료한 작업이 있으면 True
+        """
+        path = os.path.abspath(path)
+        job = None
+
+        with self._lock:
+            # 같은 경로에 연결된 작업이 여러 개면 가장 최근 작업부터 종료
+            for job_id, (job_path, detached_job) in reversed(self._detached.items()):
+                if job_path == path:
+                    job = detached_job
+                    del self._detached[job_id]
+                    break
+
+        if job is None:
+            return False
+
+        job.close()
+        return True
+
+    def _acquire_video(self, job: MediaJob, video_id: str, download: Callable[[str], None]) -> str:
+        with self._lock:
+            video_lock = self._video_locks.setdefault(video_id, threading.Lock())
+            # 다운로드 중에도 삭제 대상에서 제외되도록 먼저 참조 수 증가
+            self._refcounts[video_id] = self._refcounts.get(video_id, 0) + 1
+
+        target = self.video_path(video_id)
+
+        try:
+            with video_lock:
+                if self.has_video(video_id):
+                    print(f"♻️  저장된 영상 재사용: {video_id}")
+                    os.utime(target)  # LRU 순서 갱신
+                    return target
+
+                # 작업 디렉토리에 받은 뒤 원자적으로 옮겨 다른 작업이 미완성 파일을 보지 않도록 함
+                partial = job.path(f"{video_id}{VIDEO_EXTENSION}")
+                download(partial)
+
+                if not os.path.exists(partial):
+                    raise Exception("다운로드된 파일을 찾을 수 없습니다")
+
+                os.makedirs(self.videos_dir, exist_ok=True)
+                os.replace(partial, target)
+
+        except Exception:
+            self._release_video(video_id)
+            raise
+
+        self.enforce_limit()
+        return target
+
+    def _release_video(self, video_id: str):
+        with self._lock:
+            count = self._refcounts.get(video_id, 0) - 1
+            if count > 0:
+                self._refcounts[video_id] = count
+            else:
+                # 참조가 없으면 잠금을 기다리는 작업도 없으므로 영상별 잠금도 제거 (다음 사용 시 새로 생성)
+                self._refcounts.pop(video_id, None)
+                self._video_locks.pop(video_id, None)
+
+        self.enforce_limit()
+
+    def usage(self) -> int:
+        """작업 공간 전체의 디스크 사용량 (바이트)"""
+        return _path_size(self.root) if os.path.exists(self.root) else 0
+
+    def enforce_limit(self) -> int:
+        """
+        사용량이 한도를 넘으면 사용 중이 아닌 영상 항목(영상 + 정보 파일)을 오래 사용하지 않은 순서로 삭제합니다.
+
+        Returns:
+            삭제한 항목 수
+        """
+        try:
+            names = os.listdir(self.videos_dir)
+        except OSError:
+            return 0
+
+        usage = self.usage()
+        if usage <= self.max_bytes:
+            return 0
+
+        # 영상 ID별로 파일을 묶고, 가장 최근에 사용된 파일의 시각을 항목의 사용 시각으로 사용
+        entries: Dict[str, list] = {}
+        for name in names:
+            for suffix in (VIDEO_EXTENSION, INFO_EXTENSION):
+                if name.endswith(suffix):
+                    path = os.path.join(self.videos_dir, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        break
+                    entry = entries.setdefault(name[:-len(suffix)], [0.0, 0, []])
+                    entry[0] = max(entry[0], stat.st_mtime)
+                    entry[1] += stat.st_size
+                    entry[2].append(path)
+                    break
+
+        removed = 0
+        for video_id, (_, size, paths) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if usage <= self.max_bytes:
+                break
+
+            with self._lock:
+                if self._refcounts.get(video_id):
+                    continue
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+            usage -= size
+            removed += 1
+
+        if removed:
+            print(f"🧹 작업 공간 용량 초과: 오래된 영상 {removed}개 삭제 ({usage / (1024*1024):.1f} MB 사용 중)")
+
+        return removed
+
+    def sweep(self, max_age: float = None) -> int:
+        """
+        이전 실행에서 남은 작업 디렉토리를 삭제하고 용량 한도를 적용합니다.
+
+        현재 프로세스의 작업과 max_age보다 최근에 수정된 디렉토리(다른 서버 프로세스의 작업일 수 있음)는
+        남겨둡니다.
+
+        Args:
+            max_age: 이보다 오래 수정되지 않은 작업 디렉토리 삭제 (초, 기본값: config.MEDIA_JOB_MAX_AGE)
+
+        Returns:
+            삭제한 작업 디렉토리 수
+        """
+        if max_age is None:
+            max_age = config.MEDIA_JOB_MAX_AGE
+
+        try:
+            names = os.listdir(self.jobs_dir)
+        except OSError:
+            names = []
+
+        cutoff = time.time() - max_age
+        prefix = f"{os.getpid()}-"
+        removed = 0
+
+        for name in names:
+            path = os.path.join(self.jobs_dir, name)
+            try:
+                if name.startswith(prefix) or os.path.getmtime(path) >= cutoff:
+                    continue
+            except OSError:
+                continue
+            _remove_tree(path)
+            removed += 1
+
+        if removed:
+            print(f"🧹 이전 실행의 작업 디렉토리 {removed}개 삭제")
+
+        self.enforce_limit()
+        return removed
+
+    def sweep_once(self) -> int:
+        """
+        sweep을 프로세스당 한 번만 실행합니다 (Streamlit rerun 대응).
+
+        Returns:
+            삭제한 작업 디렉토리 수 (이미 실행된 경우 0)
+        """
+        with self._lock:
+            if self._startup_swept:
+                return 0
+            self._startup_swept = True
+
+        return self.sweep()
+
+
+# 공용 작업 공간 (프로세스당 하나)
+MEDIA_WORKSPACE = MediaWorkspace()
@@ -0,0 +1,166 @@
+"""
+Gemini 컨텍스트 캐시(cached content) 기반 프롬프트 접두어 캐시 모듈
+
+생성 요청마다 PromptBuilder.build_common_guidelines의 공통 가이드라인(페르소나, 톤 가이드,
+플랫폼 규칙, 바이럴 점수 기준 등 수 KB)이 그대로 반복되고 기사 본문만 바뀝니다.
+이 모듈은 (모델, 사이트, 분량 모드, 콘텐츠 스타일, 콘텐츠 종류, 템플릿 버전)마다 공통 가이드라인을
+Gemini의 cached content로 한 번 등록해 두고, 요청에는 기사 부분만 보내도록 합니다.
+입력 토큰 비용과 첫 토큰까지의 시간이 줄어듭니다.
+
+- 만료까지 config.PROMPT_CACHE_REFRESH_MARGIN초보다 적게 남으면 사용 시점에 TTL을 연장합니다.
+- 등록에 실패하면(예: 모델의 최소 캐시 토큰 수 미달, 캐시 미지원 모델) 해당 키는
+  config.PROMPT_CACHE_RETRY_AFTER초 동안 캐시 없이 전체 프롬프트를 보냅니다.
+- RESPONSE_SCHEMA는 generation_config에 속하므로 캐시 대상이 아니며 요청마다 함께 전달됩니다.
+- 서버의 cached content가 만료 전에 사라지면(다른 프로세스의 clear(delete_remote=True), 서버 측 삭제,
+  시계 차이) 생성 요청이 NotFound/PermissionDenied로 실패합니다. 이때 engine은 PromptCacheMiss를 받아
+  invalidate()로 기록을 지우고 전체 프롬프트로 한 번 다시 요청합니다.
+"""
+
+import time
+import datetime
+import threading
+from typing import Dict, Optional, Tuple
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import config
+
+
+# cached content가 서버에 없거나 접근할 수 없을 때 생성 요청에서 발생하는 에러
+CACHED_CONTENT_ERRORS = (
+    google_exceptions.NotFound,
+    google_exceptions.PermissionDenied,
+)
+
+
+class PromptCacheMiss(Exception):
+    """캐시를 사용하는 모델의 cached content가 서버에 없을 때 발생 (전체 프롬프트로 다시 요청해야 함)"""
+
+
+class PromptPrefixCache:
+    """
+    공통 프롬프트 접두어를 Gemini cached content로 관리하는 캐시
+
+    키별로 잠금을 두어 같은 접두어를 동시에 요청해도 등록은 한 번만 합니다.
+    """
+
+    def __init__(self, ttl: float = None, refresh_margin: float = None, retry_after: float = None):
+        self.ttl = ttl or config.PROMPT_CACHE_TTL
+        self.refresh_margin = refresh_margin or config.PROMPT_CACHE_REFRESH_MARGIN
+        self.retry_after = retry_after or config.PROMPT_CACHE_RETRY_AFTER
+
+        self._entries: Dict[Tuple, dict] = {}
+        self._failures: Dict[Tuple, float] = {}
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str, builder, content_type: str):
+        """
+        공통 가이드라인이 등록된 cached content를 반환합니다 (필요하면 등록 또는 TTL 연장).
+
+        Args:
+            model_name: 생성에 사용할 모델 이름
+            builder: PromptBuilder 인스턴스
+            content_type: "기사" 또는 "영상"
+
+        Returns:
+            genai.caching.CachedContent 또는 None (비활성화, 등록 실패 시)
+        """
+        if not config.PROMPT_CACHE_ENABLED:
+            return None
+
+        key = self.key_for(model_name, builder, content_type)
+
+        with self._lock:
+            if self._failures.get(key, 0) > time.time():
+                return None
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self._entries.get(key)
+            now = time.time()
+
+            if entry is not None and entry["expires_at"] - now > self.refresh_margin:
+                return entry["cached"]
+
+            try:
+                if entry is not None and entry["expires_at"] - now > 0:
+                    cached = self._extend(entry["cached"])
+                else:
+                    cached = self._create(model_name, builder, content_type)
+            except Exception as e:
+                print(f"⚠️  프롬프트 캐시 사용 불가 ({model_name}, {builder.content_style}): {type(e).__name__} - {str(e)[:200]}")
+                with self._lock:
+                    self._failures[key] = time.time() + self.retry_after
+                    self._entries.pop(key, None)
+                return None
+
+            with self._lock:
+                self._entries[key] = {"cached": cached, "expires_at": self._expires_at(cached)}
+            return cached
+
+    def key_for(self, model_name: str, builder, content_type: str) -> Tuple:
+        """(모델, 사이트, 분량 모드, 콘텐츠 스타일, 콘텐츠 종류, 템플릿 버전) 캐시 키"""
+        return (model_name, builder.site_name, builder.tone_mode, builder.content_style, content_type, builder.template_version())
+
+    def invalidate(self, key: Tuple):
+        """
+        키의 로컬 기록을 지웁니다 (서버의 cached content가 사라졌을 때).
+
+        다음 get()에서 새로 등록합니다.
+
+        Args:
+            key: key_for()로 만든 캐시 키
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            print(f"🧹 프롬프트 캐시 무효화: {getattr(entry['cached'], 'name', '')} ({key[1]}/{key[2]}/{key[3]})")
+
+    def _create(self, model_name: str, builder, content_type: str):
+        """공통 가이드라인을 system instruction으로 하는 cached content를 등록합니다."""
+        cached = genai.caching.CachedContent.create(
+            model=model_name,
+            display_name=f"prompt-prefix-{builder.content_style}-{builder.tone_mode}"[:128],
+            system_instruction=builder.build_common_guidelines(content_type),
+            ttl=datetime.timedelta(seconds=self.ttl)
+        )
+        print(f"🧠 프롬프트 캐시 등록: {cached.name} ({builder.site_name}/{builder.tone_mode}/{builder.content_style})")
+        return cached
+
+    def _extend(self, cached):
+        """만료가 가까운 cached content의 TTL을 연장합니다."""
+        cached.update(ttl=datetime.timedelta(seconds=self.ttl))
+        return cached
+
+    def _expires_at(self, cached) -> float:
+        """cached content의 만료 시각 (epoch 초, 서버 값이 없으면 TTL로 계산)"""
+        expire_time = getattr(cached, "expire_time", None)
+        if isinstance(expire_time, datetime.datetime):
+            if expire_time.tzinfo is None:
+                expire_time = expire_time.replace(tzinfo=datetime.timezone.utc)
+            return expire_time.timestamp()
+        return time.time() + self.ttl
+
+    def clear(self, delete_remote: bool = False):
+        """
+        로컬 기록을 비웁니다.
+
+        Args:
+            delete_remote: True면 서버의 cached content도 삭제 (TTL이 지나면 자동 삭제되므로 보통 불필요)
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._failures.clear()
+
+        if delete_remote:
+            for entry in entries:
+                try:
+                    entry["cached"].delete()
+                except Exception:
+                    pass
+
+
+# 공용 프롬프트 접두어 캐시 (프로세스당 하나)
+PROMPT_CACHE = PromptPrefixCache()
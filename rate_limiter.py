@@ -0,0 +1,386 @@
+"""
+Gemini API 클라이언트 측 요청 제한 모듈
+
+모델별 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 토큰 버킷으로 관리하여,
+429(ResourceExhausted) 에러가 나기 전에 요청 속도를 조절합니다.
+
+- 우선순위: "breaking"(속보) → "normal" → "backlog"(일괄 처리) 순으로 먼저 처리
+- 공정 큐: 같은 우선순위에서는 클라이언트(앱 세션, 일괄 처리 등)별로 번갈아 처리
+- 429 응답의 재시도 지연 힌트(RetryInfo)를 읽어 해당 모델의 모든 요청을 함께 대기
+
+사용 예시:
+    with request_context(priority="breaking", client="newsroom"):
+        generate_article_posts(...)
+"""
+
+import re
+import time
+import heapq
+import asyncio
+import itertools
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+import config
+
+
+_priority_var = contextvars.ContextVar("rate_limit_priority", default=None)
+_client_var = contextvars.ContextVar("rate_limit_client", default=None)
+
+
+@contextmanager
+def request_context(priority: str = None, client: str = None):
+    """
+    현재 컨텍스트에서 발생하는 Gemini 호출의 우선순위와 클라이언트를 지정합니다.
+
+    contextvars 기반이므로 asyncio 태스크와 asyncio.to_thread에도 전달됩니다.
+    (ThreadPoolExecutor에는 contextvars.copy_context().run으로 전달해야 합니다)
+
+    Args:
+        priority: 우선순위 클래스 (config.RATE_LIMIT_PRIORITIES의 키)
+        client: 공정 큐에서 사용할 클라이언트 이름
+    """
+    if priority is not None and priority not in config.RATE_LIMIT_PRIORITIES:
+        raise ValueError(f"알 수 없는 우선순위: {priority} (사용 가능: {', '.join(config.RATE_LIMIT_PRIORITIES)})")
+
+    tokens = []
+    if priority is not None:
+        tokens.append((_priority_var, _priority_var.set(priority)))
+    if client is not None:
+        tokens.append((_client_var, _client_var.set(client)))
+
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def parse_retry_delay(error: Exception) -> Optional[float]:
+    """
+    429 에러에서 서버가 알려준 재시도 지연 시간을 읽습니다.
+
+    google.api_core 예외의 details에 포함된 RetryInfo를 우선 사용하고,
+    없으면 에러 메시지의 "retry_delay { seconds: N }" / "retry in N s" 문구를 찾습니다.
+
+    Args:
+        error: API 예외
+
+    Returns:
+        대기 시간 (초) 또는 None
+    """
+    for detail in getattr(error, "details", None) or []:
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None:
+            return getattr(retry_delay, "seconds", 0) + getattr(retry_delay, "nanos", 0) / 1e9
+
+    message = str(error)
+
+    match = re.search(r"retry_delay\s*\{\s*seconds:\s*(\d+)(?:\s*nanos:\s*(\d+))?", message)
+    if match:
+        return int(match.group(1)) + int(match.group(2) or 0) / 1e9
+
+    match = re.search(r"retry in\s+([\d.]+)\s*s", message, re.IGNORECASE)
+    if match:
+        return float(match.group(1))
+
+    return None
+
+
+def estimate_tokens(contents) -> int:
+    """
+    요청이 사용할 토큰 수를 추정합니다 (입력 + 출력 예약분).
+
+    한국어/영어가 섞인 텍스트는 약 2자당 1토큰으로, 업로드 파일은
+    config.RATE_LIMIT_MEDIA_TOKENS로 계산합니다. 실제 사용량은 응답 후
+    RateLimiter.record_usage로 보정됩니다.
+
+    Args:
+        contents: 프롬프트 (문자열 또는 멀티모달 콘텐츠 리스트)
+
+    Returns:
+        추정 토큰 수
+    """
+    parts = contents if isinstance(contents, (list, tuple)) else [contents]
+
+    tokens = config.RATE_LIMIT_OUTPUT_TOKENS
+    for part in parts:
+        if isinstance(part, str):
+            tokens += len(part) // 2
+        else:
+            tokens += config.RATE_LIMIT_MEDIA_TOKENS
+
+    return tokens
+
+
+def response_token_count(response) -> Optional[int]:
+    """응답의 usage_metadata에서 실제 사용 토큰 수를 읽습니다 (없으면 None)."""
+    usage = getattr(response, "usage_metadata", None)
+    return getattr(usage, "total_token_count", None) or None
+
+
+def normalize_model_name(model) -> str:
+    """GenerativeModel 또는 모델 이름에서 "models/" 접두어를 제외한 이름을 반환합니다."""
+    name = model if isinstance(model, str) else getattr(model, "model_name", None) or "default"
+    return name.split("/", 1)[1] if name.startswith("models/") else name
+
+
+def _resolve(future):
+    """acquire_async 대기자를 깨웁니다 (이벤트 루프 스레드에서 실행)."""
+    if not future.done():
+        future.set_result(None)
+
+
+class TokenBucket:
+    """분당 허용량만큼 연속적으로 채워지는 토큰 버킷"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        """amount만큼 사용할 수 있을 때까지 남은 시간 (초)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float):
+        """실제 사용량 보정 (양수면 추가 차감, 음수면 반환)"""
+        self.tokens = max(-self.capacity, min(self.capacity, self.tokens - amount))
+
+
+class _ModelState:
+    """모델 하나의 RPM/TPM 버킷, 429 대기 시각, 대기열"""
+
+    def __init__(self, rpm: float, tpm: float):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.cooldown_until = 0.0
+        self.queue = []          # heap: (우선순위, 가상 시각, 순번)
+        self.virtual_time = 0    # 마지막으로 처리된 요청의 가상 시각
+        self.served = {}         # 클라이언트별 가상 시각
+
+
+class RateLimiter:
+    """
+    모델별 RPM/TPM 토큰 버킷과 우선순위 공정 큐
+
+    acquire()/acquire_async()는 대기열의 맨 앞 요청이 버킷에 여유가 생길 때까지 기다렸다가 통과시킵니다.
+    대기열 순서는 (우선순위, 클라이언트 가상 시각, 도착 순서)로, 같은 우선순위에서
+    요청이 많은 클라이언트가 다른 클라이언트를 밀어내지 못하도록 번갈아 처리합니다.
+    """
+
+    def __init__(self, limits: dict = None):
+        self.limits = limits or config.RATE_LIMITS
+        self._cond = threading.Condition()
+        self._models = {}
+        self._sequence = itertools.count()
+        self._async_waiters = []  # (이벤트 루프, Future): acquire_async 대기자
+
+    def _state(self, model_name: str) -> _ModelState:
+        """모델 상태를 반환합니다 (모델 이름의 가장 긴 접두어가 일치하는 한도 적용)."""
+        state = self._models.get(model_name)
+
+        if state is None:
+            matches = [key for key in self.limits if key != "default" and model_name.startswith(key)]
+            limit = self.limits[max(matches, key=len)] if matches else self.limits["default"]
+            state = _ModelState(limit["rpm"], limit["tpm"])
+            self._models[model_name] = state
+
+        return state
+
+    def _enqueue(self, model, tokens: int, priority: str, client: str) -> tuple:
+        """
+        대기열에 요청을 넣습니다 (self._cond 안에서 호출).
+
+        Returns:
+            (모델 상태, 티켓, 로그용 정보)
+        """
+        model_name = normalize_model_name(model)
+        priority = priority or _priority_var.get() or config.RATE_LIMIT_DEFAULT_PRIORITY
+        client = client or _client_var.get() or "default"
+        rank = config.RATE_LIMIT_PRIORITIES[priority]
+
+        state = self._state(model_name)
+
+        # 공정 큐: 오래 쉬었던 클라이언트도 현재 가상 시각부터 시작
+        virtual_start = max(state.served.get(client, 0), state.virtual_time)
+        ticket = (rank, virtual_start, next(self._sequence))
+        state.served[client] = virtual_start + 1
+        heapq.heappush(state.queue, ticket)
+
+        return state, ticket, (model_name, f"(우선순위: {priority}, 클라이언트: {client})")
+
+    def _try_pass(self, state: _ModelState, ticket: tuple, tokens: int) -> Optional[float]:
+        """
+        대기열 맨 앞이고 버킷에 여유가 있으면 통과시킵니다 (self._cond 안에서 호출).
+
+        Returns:
+            0 (통과), 더 기다릴 시간 (초), None (맨 앞이 아님, 다른 요청이 통과할 때까지 대기)
+        """
+        if state.queue[0] != ticket:
+            return None
+
+        now = time.monotonic()
+        wait_time = max(
+            state.cooldown_until - now,
+            state.requests.time_until(1, now),
+            state.tokens.time_until(tokens, now)
+        )
+
+        if wait_time > 0:
+            return wait_time
+
+        heapq.heappop(state.queue)
+        state.requests.consume(1)
+        state.tokens.consume(tokens)
+        state.virtual_time = ticket[1]
+        self._notify_all()
+        return 0
+
+    def _abandon(self, state: _ModelState, ticket: tuple):
+        """통과하지 못하고 중단된 요청을 대기열에서 뺍니다 (self._cond 안에서 호출)."""
+        if ticket in state.queue:
+            state.queue.remove(ticket)
+            heapq.heapify(state.queue)
+        self._notify_all()
+
+    def _notify_all(self):
+        """대기 중인 스레드와 asyncio 대기자를 모두 깨웁니다 (self._cond 안에서 호출)."""
+        self._cond.notify_all()
+
+        for loop, future in self._async_waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+        self._async_waiters.clear()
+
+    @staticmethod
+    def _report(waited: float, label: tuple):
+        if waited >= 1:
+            print(f"🚦 요청 제한 대기: {label[0]} {waited:.1f}초 {label[1]}")
+
+    def acquire(self, model, tokens: int = 0, priority: str = None, client: str = None) -> float:
+        """
+        요청 1건과 토큰 사용량을 예약합니다 (여유가 생길 때까지 대기).
+
+        Args:
+            model: GenerativeModel 또는 모델 이름
+            tokens: 예상 토큰 사용량
+            priority: 우선순위 클래스 (기본값: request_context 또는 config.RATE_LIMIT_DEFAULT_PRIORITY)
+            client: 클라이언트 이름 (기본값: request_context 또는 "default")
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if not config.RATE_LIMIT_ENABLED:
+            return 0.0
+
+        start = time.monotonic()
+
+        with self._cond:
+            state, ticket, label = self._enqueue(model, tokens, priority, client)
+
+            try:
+                while True:
+                    wait_time = self._try_pass(state, ticket, tokens)
+                    if wait_time == 0:
+                        break
+                    self._cond.wait(wait_time)
+            except BaseException:
+                # 대기 중 중단(KeyboardInterrupt 등)되면 대기열에서 빼서 뒤 요청이 막히지 않도록 함
+                self._abandon(state, ticket)
+                raise
+
+        waited = time.monotonic() - start
+        self._report(waited, label)
+        return waited
+
+    async def acquire_async(self, model, tokens: int = 0, priority: str = None, client: str = None) -> float:
+        """
+        acquire()의 asyncio 버전
+
+        스레드를 점유하지 않고 이벤트 루프에서 기다리므로 대기 중인 요청 수가 스레드 풀 크기에
+        묶이지 않습니다. 태스크가 취소되면 대기열에서 빠지므로 요청/토큰 한도를 쓰지 않습니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if not config.RATE_LIMIT_ENABLED:
+            return 0.0
+
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+
+        with self._cond:
+            state, ticket, label = self._enqueue(model, tokens, priority, client)
+
+        try:
+            while True:
+                with self._cond:
+                    wait_time = self._try_pass(state, ticket, tokens)
+                    if wait_time == 0:
+                        break
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+
+                try:
+                    await asyncio.wait_for(waiter[1], wait_time)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    with self._cond:
+                        if waiter in self._async_waiters:
+                            self._async_waiters.remove(waiter)
+        except BaseException:
+            # 취소(CancelledError) 등으로 중단되면 대기열에서 빼서 뒤 요청이 막히지 않도록 함
+            with self._cond:
+                self._abandon(state, ticket)
+            raise
+
+        waited = time.monotonic() - start
+        self._report(waited, label)
+        return waited
+
+    def record_usage(self, model, estimated_tokens: int, actual_tokens: Optional[int]):
+        """
+        실제 토큰 사용량으로 TPM 버킷을 보정합니다.
+
+        Args:
+            model: GenerativeModel 또는 모델 이름
+            estimated_tokens: acquire 시 예약한 토큰 수
+            actual_tokens: 응답의 실제 사용 토큰 수 (None이면 보정하지 않음)
+        """
+        if not config.RATE_LIMIT_ENABLED or actual_tokens is None:
+            return
+
+        with self._cond:
+            self._state(normalize_model_name(model)).tokens.adjust(actual_tokens - estimated_tokens)
+            self._notify_all()
+
+    def penalize(self, model, delay: float):
+        """
+        429 응답을 받은 모델의 모든 요청을 delay초 동안 멈춥니다.
+
+        Args:
+            model: GenerativeModel 또는 모델 이름
+            delay: 대기 시간 (초)
+        """
+        if not config.RATE_LIMIT_ENABLED:
+            return
+
+        with self._cond:
+            state = self._state(normalize_model_name(model))
+            state.cooldown_until = max(state.cooldown_until, time.monotonic() + delay)
+            self._notify_all()
+
+
+RATE_LIMITER = RateLimiter()
@@ -0,0 +1,211 @@
+"""
+생성 결과 캐시 모듈
+
+동일한 기사/스타일/모델 조합으로 SNS 게시물을 다시 생성할 때
+Gemini API를 호출하지 않고 저장된 결과를 재사용합니다.
+
+캐시 키는 정규화된 기사 본문, 제목, 사이트명, 분량 모드, 콘텐츠 스타일,
+실제 선택된 모델 이름, 프롬프트 템플릿 버전의 SHA-256 해시입니다.
+결과는 SQLite 파일에 저장되며 TTL과 크기 기반 LRU 정책으로 정리됩니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from typing import Optional
+import config
+
+
+def normalize_article_text(text: str) -> str:
+    """
+    캐시 키 계산을 위해 기사 텍스트를 정규화합니다.
+
+    유니코드 정규화(NFC), 줄바꿈 통일, 줄 단위 공백 정리를 수행하여
+    복사/붙여넣기 과정의 사소한 공백 차이로 캐시가 빗나가지 않도록 합니다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    if not text:
+        return ""
+
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    lines = [" ".join(line.split()) for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+def build_cache_key(article_text: str, article_title: str, site_name: str, tone_mode: str, content_style: str, model_name: str, template_version: str) -> str:
+    """
+    생성 결과 캐시 키를 계산합니다.
+
+    Args:
+        article_text: 기사 본문
+        article_title: 기사 제목
+        site_name: 출처 사이트 이름
+        tone_mode: 분량 모드
+        content_style: 콘텐츠 스타일
+        model_name: 실제 선택된 모델 이름 (변형 버전 포함)
+        template_version: 프롬프트 템플릿 버전
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    payload = json.dumps({
+        "text": normalize_article_text(article_text),
+        "title": normalize_article_text(article_title),
+        "site_name": site_name,
+        "tone_mode": tone_mode,
+        "content_style": content_style,
+        "model": model_name,
+        "template_version": template_version,
+    }, ensure_ascii=False, sort_keys=True)
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite 기반 생성 결과 캐시 (TTL + 크기 기반 LRU)
+
+    - get(): TTL이 지나지 않은 결과를 반환하고 마지막 접근 시각을 갱신
+    - put(): 결과를 저장한 뒤 전체 크기가 max_bytes를 넘으면
+             가장 오래 접근하지 않은 항목부터 삭제
+
+    DB 파일은 첫 사용 시점에 생성되므로 import 시 디스크 I/O가 발생하지 않습니다.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = None, ttl: float = None):
+        self.path = path or config.RESULT_CACHE_PATH
+        self.max_bytes = config.RESULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.ttl = config.RESULT_CACHE_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결을 (최초 1회) 생성하고 테이블을 준비합니다."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Streamlit 스크립트 스레드와 병렬 생성 스레드에서 함께 사용 (self._lock으로 직렬화)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed_at)")
+            conn.commit()
+            self._conn = conn
+
+        return self._conn
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        캐시된 생성 결과를 조회합니다.
+
+        Args:
+            key: build_cache_key로 계산한 키
+
+        Returns:
+            생성 결과 딕셔너리 (없거나 만료된 경우 None)
+        """
+        now = time.time()
+
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT payload, created_at FROM results WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            payload, created_at = row
+
+            if now - created_at > self.ttl:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+
+        return json.loads(payload)
+
+    def put(self, key: str, result: dict, model_name: str):
+        """
+        생성 결과를 저장하고 크기 한도를 넘으면 LRU 순서로 정리합니다.
+
+        Args:
+            key: build_cache_key로 계산한 키
+            result: 생성 결과 딕셔너리 (RESPONSE_SCHEMA 준수)
+            model_name: 결과를 생성한 모델 이름
+        """
+        payload = json.dumps(result, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, model, payload, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model_name, payload, size, now, now)
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """만료된 항목을 삭제하고, 크기 한도를 넘으면 오래 접근하지 않은 항목부터 삭제합니다."""
+        conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        print(f"🧹 결과 캐시 정리: {evicted}개 항목 삭제 (현재 {total / 1024:.1f} KB)")
+
+    def invalidate(self, key: str):
+        """특정 키의 캐시 항목을 삭제합니다."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            conn.commit()
+
+    def clear(self):
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM results")
+            conn.commit()
+
+    def stats(self) -> dict:
+        """
+        캐시 현황을 반환합니다.
+
+        Returns:
+            {"entries": 항목 수, "bytes": 전체 크기, "max_bytes": 크기 한도}
+        """
+        with self._lock:
+            conn = self._connect()
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+        return {"entries": entries, "bytes": total, "max_bytes": self.max_bytes}
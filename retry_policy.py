@@ -0,0 +1,383 @@
+"""
+Gemini API 재시도 정책 모듈
+
+모든 Gemini 호출 지점(일반/스트리밍/비동기 생성)이 하나의 재시도 정책을 공유합니다.
+
+- Full Jitter 지수 백오프: 대기 시간 = random(0, min(max_delay, base * 2^attempt))
+- 호출별 전체 마감 시간(deadline): 재시도 대기를 포함한 총 소요 시간 상한
+- 재시도 예산: 일정 시간 창(window) 안에서 허용되는 재시도 횟수 상한
+- 서킷 브레이커: 5xx 에러가 연속으로 발생하면 일정 시간 동안 호출을 즉시 차단
+- 지표: 재시도 횟수, 에러 종류별 횟수, 백오프로 소요된 시간, 포기 사유
+"""
+
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, Optional
+from google.api_core import exceptions as google_exceptions
+import config
+
+
+# 재시도 가능한 에러 (500, 429, 503, 타임아웃)
+RETRYABLE_ERRORS = (
+    google_exceptions.InternalServerError,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+)
+
+# 서킷 브레이커가 집계하는 서버 에러 (5xx)
+SERVER_ERRORS = (
+    google_exceptions.InternalServerError,
+    google_exceptions.ServiceUnavailable,
+)
+
+
+class RetryGiveUp(Exception):
+    """
+    재시도를 더 이상 하지 않기로 결정했을 때 발생하는 예외
+
+    Attributes:
+        reason: 포기 사유 ("exhausted", "deadline", "budget", "circuit")
+        last_error: 마지막으로 발생한 API 에러 (서킷 차단 시 None)
+        attempts: 실제로 시도한 횟수
+    """
+
+    def __init__(self, message: str, reason: str, last_error: Exception = None, attempts: int = 0):
+        super().__init__(message)
+        self.reason = reason
+        self.last_error = last_error
+        self.attempts = attempts
+
+
+class RetryBudget:
+    """시간 창(window) 안의 재시도 횟수를 제한하는 예산 (재시도 폭주 방지)"""
+
+    def __init__(self, max_retries: int, window: float):
+        self.max_retries = max_retries
+        self.window = window
+        self._spent = deque()
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """예산이 남아 있으면 1회 차감하고 True를 반환합니다."""
+        now = time.monotonic()
+
+        with self._lock:
+            while self._spent and now - self._spent[0] > self.window:
+                self._spent.popleft()
+
+            if len(self._spent) >= self.max_retries:
+                return False
+
+            self._spent.append(now)
+            return True
+
+
+class CircuitBreaker:
+    """
+    연속된 서버 에러(5xx)를 감지하는 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: failure_threshold회 연속 실패 후 reset_timeout초 동안 호출 즉시 차단
+    - half-open: reset_timeout 경과 후 시험 호출 1건만 허용 (성공 시 closed, 실패 시 다시 open)
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 가능 여부를 반환합니다 (half-open 상태에서는 시험 호출 1건만 허용)."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half-open"
+                self._probing = False
+
+            if self.state == "half-open" and not self._probing:
+                self._probing = True
+                return True
+
+            return False
+
+    def release(self):
+        """
+        결과를 기록하지 못하고 끝난 시험 호출을 해제합니다.
+
+        취소(asyncio.CancelledError)나 중단(KeyboardInterrupt)으로 시험 호출이 끝나면
+        record_success/record_failure가 호출되지 않으므로, 다음 호출이 다시 시험 호출을 할 수 있게 합니다.
+        """
+        with self._lock:
+            self._probing = False
+
+    def remaining(self) -> float:
+        """차단 해제까지 남은 시간 (초)"""
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self, error: Exception):
+        """에러를 기록합니다 (5xx만 연속 실패로 집계, 그 외 에러는 서버가 응답한 것으로 간주)."""
+        with self._lock:
+            if not isinstance(error, SERVER_ERRORS):
+                if self.state == "half-open":
+                    self.state = "closed"
+                    self._failures = 0
+                self._probing = False
+                return
+
+            self._failures += 1
+
+            if self.state == "half-open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"🔌 서킷 브레이커 열림: 서버 에러 {self._failures}회 연속 ({self.reset_timeout:.0f}초 동안 호출 차단)")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class RetryMetrics:
+    """재시도 지표 수집기 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.successes = 0
+            self.retries = 0
+            self.backoff_seconds = 0.0
+            self.errors = {}
+            self.gave_up = {"exhausted": 0, "deadline": 0, "budget": 0, "circuit": 0, "non_retryable": 0}
+
+    def record_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+
+    def record_error(self, error: Exception):
+        with self._lock:
+            name = type(error).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def record_retry(self, wait_time: float):
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += wait_time
+
+    def record_give_up(self, reason: str):
+        with self._lock:
+            self.gave_up[reason] += 1
+
+    def snapshot(self) -> dict:
+        """
+        현재 지표를 반환합니다.
+
+        Returns:
+            {"calls", "successes", "retries", "backoff_seconds",
+             "avg_backoff_per_call", "errors", "gave_up"}
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "successes": self.successes,
+                "retries": self.retries,
+                "backoff_seconds": round(self.backoff_seconds, 3),
+                "avg_backoff_per_call": round(self.backoff_seconds / self.calls, 3) if self.calls else 0.0,
+                "errors": dict(self.errors),
+                "gave_up": dict(self.gave_up),
+            }
+
+
+class RetryPolicy:
+    """
+    Full Jitter 백오프 + 마감 시간 + 재시도 예산 + 서킷 브레이커를 적용하는 재시도 정책
+
+    run()/run_async()에 전달하는 함수는 남은 마감 시간(초)을 인자로 받아
+    API 호출 타임아웃으로 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_retries: int = None, base_delay: float = None, max_delay: float = None, deadline: float = None, budget: RetryBudget = None, breaker: CircuitBreaker = None):
+        self.max_retries = config.MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = config.BASE_WAIT_TIME if base_delay is None else base_delay
+        self.max_delay = config.RETRY_MAX_DELAY if max_delay is None else max_delay
+        self.deadline = config.RETRY_DEADLINE if deadline is None else deadline
+        self.budget = budget or RetryBudget(config.RETRY_BUDGET, config.RETRY_BUDGET_WINDOW)
+        self.breaker = breaker or CircuitBreaker(config.CIRCUIT_FAILURE_THRESHOLD, config.CIRCUIT_RESET_TIMEOUT)
+        self.metrics = RetryMetrics()
+
+    def backoff(self, attempt: int) -> float:
+        """Full Jitter 대기 시간: random(0, min(max_delay, base * 2^attempt))"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _before_attempt(self, attempt: int, last_error: Exception):
+        """서킷 브레이커 상태를 확인합니다."""
+        if not self.breaker.allow():
+            self.metrics.record_give_up("circuit")
+            raise RetryGiveUp(
+                f"Gemini API 호출 일시 차단 (서버 에러 연속 발생, {self.breaker.remaining():.0f}초 후 재개)",
+                "circuit", last_error, attempt
+            )
+
+    def _next_wait(self, attempt: int, error: Exception, max_retries: int, started: float, delay_hook: Optional[Callable]) -> float:
+        """
+        에러 발생 후 다음 시도까지의 대기 시간을 결정합니다.
+
+        Raises:
+            RetryGiveUp: 재시도 횟수/마감 시간/재시도 예산을 모두 소진한 경우
+        """
+        error_type = type(error).__name__
+
+        if attempt == max_retries - 1:
+            self.metrics.record_give_up("exhausted")
+            raise RetryGiveUp(
+                f"API 호출 실패 (재시도 {max_retries}회 모두 실패): {error_type} - {str(error)}",
+                "exhausted", error, attempt + 1
+            )
+
+        wait_time = self.backoff(attempt)
+        if delay_hook:
+            wait_time = delay_hook(error, wait_time)
+
+        remaining = self.deadline - (time.monotonic() - started)
+        if wait_time >= remaining:
+            self.metrics.record_give_up("deadline")
+            raise RetryGiveUp(
+                f"API 호출 실패 (마감 시간 {self.deadline:.0f}초 초과, {attempt + 1}회 시도): {error_type} - {str(error)}",
+                "deadline", error, attempt + 1
+            )
+
+        if not self.budget.try_spend():
+            self.metrics.record_give_up("budget")
+            raise RetryGiveUp(
+                f"API 호출 실패 (재시도 예산 소진: {self.budget.window:.0f}초당 {self.budget.max_retries}회): {error_type} - {str(error)}",
+                "budget", error, attempt + 1
+            )
+
+        self.metrics.record_retry(wait_time)
+        return wait_time
+
+    def run(self, func: Callable[[float], object], max_retries: int = None, progress_callback=None, delay_hook: Callable = None):
+        """
+        재시도 정책을 적용하여 func를 실행합니다.
+
+        Args:
+            func: 남은 마감 시간(초)을 인자로 받는 호출 함수
+            max_retries: 최대 시도 횟수 (기본값: 정책의 max_retries)
+            progress_callback: 재시도 진행 상황을 알리는 콜백 함수 (선택)
+            delay_hook: (에러, 대기 시간) → 대기 시간, 429 재시도 힌트 반영 등에 사용 (선택)
+
+        Returns:
+            func의 반환값
+
+        Raises:
+            RetryGiveUp: 재시도 가능한 에러로 최종 실패한 경우
+            Exception: 재시도 불가능한 에러는 그대로 발생
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        started = time.monotonic()
+        last_error = None
+        self.metrics.record_call()
+
+        for attempt in range(max_retries):
+            self._before_attempt(attempt, last_error)
+
+            try:
+                result = func(self.deadline - (time.monotonic() - started))
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+                self.metrics.record_error(e)
+                self.breaker.record_failure(e)
+
+                wait_time = self._next_wait(attempt, e, max_retries, started, delay_hook)
+                self._notify(progress_callback, attempt, max_retries, wait_time, e)
+                time.sleep(wait_time)
+                continue
+            except Exception as e:
+                self.metrics.record_error(e)
+                self.metrics.record_give_up("non_retryable")
+                self.breaker.record_failure(e)
+                raise
+            except BaseException:
+                # 취소/중단: 성공도 실패도 아니므로 half-open 시험 호출만 해제하고 그대로 전파
+                self.breaker.release()
+                raise
+
+            self.breaker.record_success()
+            self.metrics.record_success()
+            return result
+
+    async def run_async(self, func: Callable, max_retries: int = None, progress_callback=None, delay_hook: Callable = None):
+        """
+        run()의 asyncio 버전 (func는 남은 마감 시간을 인자로 받는 코루틴 함수)
+
+        대기는 asyncio.sleep으로 처리하므로 이벤트 루프를 막지 않습니다.
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        started = time.monotonic()
+        last_error = None
+        self.metrics.record_call()
+
+        for attempt in range(max_retries):
+            self._before_attempt(attempt, last_error)
+
+            try:
+                result = await func(self.deadline - (time.monotonic() - started))
+            except RETRYABLE_ERRORS as e:
+                last_error = e
+                self.metrics.record_error(e)
+                self.breaker.record_failure(e)
+
+                wait_time = self._next_wait(attempt, e, max_retries, started, delay_hook)
+                self._notify(progress_callback, attempt, max_retries, wait_time, e)
+                await asyncio.sleep(wait_time)
+                continue
+            except Exception as e:
+                self.metrics.record_error(e)
+                self.metrics.record_give_up("non_retryable")
+                self.breaker.record_failure(e)
+                raise
+            except BaseException:
+                # 취소/중단: 성공도 실패도 아니므로 half-open 시험 호출만 해제하고 그대로 전파
+                self.breaker.release()
+                raise
+
+            self.breaker.record_success()
+            self.metrics.record_success()
+            return result
+
+    @staticmethod
+    def _notify(progress_callback, attempt: int, max_retries: int, wait_time: float, error: Exception):
+        """재시도 진행 상황 콜백 호출"""
+        print(f"⚠️  재시도 {attempt + 1}/{max_retries} - {wait_time:.1f}초 대기 ({type(error).__name__})")
+
+        if progress_callback:
+            progress_callback(
+                attempt=attempt + 1,
+                max_retries=max_retries,
+                wait_time=round(wait_time, 1),
+                error=f"{type(error).__name__}: {str(error)}"
+            )
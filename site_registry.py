@@ -0,0 +1,256 @@
+"""
+지원 언론사 레지스트리
+
+언론사마다 도메인, 한글/영문 이름, 출처 해시태그, 기사 파서, 기사 요청 속도 제한을 한곳에서 관리합니다.
+extractor(도메인 → 언론사, 파서), engine(영문 이름, 해시태그)이 모두 이 레지스트리를 사용합니다.
+
+- 언론사 목록은 config.SITES와 config.SITE_REGISTRY_PATH(JSON, 있으면)에서 읽으므로
+  코드 수정 없이 언론사를 추가할 수 있습니다.
+- 도메인은 라벨을 뒤집은 접미어 트라이(kr → co → tenasia)로 찾습니다. 조회 비용은 호스트의
+  라벨 수에만 비례하고 등록된 언론사 수와 무관하며, 가장 긴 일치 도메인을 사용하므로
+  www./m. 같은 하위 도메인은 같은 언론사로, "nottenasia.co.kr" 같은 다른 도메인은 별개로 구분됩니다.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+import config
+from rate_limiter import TokenBucket
+
+
+class Site:
+    """언론사 하나의 설정"""
+
+    def __init__(self, domain: str, name: str, name_en: str = None, hashtags: List[str] = None, parser=None, rate_limit: float = None, aliases: List[str] = ()):
+        """
+        Args:
+            domain: 대표 도메인 (예: "tenasia.co.kr")
+            name: 한글 이름 (프롬프트와 결과의 출처 표기)
+            name_en: 영문 이름 (기본값: name)
+            hashtags: 출처 해시태그 ("#" 제외, 기본값: [name, name_en])
+            parser: html_extractor.PARSER_TEMPLATES의 이름 또는 선택자 딕셔너리 (None이면 Jina Reader만 사용)
+            rate_limit: 이 언론사로 보내는 기사 요청의 분당 최대 수 (None이면 제한 없음)
+            aliases: 같은 언론사로 볼 추가 도메인
+        """
+        self.domain = normalize_host(domain)
+        self.name = name
+        self.name_en = name_en or name
+        self.hashtags = list(hashtags) if hashtags else list(dict.fromkeys([name, self.name_en]))
+        self.parser = parser
+        self.rate_limit = rate_limit
+        self.aliases = [normalize_host(alias) for alias in aliases]
+
+        self._bucket = TokenBucket(rate_limit) if rate_limit else None
+        self._lock = threading.Lock()
+
+    def throttle(self) -> float:
+        """
+        rate_limit을 넘지 않도록 필요하면 기다린 뒤 요청 1건을 예약합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self._bucket is None:
+            return 0.0
+
+        waited = 0.0
+        with self._lock:
+            wait = self._bucket.time_until(1, time.monotonic())
+            while wait > 0:
+                print(f"⏳ {self.name} 요청 속도 제한: {wait:.1f}초 대기")
+                time.sleep(wait)
+                waited += wait
+                wait = self._bucket.time_until(1, time.monotonic())
+            self._bucket.consume(1)
+        return waited
+
+    def hashtag_text(self) -> str:
+        """출처 해시태그 문자열 (예: "#텐아시아 #TenAsia")"""
+        return " ".join(f"#{tag}" for tag in self.hashtags)
+
+    def __repr__(self) -> str:
+        return f"Site({self.domain!r}, {self.name!r})"
+
+
+def normalize_host(value: str) -> str:
+    """
+    URL 또는 호스트에서 비교용 호스트 이름을 만듭니다 (소문자, 포트/끝의 점 제거).
+
+    Args:
+        value: "https://www.tenasia.co.kr/article/1" 또는 "www.tenasia.co.kr"
+
+    Returns:
+        "www.tenasia.co.kr"
+    """
+    value = (value or "").strip().lower()
+    if "://" not in value:
+        value = "//" + value
+    return (urlsplit(value).hostname or "").rstrip(".")
+
+
+class SiteRegistry:
+    """
+    도메인 접미어 트라이 기반 언론사 레지스트리
+
+    트라이 노드는 {"children": {라벨: 노드}, "site": Site 또는 None} 형태이며,
+    resolve()는 호스트의 마지막 라벨부터 내려가며 마지막으로 만난 Site를 반환합니다.
+    """
+
+    def __init__(self, sites: Dict[str, dict] = None, path: str = None):
+        """
+        Args:
+            sites: {도메인: Site 인자 딕셔너리} (기본값: config.SITES)
+            path: 추가 언론사 JSON 파일 경로 (기본값: config.SITE_REGISTRY_PATH, 없으면 무시)
+        """
+        self._root = {"children": {}, "site": None}
+        self._by_name: Dict[str, Site] = {}
+        self._lock = threading.Lock()
+
+        for domain, options in (config.SITES if sites is None else sites).items():
+            self.register(domain, **options)
+
+        path = config.SITE_REGISTRY_PATH if path is None else path
+        if path and os.path.exists(path):
+            self.load_file(path)
+
+    def register(self, domain: str, **options) -> Site:
+        """
+        언론사를 등록합니다 (같은 도메인이 이미 있으면 교체).
+
+        Args:
+            domain: 대표 도메인
+            **options: Site 인자 (name, name_en, hashtags, parser, rate_limit, aliases)
+
+        Returns:
+            등록된 Site
+        """
+        site = Site(domain, **options)
+
+        with self._lock:
+            # 같은 도메인의 기존 언론사는 이름과 모든 도메인(별칭 포함)을 지운 뒤 등록
+            previous = self._exact(site.domain)
+            if previous is not None:
+                self._unregister(previous)
+
+            for host in [site.domain] + site.aliases:
+                node = self._root
+                for label in reversed(host.split(".")):
+                    node = node["children"].setdefault(label, {"children": {}, "site": None})
+                node["site"] = site
+            self._by_name[site.name] = site
+
+        return site
+
+    def _exact(self, host: str) -> Optional[Site]:
+        """host에 정확히 등록된 언론사 (하위 도메인 일치 제외)"""
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node["children"].get(label)
+            if node is None:
+                return None
+        return node["site"]
+
+    def _unregister(self, site: Site):
+        """언론사의 이름과 트라이 노드를 지웁니다 (빈 노드는 정리, self._lock 안에서 호출)."""
+        if self._by_name.get(site.name) is site:
+            del self._by_name[site.name]
+
+        for host in [site.domain] + site.aliases:
+            path = [self._root]
+            labels = list(reversed(host.split(".")))
+            for label in labels:
+                node = path[-1]["children"].get(label)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                if path[-1]["site"] is site:
+                    path[-1]["site"] = None
+
+                # 언론사도 자식도 없는 노드를 아래에서부터 제거
+                for depth in range(len(labels), 0, -1):
+                    if path[depth]["site"] is not None or path[depth]["children"]:
+                        break
+                    del path[depth - 1]["children"][labels[depth - 1]]
+
+    def load_file(self, path: str) -> int:
+        """
+        JSON 파일({도메인: Site 인자})의 언론사를 등록합니다.
+
+        레지스트리는 import 시점에 만들어지므로, 파일이 잘못되어도 앱 시작을 막지 않도록
+        읽을 수 없는 파일은 무시하고 잘못된 항목은 건너뜁니다.
+
+        Args:
+            path: JSON 파일 경로
+
+        Returns:
+            등록한 언론사 수
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                sites = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  언론사 파일을 읽을 수 없어 무시합니다: {path} ({type(e).__name__} - {str(e)[:200]})")
+            return 0
+
+        if not isinstance(sites, dict):
+            print(f"⚠️  언론사 파일 형식이 잘못되어 무시합니다: {path} ({{도메인: 설정}} 객체가 아님)")
+            return 0
+
+        count = 0
+        for domain, options in sites.items():
+            try:
+                self.register(domain, **options)
+                count += 1
+            except (TypeError, ValueError) as e:
+                print(f"⚠️  잘못된 언론사 항목 건너뜀: {domain} ({type(e).__name__} - {str(e)[:200]})")
+
+        print(f"📰 언론사 {count}개 추가 등록: {path}")
+        return count
+
+    def resolve(self, url_or_host: str) -> Optional[Site]:
+        """
+        URL 또는 호스트에 해당하는 언론사를 찾습니다 (가장 긴 일치 도메인).
+
+        Args:
+            url_or_host: 기사 URL 또는 호스트 이름
+
+        Returns:
+            Site 또는 None (지원하지 않는 언론사)
+        """
+        host = normalize_host(url_or_host)
+        if not host:
+            return None
+
+        node = self._root
+        found = None
+        for label in reversed(host.split(".")):
+            node = node["children"].get(label)
+            if node is None:
+                break
+            found = node["site"] or found
+        return found
+
+    def by_name(self, name: str) -> Optional[Site]:
+        """한글 이름으로 언론사를 찾습니다."""
+        return self._by_name.get(name)
+
+    def english_name(self, name: str) -> str:
+        """한글 이름의 영문 이름 (등록되지 않은 이름은 그대로 반환)"""
+        site = self._by_name.get(name)
+        return site.name_en if site else name
+
+    def names(self) -> List[str]:
+        """등록된 언론사의 한글 이름 목록 (등록 순서)"""
+        return list(self._by_name)
+
+    def sites(self) -> List[Site]:
+        """등록된 언론사 목록 (등록 순서)"""
+        return list(self._by_name.values())
+
+
+# 공용 언론사 레지스트리 (프로세스당 하나)
+SITE_REGISTRY = SiteRegistry()
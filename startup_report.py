@@ -0,0 +1,199 @@
+"""
+앱 시작 시간 리포트
+
+app.py가 import하는 모듈들을 `python -X importtime`으로 새 프로세스에서 import하여
+모듈별 import 시간을 집계하고, config.STARTUP_TIME_BUDGET과 비교합니다.
+
+사용법:
+    python startup_report.py            # 상위 20개 모듈 리포트
+    python startup_report.py --top 50   # 상위 50개 모듈 리포트
+
+예산을 초과하면 종료 코드 1을 반환하므로 CI에서 회귀 검사용으로 사용할 수 있습니다.
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import config
+
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def get_app_imports(app_path: str = APP_PATH) -> List[str]:
+    """
+    app.py의 최상위 import 문에서 모듈 이름을 추출합니다.
+
+    app.py를 직접 import하면 Streamlit 화면 코드까지 실행되므로,
+    import 문만 분석하여 동일한 모듈 집합을 측정합니다.
+
+    Args:
+        app_path: app.py 경로
+
+    Returns:
+        import되는 모듈 이름 리스트 (등장 순서 유지)
+    """
+    with open(app_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=app_path)
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module]
+        else:
+            continue
+
+        for name in names:
+            if name not in modules:
+                modules.append(name)
+
+    return modules
+
+
+def run_importtime(modules: List[str]) -> Tuple[float, str]:
+    """
+    새 인터프리터에서 `-X importtime`으로 모듈을 import합니다.
+
+    Args:
+        modules: import할 모듈 이름 리스트
+
+    Returns:
+        tuple: (전체 소요 시간(초), importtime stderr 출력)
+
+    Raises:
+        Exception: import 실패 시
+    """
+    code = "; ".join(f"import {m}" for m in modules)
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(APP_PATH),
+        capture_output=True,
+        text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    if proc.returncode != 0:
+        # importtime 라인을 제외한 실제 에러 메시지만 전달
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise Exception("모듈 import 실패:\n" + "\n".join(errors))
+
+    return elapsed, proc.stderr
+
+
+def parse_importtime(output: str) -> List[Dict]:
+    """
+    `-X importtime` 출력을 파싱합니다.
+
+    출력 형식: "import time: self [us] | cumulative | imported package"
+
+    Args:
+        output: importtime stderr 출력
+
+    Returns:
+        모듈별 {"module", "self_us", "cumulative_us", "depth"} 리스트
+    """
+    entries = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 라인
+
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        entries.append({
+            "module": module,
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            # 들여쓰기 2칸당 한 단계 (최상위 import는 depth 0)
+            "depth": (len(name) - len(module) - 1) // 2
+        })
+
+    return entries
+
+
+def print_report(modules: List[str], elapsed: float, entries: List[Dict], top: int = 20) -> bool:
+    """
+    import 시간 리포트를 출력하고 예산 충족 여부를 반환합니다.
+
+    Args:
+        modules: 측정한 모듈 이름 리스트
+        elapsed: 전체 프로세스 소요 시간 (초)
+        entries: parse_importtime 결과
+        top: 출력할 상위 모듈 수
+
+    Returns:
+        예산 이내면 True
+    """
+    # 인터프리터 기동 시 import되는 모듈(encodings, site 등)은 제외
+    site_index = next((i for i, e in enumerate(entries) if e["depth"] == 0 and e["module"] == "site"), -1)
+    entries = entries[site_index + 1:]
+
+    top_level = [e for e in entries if e["depth"] == 0]
+    import_total = sum(e["cumulative_us"] for e in top_level) / 1_000_000
+    budget = config.STARTUP_TIME_BUDGET
+
+    print("=" * 70)
+    print("⏱️  app.py 시작 시간 리포트 (python -X importtime)")
+    print("=" * 70)
+    print(f"측정 모듈: {', '.join(modules)}\n")
+
+    # app.py가 직접 import하는 모듈별 누적 시간
+    print("📦 app.py import 모듈별 누적 시간:")
+    for module in modules:
+        entry = next((e for e in top_level if e["module"] == module), None)
+        if entry is None:
+            # 이미 다른 모듈에 의해 import된 경우
+            entry = next((e for e in entries if e["module"] == module), None)
+        cumulative = entry["cumulative_us"] / 1000 if entry else 0.0
+        print(f"   {module:<40} {cumulative:>10.1f} ms")
+
+    # 전체 모듈 중 self 시간 상위
+    print(f"\n🐢 self 시간 상위 {top}개 모듈:")
+    for entry in sorted(entries, key=lambda e: e["self_us"], reverse=True)[:top]:
+        print(f"   {entry['module']:<50} {entry['self_us'] / 1000:>10.1f} ms")
+
+    within_budget = import_total <= budget
+
+    print("\n" + "=" * 70)
+    print(f"📊 import 합계: {import_total:.3f}초 (프로세스 전체: {elapsed:.3f}초)")
+    print(f"🎯 시작 시간 예산: {budget:.3f}초")
+    print(f"{'✅ 예산 이내' if within_budget else '❌ 예산 초과'}")
+    print("=" * 70)
+
+    return within_budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app.py import 시간 리포트")
+    parser.add_argument("--top", type=int, default=20, help="출력할 상위 모듈 수 (기본값: 20)")
+    args = parser.parse_args()
+
+    modules = get_app_imports()
+
+    try:
+        elapsed, output = run_importtime(modules)
+    except Exception as e:
+        print(f"❌ {str(e)}")
+        sys.exit(2)
+
+    entries = parse_importtime(output)
+    within_budget = print_report(modules, elapsed, entries, top=args.top)
+
+    sys.exit(0 if within_budget else 1)
+
+
+if __name__ == "__main__":
+    main()
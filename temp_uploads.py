@@ -0,0 +1,166 @@
+"""
+업로드된 영상의 로컬 임시 파일 관리 모듈
+
+Streamlit 업로드 파일을 통째로 read()하지 않고 고정 크기 청크로 디스크에 기록하면서
+SHA-256 해시를 함께 계산합니다. 해시는 UPLOAD_REGISTRY.get_or_upload(content_hash=...)의
+중복 제거 키로 그대로 사용되어 업로드 후 파일을 다시 읽지 않아도 됩니다.
+
+임시 파일은 config.UPLOAD_TEMP_DIR 아래에 만들어지고 다음 시점에 삭제됩니다.
+- 세션에서 다른 파일로 교체되거나 업로드가 해제될 때 (cleanup)
+- 세션이 종료되어 TempUpload 객체가 사라질 때 (weakref.finalize)
+- 프로세스 종료 시 (finalize의 atexit 동작)
+- 서버 시작 시 config.UPLOAD_TEMP_MAX_AGE보다 오래된 파일 (sweep_stale_uploads)
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+import threading
+import weakref
+import config
+
+
+_startup_sweep_lock = threading.Lock()
+_startup_swept = False
+
+
+def _remove_file(path: str):
+    """파일을 삭제합니다 (이미 없으면 무시)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class TempUpload:
+    """
+    디스크에 저장된 업로드 파일 하나
+
+    Attributes:
+        path: 임시 파일 경로
+        content_hash: 파일 내용의 SHA-256 해시
+        size: 파일 크기 (바이트)
+        filename: 원본 파일 이름
+        source_id: 업로드 위젯의 파일 식별자 (교체 여부 판단용)
+    """
+
+    def __init__(self, path: str, content_hash: str, size: int, filename: str, source_id=None):
+        self.path = path
+        self.content_hash = content_hash
+        self.size = size
+        self.filename = filename
+        self.source_id = source_id
+        # 세션 종료로 객체가 수거되거나 프로세스가 종료될 때 임시 파일 삭제
+        self._finalizer = weakref.finalize(self, _remove_file, path)
+
+    @property
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def cleanup(self):
+        """임시 파일을 즉시 삭제합니다 (여러 번 호출해도 안전)."""
+        self._finalizer()
+
+
+def upload_source_id(uploaded_file):
+    """
+    업로드 위젯 파일의 식별자를 반환합니다.
+
+    Streamlit의 file_id가 있으면 사용하고, 없으면 (이름, 크기)로 대신합니다.
+    """
+    return getattr(uploaded_file, "file_id", None) or (uploaded_file.name, uploaded_file.size)
+
+
+def save_upload(uploaded_file, chunk_size: int = None) -> TempUpload:
+    """
+    업로드 파일을 청크 단위로 임시 파일에 저장하면서 해시를 계산합니다.
+
+    Args:
+        uploaded_file: st.file_uploader 결과 (read(n)을 지원하는 파일 객체)
+        chunk_size: 한 번에 읽을 바이트 수 (기본값: config.UPLOAD_CHUNK_SIZE)
+
+    Returns:
+        TempUpload 객체
+
+    Raises:
+        Exception: 저장 실패 시 (기록 중이던 임시 파일은 삭제됨)
+    """
+    if chunk_size is None:
+        chunk_size = config.UPLOAD_CHUNK_SIZE
+
+    os.makedirs(config.UPLOAD_TEMP_DIR, exist_ok=True)
+
+    suffix = os.path.splitext(uploaded_file.name)[1].lower() or ".mp4"
+    fd, path = tempfile.mkstemp(prefix="upload_", suffix=suffix, dir=config.UPLOAD_TEMP_DIR)
+
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        uploaded_file.seek(0)
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter(lambda: uploaded_file.read(chunk_size), b""):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+    except Exception as e:
+        _remove_file(path)
+        raise Exception(f"업로드 파일 저장 실패: {str(e)}")
+
+    print(f"💾 업로드 파일 저장: {uploaded_file.name} ({size / (1024*1024):.2f} MB, 해시 {digest.hexdigest()[:12]})")
+
+    return TempUpload(path, digest.hexdigest(), size, uploaded_file.name, upload_source_id(uploaded_file))
+
+
+def sweep_stale_uploads(max_age: float = None) -> int:
+    """
+    이전 실행에서 남은 오래된 임시 파일을 삭제합니다.
+
+    Args:
+        max_age: 이보다 오래 수정되지 않은 파일 삭제 (초, 기본값: config.UPLOAD_TEMP_MAX_AGE)
+
+    Returns:
+        삭제한 파일 수
+    """
+    if max_age is None:
+        max_age = config.UPLOAD_TEMP_MAX_AGE
+
+    try:
+        names = os.listdir(config.UPLOAD_TEMP_DIR)
+    except OSError:
+        return 0
+
+    cutoff = time.time() - max_age
+    removed = 0
+
+    for name in names:
+        path = os.path.join(config.UPLOAD_TEMP_DIR, name)
+        try:
+            if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass
+
+    if removed:
+        print(f"🧹 오래된 업로드 임시 파일 {removed}개 삭제")
+
+    return removed
+
+
+def sweep_stale_uploads_once() -> int:
+    """
+    sweep_stale_uploads를 프로세스당 한 번만 실행합니다 (Streamlit rerun 대응).
+
+    Returns:
+        삭제한 파일 수 (이미 실행된 경우 0)
+    """
+    global _startup_swept
+
+    with _startup_sweep_lock:
+        if _startup_swept:
+            return 0
+        _startup_swept = True
+
+    return sweep_stale_uploads()
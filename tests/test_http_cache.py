@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+
+import config
+from http_cache import HTTPResponseCache, canonicalize_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://WWW.Example.com/news/123/", "https://example.com/news/123"),
+    ("https://example.com", "https://example.com/"),
+    ("https://example.com/a#comments", "https://example.com/a"),
+    ("https://example.com/a?b=2&a=1", "https://example.com/a?a=1&b=2"),
+    ("https://example.com/a?id=7&utm_source=x&UTM_Medium=y&fbclid=abc&gclid=def", "https://example.com/a?id=7"),
+    ("https://example.com/a?mc_cid=1&mc_eid=2&igshid=3&msclkid=4", "https://example.com/a"),
+    ("https://example.com/a?flag=&id=1", "https://example.com/a?flag=&id=1"),
+    ("//example.com/a", "https://example.com/a"),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_keeps_ref_params():
+    # ref는 사이트에 따라 다른 페이지를 가리키므로 캐시 키에 남아야 한다
+    assert canonicalize_url("https://example.com/view?ref=1") != canonicalize_url("https://example.com/view?ref=2")
+    assert canonicalize_url("https://example.com/view?ref_src=a") == "https://example.com/view?ref_src=a"
+
+
+def test_canonicalize_url_keeps_host_ports_and_subdomains_distinct():
+    assert canonicalize_url("https://example.com:8443/a") == "https://example.com:8443/a"
+    assert canonicalize_url("https://m.example.com/a") != canonicalize_url("https://example.com/a")
+
+
+def _entry(size=100):
+    return {"text": "가" * size, "etag": None, "last_modified": None, "fetched_at": time.time()}
+
+
+def test_save_sweeps_least_recently_used_over_max_bytes(tmp_path):
+    cache = HTTPResponseCache(directory=str(tmp_path), max_bytes=2000, max_age=3600)
+
+    for i in range(3):
+        cache.save(f"https://example.com/{i}", _entry())
+        os.utime(cache._path(f"https://example.com/{i}"), (1000 + i, 1000 + i))
+    # 가장 오래된 0번을 다시 사용하면 1번이 먼저 삭제된다
+    os.utime(cache._path("https://example.com/0"), (2000, 2000))
+    cache.load("https://example.com/0")
+
+    for i in range(3, 6):
+        cache.save(f"https://example.com/{i}", _entry())
+
+    kept = {i for i in range(6) if cache.load(f"https://example.com/{i}")}
+    assert 0 in kept and 5 in kept
+    assert 1 not in kept
+    assert sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path)) <= 2000
+
+
+def test_sweep_removes_entries_unused_for_max_age(tmp_path):
+    cache = HTTPResponseCache(directory=str(tmp_path), max_bytes=10 ** 9, max_age=60)
+    cache.save("https://example.com/old", _entry())
+    cache.save("https://example.com/new", _entry())
+    old = time.time() - 120
+    os.utime(cache._path("https://example.com/old"), (old, old))
+
+    cache.sweep()
+
+    assert cache.load("https://example.com/old") is None
+    assert cache.load("https://example.com/new") is not None
+
+
+def test_save_sweeps_after_interval(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "HTTP_CACHE_SWEEP_INTERVAL", 0)
+    cache = HTTPResponseCache(directory=str(tmp_path), max_bytes=10 ** 9, max_age=60)
+    cache.save("https://example.com/old", _entry())
+    old = time.time() - 120
+    os.utime(cache._path("https://example.com/old"), (old, old))
+
+    cache.save("https://example.com/new", _entry())
+
+    assert cache.load("https://example.com/old") is None
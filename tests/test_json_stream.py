@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from json_stream import IncrementalJSONParser
+
+
+# RESPONSE_SCHEMA 형태의 응답 (한글/이모지는 ensure_ascii로 \uXXXX 이스케이프가 되도록)
+DOCUMENT = {
+    "kr": {
+        "x": "세븐틴 월드투어 개막 🎉\n\"고척돔\" 4만 관객",
+        "insta": "첫 문단\n\n둘째 문단\n\n#세븐틴 #SEVENTEEN",
+        "threads": "여러분은 어떤 무대가 좋았나요?",
+    },
+    "en": {
+        "x": "SEVENTEEN opens the world tour \\ 40,000 fans",
+        "insta": "Paragraph one.\n\nParagraph two.\n\n#SEVENTEEN",
+        "threads": "Which stage was your favorite?",
+    },
+    "review_score": {
+        "kr": {"x": 9, "insta": 10, "threads": 8},
+        "en": {"x": 7, "insta": 10, "threads": -1},
+    },
+}
+
+EXPECTED = [
+    (("kr", "x"), DOCUMENT["kr"]["x"]),
+    (("kr", "insta"), DOCUMENT["kr"]["insta"]),
+    (("kr", "threads"), DOCUMENT["kr"]["threads"]),
+    (("en", "x"), DOCUMENT["en"]["x"]),
+    (("en", "insta"), DOCUMENT["en"]["insta"]),
+    (("en", "threads"), DOCUMENT["en"]["threads"]),
+    (("review_score", "kr", "x"), 9),
+    (("review_score", "kr", "insta"), 10),
+    (("review_score", "kr", "threads"), 8),
+    (("review_score", "en", "x"), 7),
+    (("review_score", "en", "insta"), 10),
+    (("review_score", "en", "threads"), -1),
+]
+
+
+def _feed_all(chunks):
+    parser = IncrementalJSONParser()
+    pairs = []
+    for chunk in chunks:
+        pairs += parser.feed(chunk)
+    pairs += parser.close()
+    return parser, pairs
+
+
+def _split_at(text, positions):
+    bounds = [0] + sorted(positions) + [len(text)]
+    return [text[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+def test_fixed_size_chunks(indent, size):
+    text = json.dumps(DOCUMENT, ensure_ascii=True, indent=indent)
+
+    parser, pairs = _feed_all(text[i:i + size] for i in range(0, len(text), size))
+
+    assert pairs == EXPECTED
+    assert parser.is_complete
+
+
+def test_splits_inside_escapes_numbers_and_keys():
+    text = json.dumps(DOCUMENT, ensure_ascii=True)
+    positions = [
+        text.index("\\u") + 1,           # "\" 와 "u" 사이
+        text.index("\\u") + 4,           # \uXXXX 16진수 중간
+        text.index("\\ud83c") + 6,       # 이모지 서로게이트 쌍 사이
+        text.index('\\"') + 1,           # \" 이스케이프 중간
+        text.index('"threads"') + 4,     # 키 중간
+        text.index('"insta": 10') + 10,  # 두 자리 숫자 중간
+        text.index("-1") + 1,            # 음수 부호와 숫자 사이
+    ]
+
+    parser, pairs = _feed_all(_split_at(text, positions))
+
+    assert pairs == EXPECTED
+    assert parser.is_complete
+
+
+def test_values_are_emitted_as_soon_as_complete():
+    parser = IncrementalJSONParser()
+
+    assert parser.feed('{"kr": {"x": "\\uc548') == []
+    assert parser.feed('\\ub155"') == [(("kr", "x"), "안녕")]
+    assert parser.feed('}, "review_score": {"kr": {"x": 1') == []
+    # 숫자는 구분자가 도착해야 끝난 것을 알 수 있음
+    assert parser.feed("0") == []
+    assert parser.feed("}") == [(("review_score", "kr", "x"), 10)]
+    assert not parser.is_complete
+    assert parser.feed("}}") == []
+    assert parser.is_complete
+
+
+def test_top_level_scalar_is_flushed_on_close():
+    parser = IncrementalJSONParser()
+
+    assert parser.feed("4") == []
+    assert parser.feed("2") == []
+    assert parser.close() == [((), 42)]
+
+
+def test_invalid_scalar_raises_value_error():
+    parser = IncrementalJSONParser()
+
+    with pytest.raises(ValueError):
+        parser.feed('{"x": tru}')
@@ -0,0 +1,48 @@
+import time
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from engine import ModelCatalog
+
+
+class Fetcher:
+    def __init__(self, models):
+        self.models = models
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.models)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_memoized_resolve_refreshes_in_background_when_stale():
+    fetcher = Fetcher(["models/gemini-2.5-flash"])
+    catalog = ModelCatalog(ttl=0.05, stale_ttl=60, fetcher=fetcher)
+
+    first = catalog.resolve("gemini-2.5-flash")
+    assert fetcher.calls == 1
+
+    time.sleep(0.06)
+    assert catalog.resolve("gemini-2.5-flash") == first
+    assert wait_for(lambda: fetcher.calls == 2)
+
+
+def test_changed_list_drops_memoized_resolution():
+    fetcher = Fetcher(["models/gemini-2.5-flash"])
+    catalog = ModelCatalog(ttl=0.05, stale_ttl=60, fetcher=fetcher)
+    assert catalog.resolve("gemini-2.5-pro")[0].endswith("gemini-2.5-flash")
+
+    fetcher.models = ["models/gemini-2.5-pro"]
+    time.sleep(0.06)
+    catalog.resolve("gemini-2.5-pro")
+    assert wait_for(lambda: fetcher.calls == 2)
+
+    assert catalog.resolve("gemini-2.5-pro")[0].endswith("gemini-2.5-pro")
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import pytest
+
+import config
+from rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setattr(config, "RATE_LIMIT_ENABLED", True)
+    return RateLimiter({"default": {"rpm": 60, "tpm": 1_000_000}})
+
+
+def test_interrupted_wait_leaves_the_queue(limiter, monkeypatch):
+    state = limiter._state("m")
+    state.requests.tokens = 0  # 다음 요청까지 약 1초 대기
+
+    def interrupt(timeout=None):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(limiter._cond, "wait", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            limiter.acquire("m")
+
+    assert state.queue == []
+
+    done = threading.Event()
+    threading.Thread(target=lambda: (limiter.acquire("m"), done.set()), daemon=True).start()
+    assert done.wait(5)
+
+
+def test_cancelled_async_acquire_leaves_the_queue(limiter):
+    state = limiter._state("m")
+
+    async def scenario():
+        state.requests.tokens = 0
+        waiting = asyncio.ensure_future(limiter.acquire_async("m"))
+        await asyncio.sleep(0.05)
+        assert len(state.queue) == 1
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert state.queue == []
+
+        # 취소된 요청은 한도를 쓰지 않고 다음 요청이 통과
+        await asyncio.wait_for(limiter.acquire_async("m"), 5)
+
+    asyncio.run(scenario())
+
+
+def test_async_waiters_do_not_park_threads(limiter):
+    state = limiter._state("m")
+    state.requests.tokens = 0
+    state.requests.rate = 200.0  # 5ms마다 1건
+
+    async def scenario():
+        threads = threading.active_count()
+        waiting = asyncio.gather(*(limiter.acquire_async("m") for _ in range(64)))
+        await asyncio.sleep(0.05)
+        assert threading.active_count() == threads
+        await asyncio.wait_for(waiting, 10)
+
+    asyncio.run(scenario())
@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+
+google_exceptions = pytest.importorskip("google.api_core.exceptions")
+
+from retry_policy import CircuitBreaker, RetryBudget, RetryGiveUp, RetryPolicy
+
+
+def make_policy():
+    """서버 에러 1회로 열리고 즉시 half-open이 되는 정책"""
+    return RetryPolicy(
+        max_retries=1,
+        base_delay=0,
+        max_delay=0,
+        deadline=10,
+        budget=RetryBudget(10, 60),
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0),
+    )
+
+
+def open_breaker(policy):
+    def fail(remaining):
+        raise google_exceptions.ServiceUnavailable("down")
+
+    with pytest.raises(RetryGiveUp):
+        policy.run(fail)
+    assert policy.breaker.state == "open"
+
+
+def test_cancelled_half_open_probe_is_released():
+    policy = make_policy()
+    open_breaker(policy)
+
+    async def probe(remaining):
+        await asyncio.sleep(10)
+
+    async def cancel_probe():
+        task = asyncio.ensure_future(policy.run_async(probe))
+        await asyncio.sleep(0)
+        assert policy.breaker.state == "half-open"
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_probe())
+
+    assert policy.run(lambda remaining: "ok") == "ok"
+    assert policy.breaker.state == "closed"
+
+
+def test_interrupted_half_open_probe_is_released():
+    policy = make_policy()
+    open_breaker(policy)
+
+    def interrupted(remaining):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        policy.run(interrupted)
+
+    assert policy.run(lambda remaining: "ok") == "ok"
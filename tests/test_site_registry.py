@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from site_registry import SiteRegistry
+
+
+SITES = {
+    "tenasia.co.kr": {"name": "텐아시아", "name_en": "TenAsia", "aliases": ["tenasia.hankyung.com"]},
+    "hankyung.com": {"name": "한국경제", "name_en": "Hankyung"},
+    "news.example.com": {"name": "예시뉴스"},
+}
+
+
+@pytest.fixture
+def registry():
+    return SiteRegistry(sites=SITES, path="")
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://tenasia.co.kr/article/2024010112345", "텐아시아"),
+    ("https://www.tenasia.co.kr/article/1", "텐아시아"),
+    ("http://m.tenasia.co.kr/article/1", "텐아시아"),
+    ("HTTPS://WWW.TENASIA.CO.KR/article/1", "텐아시아"),
+    ("https://tenasia.co.kr:8443/article/1", "텐아시아"),
+    ("https://tenasia.co.kr./article/1", "텐아시아"),
+    ("tenasia.co.kr", "텐아시아"),
+    # 별칭이 대표 도메인의 하위 도메인보다 긴 일치이므로 별칭의 언론사를 사용
+    ("https://tenasia.hankyung.com/article/1", "텐아시아"),
+    ("https://www.hankyung.com/article/1", "한국경제"),
+    ("https://a.b.news.example.com/1", "예시뉴스"),
+])
+def test_resolve_matches_domains_subdomains_and_aliases(registry, url, expected):
+    assert registry.resolve(url).name == expected
+
+
+@pytest.mark.parametrize("url", [
+    "https://nottenasia.co.kr/article/1",
+    "https://tenasia.co.kr.evil.com/article/1",
+    "https://co.kr/article/1",
+    "https://example.com/",
+    "https://other.example.com/",
+    "https://evil.com/?next=https://tenasia.co.kr/",
+    "",
+    "not a url",
+])
+def test_resolve_rejects_look_alike_and_unknown_hosts(registry, url):
+    assert registry.resolve(url) is None
+
+
+def test_register_replaces_previous_site_and_its_aliases(registry):
+    registry.register("tenasia.co.kr", name="텐아시아", name_en="TEN ASIA")
+
+    assert registry.resolve("https://www.tenasia.co.kr/1").name_en == "TEN ASIA"
+    # 이전 등록의 별칭은 함께 지워지고 부모 도메인의 언론사가 일치한다
+    assert registry.resolve("https://tenasia.hankyung.com/1").name == "한국경제"
+    assert registry.names() == ["한국경제", "예시뉴스", "텐아시아"]
+
+
+def test_more_specific_registration_wins_over_parent(registry):
+    registry.register("entertain.hankyung.com", name="한경 엔터")
+
+    assert registry.resolve("https://entertain.hankyung.com/1").name == "한경 엔터"
+    assert registry.resolve("https://www.entertain.hankyung.com/1").name == "한경 엔터"
+    assert registry.resolve("https://www.hankyung.com/1").name == "한국경제"
+
+
+def test_load_file_skips_invalid_entries(registry, tmp_path):
+    path = tmp_path / "sites.json"
+    path.write_text(json.dumps({
+        "starnews.example.kr": {"name": "스타뉴스", "rate_limit": 30},
+        "broken.example.kr": {"unknown_option": True},
+    }), encoding="utf-8")
+
+    assert registry.load_file(str(path)) == 1
+    assert registry.resolve("https://m.starnews.example.kr/1").name == "스타뉴스"
+    assert registry.resolve("https://broken.example.kr/1") is None
@@ -0,0 +1,101 @@
+import pytest
+
+import config
+import token_budget
+from token_budget import condense_text, estimate_text_tokens, fit_article, strip_boilerplate
+
+
+def test_body_sentences_with_boilerplate_words_survive():
+    sentences = [
+        "공연 당일 예매 사이트에서 로그인 오류가 발생해 팬들의 항의가 이어졌다.",
+        "저작권자인 작곡가는 이번 리메이크를 직접 허락했다고 밝혔다.",
+        "관련 기사 댓글에는 멤버들을 응원하는 글이 1만 건 넘게 달렸다.",
+    ]
+    markdown = "# 세븐틴 콘서트 현장\n\n" + "\n\n".join(sentences)
+
+    stripped = strip_boilerplate(markdown)
+
+    for sentence in sentences:
+        assert sentence in stripped
+
+
+def test_standalone_boilerplate_lines_are_removed():
+    markdown = "\n\n".join([
+        "# 세븐틴 콘서트 현장",
+        "로그인 | 회원가입",
+        "세븐틴이 월드투어 첫 공연을 성황리에 마쳤다.",
+        "관련기사",
+        "<저작권자 ⓒ 텐아시아, 무단전재 및 재배포 금지>",
+        "Copyright ⓒ 한국경제 & hankyung.com, 무단전재 및 재배포 금지, All rights reserved.",
+    ])
+
+    assert strip_boilerplate(markdown) == "# 세븐틴 콘서트 현장\n\n세븐틴이 월드투어 첫 공연을 성황리에 마쳤다."
+
+
+def _long_article(count=60):
+    sentences = [
+        "세븐틴이 서울 고척스카이돔에서 월드투어 첫 공연을 열었다.",
+        "이번 공연에는 이틀 동안 4만 명의 관객이 모였다.",
+    ]
+    sentences += [f"{i}번째 무대에서 멤버 {i % 13}명이 새로운 안무 {i}종을 선보였다." for i in range(count)]
+    return "# 세븐틴 월드투어 개막\n\n" + "\n\n".join(sentences), sentences
+
+
+def test_condense_text_stays_within_budget_and_keeps_title_and_lead():
+    text, sentences = _long_article()
+    budget = estimate_text_tokens(text) // 4
+
+    condensed = condense_text(text, budget, title="세븐틴 월드투어")
+
+    assert condensed.startswith("# 세븐틴 월드투어 개막")
+    assert sentences[0] in condensed
+    assert estimate_text_tokens(condensed) <= budget
+    assert len(condensed) < len(text)
+
+
+def test_condense_text_keeps_original_sentence_order():
+    text, sentences = _long_article()
+
+    condensed = condense_text(text, estimate_text_tokens(text) // 3)
+
+    kept = [sentence for sentence in sentences if sentence in condensed]
+    positions = [condensed.index(sentence) for sentence in kept]
+    assert len(kept) > 2
+    assert positions == sorted(positions)
+
+
+def test_fit_article_under_budget_skips_token_api(monkeypatch):
+    monkeypatch.setattr(token_budget, "count_tokens", lambda *args, **kwargs: pytest.fail("count_tokens 호출됨"))
+    text = "# 제목\n\n짧은 기사 본문이다."
+
+    fitted = fit_article(text, "제목", model_name="gemini-test", budget=1000)
+
+    assert fitted == {"text": text, "original_tokens": estimate_text_tokens(text), "tokens": estimate_text_tokens(text), "condensed": False, "counter": "local"}
+
+
+def test_fit_article_condenses_over_budget_with_local_estimate(monkeypatch):
+    monkeypatch.setattr(config, "TOKEN_COUNT_API_ENABLED", False)
+    text, sentences = _long_article()
+    budget = estimate_text_tokens(text) // 4
+
+    fitted = fit_article(text, "세븐틴 월드투어", model_name="gemini-test", budget=budget)
+
+    assert fitted["condensed"] is True
+    assert fitted["counter"] == "local"
+    assert fitted["tokens"] <= budget
+    assert sentences[0] in fitted["text"]
+
+
+def test_fit_article_scales_selection_by_api_count(monkeypatch):
+    text, _ = _long_article()
+    local = estimate_text_tokens(text)
+    budget = local // 2
+    # API가 로컬 추정의 두 배로 세면 절반 예산에 맞추기 위해 더 적은 문장을 골라야 한다
+    monkeypatch.setattr(token_budget, "count_tokens", lambda text, model_name=None: local * 2)
+
+    fitted = fit_article(text, "세븐틴 월드투어", model_name="gemini-test", budget=budget)
+
+    assert fitted["counter"] == "api"
+    assert fitted["condensed"] is True
+    assert fitted["tokens"] <= budget
+    assert estimate_text_tokens(fitted["text"]) <= budget // 2 + 1
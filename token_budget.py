@@ -0,0 +1,348 @@
+"""
+기사 본문 토큰 예산 모듈
+
+Jina Reader가 반환하는 마크다운에는 기사 본문 외에도 메뉴, 관련 기사 링크, 이미지 마크다운,
+저작권 문구가 섞여 있고, 이전에는 이 전체가 그대로 프롬프트에 들어갔습니다.
+이 모듈은 생성 전에 다음 단계를 거쳐 입력 크기를 config.ARTICLE_TOKEN_BUDGET 이내로 줄입니다.
+
+1. 잡음 제거: 이미지, 링크만 있는 줄, 저작권/구독 문구, Jina 헤더를 지우고 링크는 글자만 남김
+2. 토큰 계산: 로컬 추정값이 예산에 충분히 못 미치면 그대로 사용하고, 예산에 가까우면
+   모델의 count_tokens로 한 번 정확히 세어 로컬 추정값의 보정 비율을 구함 (오프라인이면 로컬 추정)
+3. 추출 요약: 예산을 넘으면 문장마다 핵심어 빈도, 제목과 겹치는 단어, 앞부분 가중치로 점수를 매겨
+   점수가 높은 문장부터 예산만큼 고른 뒤 원래 순서대로 이어 붙임 (첫 줄과 리드 문장은 항상 포함,
+   반복되는 문장은 제외)
+"""
+
+import re
+import math
+from collections import Counter
+from typing import Dict, List, Optional
+import config
+
+
+# Jina Reader 응답 머리말 (Title:, URL Source:, Published Time:, Markdown Content:)
+JINA_HEADER_PATTERN = re.compile(r"^(Title|URL Source|Published Time|Markdown Content|Warning):", re.IGNORECASE)
+
+IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+LINK_PATTERN = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+LINK_ONLY_LINE_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+\.)?\s*(?:\[[^\]]*\]\([^)]*\)\s*[|·,]?\s*)+$")
+BARE_URL_PATTERN = re.compile(r"https?://\S+")
+RULE_LINE_PATTERN = re.compile(r"^\s*(?:[-=*_]\s*){3,}$")
+BYLINE_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+
+# 기사 본문이 아닌 줄에 나타나는 문구
+BOILERPLATE_PHRASES = (
+    "무단전재", "무단 전재", "재배포 금지", "재배포금지", "저작권자", "Copyright", "ⓒ", "©",
+    "All rights reserved", "구독하기", "기사제보", "로그인", "회원가입", "많이 본 뉴스",
+    "관련기사", "관련 기사", "인기기사", "추천기사", "공유하기", "글자크기", "바로가기",
+)
+
+# 상투 문구가 줄 중간에만 있을 때 잡음으로 볼 최대 길이 (더 긴 줄은 본문으로 간주)
+BOILERPLATE_MAX_CHARS = 40
+
+# 본문 문장의 끝 ("~했다.", "~이에요!" 등): 상투 문구가 들어 있어도 지우지 않음
+SENTENCE_END_PATTERN = re.compile(r"[다요까][.!?…]*[\"'”’)]*$")
+
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。])[\"'”’)]*\s+")
+TERM_PATTERN = re.compile(r"[가-힣]+|[A-Za-z]+|\d+")
+
+# 한국어 단어 끝의 조사/어미 (핵심어 비교 시 제거)
+KOREAN_SUFFIXES = (
+    "에서는", "으로는", "에게서", "이라는", "까지", "부터", "에서", "으로", "에게", "께서", "이다",
+    "했다", "한다", "하는", "했던", "라는", "은", "는", "이", "가", "을", "를", "의", "에", "로",
+    "와", "과", "도", "만", "고", "며",
+)
+
+# 로컬 토큰 추정: 한글 약 1.5자당 1토큰, 그 외(영문/숫자/공백/기호) 약 4자당 1토큰
+HANGUL_CHARS_PER_TOKEN = 1.5
+OTHER_CHARS_PER_TOKEN = 4.0
+
+# 앞부분 문장 가중치 (역피라미드 구조의 기사는 앞 문단에 핵심이 있음)
+LEAD_WEIGHT = 0.5
+TITLE_WEIGHT = 0.3
+
+# 이미 고른 문장과 핵심어 자카드 유사도가 이 값 이상이면 중복으로 제외
+REDUNDANCY_THRESHOLD = 0.7
+
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    네트워크 없이 텍스트의 입력 토큰 수를 추정합니다.
+
+    Args:
+        text: 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+
+    hangul = sum(1 for char in text if "가" <= char <= "힣")
+    other = len(text) - hangul
+    return int(math.ceil(hangul / HANGUL_CHARS_PER_TOKEN + other / OTHER_CHARS_PER_TOKEN))
+
+
+def count_tokens(text: str, model_name: Optional[str] = None) -> Optional[int]:
+    """
+    모델의 count_tokens로 입력 토큰 수를 셉니다.
+
+    Args:
+        text: 계산할 텍스트
+        model_name: 모델 이름 (None이거나 config.TOKEN_COUNT_API_ENABLED가 False면 계산하지 않음)
+
+    Returns:
+        토큰 수 또는 None (오프라인, API 오류 시)
+    """
+    if not model_name or not config.TOKEN_COUNT_API_ENABLED:
+        return None
+
+    try:
+        # 추출/요약 로직만 쓰는 경우(테스트, 오프라인)에는 SDK를 불러오지 않도록 여기서 import
+        import google.generativeai as genai
+        return genai.GenerativeModel(model_name).count_tokens(text).total_tokens
+    except Exception as e:
+        print(f"⚠️  count_tokens 실패, 로컬 추정값 사용: {type(e).__name__} - {str(e)[:200]}")
+        return None
+
+
+def is_boilerplate_line(line: str) -> bool:
+    """
+    상투 문구(저작권, 메뉴, 관련 기사 등)만으로 된 줄인지 판단합니다.
+
+    "로그인 오류로 ~했다."처럼 상투 문구가 들어간 본문 문장은 지우지 않도록,
+    문구가 줄의 앞/끝에 있거나 짧은 단독 줄일 때만 잡음으로 봅니다.
+
+    Args:
+        line: 링크/이미지를 정리한 한 줄
+
+    Returns:
+        잡음 줄이면 True
+    """
+    if SENTENCE_END_PATTERN.search(line):
+        return False
+
+    core = line.strip(" <>[]()*_|·-.")
+    phrases = [phrase for phrase in BOILERPLATE_PHRASES if phrase in core]
+    if not phrases:
+        return False
+
+    if len(core) < BOILERPLATE_MAX_CHARS:
+        return True
+    return any(core.startswith(phrase) or core.endswith(phrase) for phrase in phrases)
+
+
+def strip_boilerplate(markdown: str) -> str:
+    """
+    Jina Reader 마크다운에서 기사 본문이 아닌 부분을 제거합니다.
+
+    Args:
+        markdown: 추출된 마크다운 텍스트
+
+    Returns:
+        본문 텍스트 (문단은 빈 줄로 구분)
+    """
+    lines = []
+
+    for line in markdown.replace("\r\n", "\n").split("\n"):
+        if JINA_HEADER_PATTERN.match(line) or LINK_ONLY_LINE_PATTERN.match(line) or RULE_LINE_PATTERN.match(line):
+            lines.append("")
+            continue
+
+        line = IMAGE_PATTERN.sub("", line)
+        line = LINK_PATTERN.sub(r"\1", line)
+        line = BARE_URL_PATTERN.sub("", line).strip()
+
+        # 글자가 없는 줄, 상투 문구, 짧은 기자 이메일 줄 제거
+        if not re.search(r"[가-힣A-Za-z0-9]", line):
+            line = ""
+        elif is_boilerplate_line(line):
+            line = ""
+        elif len(line) < 60 and BYLINE_PATTERN.search(line):
+            line = ""
+
+        lines.append(line)
+
+    text = "\n".join(lines)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def split_sentences(text: str) -> List[List[str]]:
+    """
+    텍스트를 문단별 문장 리스트로 나눕니다.
+
+    Returns:
+        [[문단 1의 문장, ...], [문단 2의 문장, ...], ...]
+    """
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", text):
+        sentences = []
+        for line in block.split("\n"):
+            # 마크다운 제목 줄은 본문 문장과 이어 붙지 않도록 별도 문단으로 취급
+            if line.lstrip().startswith("#"):
+                if sentences:
+                    paragraphs.append(sentences)
+                paragraphs.append([line.strip()])
+                sentences = []
+                continue
+            sentences += [sentence.strip() for sentence in SENTENCE_SPLIT_PATTERN.split(line) if sentence.strip()]
+        if sentences:
+            paragraphs.append(sentences)
+    return paragraphs
+
+
+def extract_terms(text: str) -> List[str]:
+    """문장에서 비교용 핵심어를 추출합니다 (한국어는 끝의 조사/어미 제거, 영문은 소문자)."""
+    terms = []
+    for word in TERM_PATTERN.findall(text):
+        if "가" <= word[0] <= "힣":
+            for suffix in KOREAN_SUFFIXES:
+                if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                    word = word[:-len(suffix)]
+                    break
+        else:
+            word = word.lower()
+        if len(word) >= 2:
+            terms.append(word)
+    return terms
+
+
+def rank_sentences(paragraphs: List[List[str]], title: str = "") -> List[tuple]:
+    """
+    문장마다 중요도 점수를 매깁니다.
+
+    점수 = 핵심어 가중치 합 / √핵심어 수 (핵심어 가중치는 그 단어가 나오는 문장 수의 로그)
+         + 제목과 겹치는 단어 비율 × TITLE_WEIGHT
+         + 앞부분일수록 큰 위치 가중치 × LEAD_WEIGHT
+
+    Args:
+        paragraphs: split_sentences 결과
+        title: 기사 제목
+
+    Returns:
+        (점수, 문단 번호, 문장 번호) 리스트 (점수가 높은 순)
+    """
+    sentence_terms = [[extract_terms(sentence) for sentence in sentences] for sentences in paragraphs]
+    frequency = Counter(term for terms_list in sentence_terms for terms in terms_list for term in set(terms))
+    top = math.log1p(max(frequency.values(), default=1))
+    title_terms = set(extract_terms(title))
+
+    total = sum(len(sentences) for sentences in paragraphs)
+    ranked = []
+    order = 0
+
+    for p, terms_list in enumerate(sentence_terms):
+        for s, terms in enumerate(terms_list):
+            unique = set(terms)
+            score = 0.0
+            if unique:
+                score += sum(math.log1p(frequency[term]) for term in unique) / (top * math.sqrt(len(unique)))
+                if title_terms:
+                    score += TITLE_WEIGHT * len(unique & title_terms) / len(title_terms)
+            score += LEAD_WEIGHT * (1.0 - order / total)
+            ranked.append((score, p, s))
+            order += 1
+
+    ranked.sort(key=lambda item: (-item[0], item[1], item[2]))
+    return ranked
+
+
+def condense_text(text: str, budget: int, title: str = "", ratio: float = 1.0) -> str:
+    """
+    중요도가 높은 문장부터 예산 안에서 골라 원래 순서대로 이어 붙입니다.
+
+    첫 줄과 본문 첫 문장(리드)은 항상 포함합니다. 이미 고른 본문 문장과 핵심어가 REDUNDANCY_THRESHOLD 이상
+    겹치는 문장은 같은 내용의 반복으로 보고 건너뜁니다 (제목 줄은 비교 대상에서 제외).
+
+    Args:
+        text: strip_boilerplate를 거친 본문
+        budget: 토큰 예산
+        title: 기사 제목 (제목과 겹치는 문장에 가중치)
+        ratio: 로컬 추정값 보정 비율 (실제 토큰 수 / 로컬 추정값)
+
+    Returns:
+        축약된 본문
+    """
+    paragraphs = split_sentences(text)
+    if not paragraphs:
+        return text
+
+    lead = next(
+        ((p, s) for p, sentences in enumerate(paragraphs) for s, sentence in enumerate(sentences) if not sentence.startswith("#")),
+        (0, 0)
+    )
+
+    chosen = {(0, 0), lead}
+    chosen_terms = [set(extract_terms(paragraphs[p][s])) for p, s in chosen if not paragraphs[p][s].startswith("#")]
+    used = sum(estimate_text_tokens(paragraphs[p][s]) + 1 for p, s in chosen) * ratio
+
+    for _, p, s in rank_sentences(paragraphs, title):
+        if (p, s) in chosen:
+            continue
+        cost = (estimate_text_tokens(paragraphs[p][s]) + 1) * ratio
+        if used + cost > budget:
+            continue
+
+        terms = set(extract_terms(paragraphs[p][s]))
+        if terms and not paragraphs[p][s].startswith("#") and any(len(terms & other) / len(terms | other) >= REDUNDANCY_THRESHOLD for other in chosen_terms if other):
+            continue
+
+        chosen.add((p, s))
+        if not paragraphs[p][s].startswith("#"):
+            chosen_terms.append(terms)
+        used += cost
+
+    blocks = []
+    for p, sentences in enumerate(paragraphs):
+        kept = [sentence for s, sentence in enumerate(sentences) if (p, s) in chosen]
+        if kept:
+            blocks.append(" ".join(kept))
+    return "\n\n".join(blocks)
+
+
+def fit_article(article_text: str, article_title: str = "", model_name: Optional[str] = None, budget: Optional[int] = None) -> Dict:
+    """
+    기사 본문의 잡음을 제거하고 토큰 예산을 넘으면 추출 요약합니다.
+
+    Args:
+        article_text: 추출된 기사 본문 (마크다운)
+        article_title: 기사 제목
+        model_name: count_tokens에 사용할 모델 이름 (None이면 로컬 추정만 사용)
+        budget: 토큰 예산 (기본값: config.ARTICLE_TOKEN_BUDGET)
+
+    Returns:
+        {
+            "text": 생성에 사용할 본문,
+            "original_tokens": 잡음 제거 전 추정 토큰 수,
+            "tokens": 최종 본문 토큰 수 (추정 또는 보정값),
+            "condensed": 추출 요약 여부,
+            "counter": "api" 또는 "local"
+        }
+    """
+    budget = budget or config.ARTICLE_TOKEN_BUDGET
+    original_tokens = estimate_text_tokens(article_text)
+
+    text = strip_boilerplate(article_text) or article_text.strip()
+    local_tokens = estimate_text_tokens(text)
+
+    # 예산에 충분히 못 미치면 API 호출 없이 그대로 사용
+    if local_tokens <= budget * config.ARTICLE_TOKEN_LOCAL_MARGIN:
+        return {"text": text, "original_tokens": original_tokens, "tokens": local_tokens, "condensed": False, "counter": "local"}
+
+    exact = count_tokens(text, model_name)
+    counter = "local" if exact is None else "api"
+    tokens = local_tokens if exact is None else exact
+
+    if tokens <= budget:
+        return {"text": text, "original_tokens": original_tokens, "tokens": tokens, "condensed": False, "counter": counter}
+
+    ratio = tokens / local_tokens if local_tokens else 1.0
+    condensed = condense_text(text, budget, article_title, ratio)
+
+    return {
+        "text": condensed,
+        "original_tokens": original_tokens,
+        "tokens": int(math.ceil(estimate_text_tokens(condensed) * ratio)),
+        "condensed": True,
+        "counter": counter,
+    }
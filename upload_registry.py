@@ -0,0 +1,492 @@
+"""
+Gemini File API 업로드 재사용 모듈
+
+같은 영상을 다른 콘텐츠 스타일로 다시 분석할 때 업로드와 서버 처리(PROCESSING)를
+반복하지 않도록, 영상 파일의 내용 해시(SHA-256)를 키로 업로드된 파일을 기록해 두고
+서버 보관 기간 안에서는 ACTIVE 상태의 원격 파일을 그대로 재사용합니다.
+
+원격 파일은 분석이 끝날 때마다 삭제하지 않고, LRU 한도를 넘거나 만료된 경우에만 삭제합니다.
+기록은 JSON 파일로 저장되어 Streamlit 재실행이나 프로세스 재시작 후에도 유지됩니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import contextlib
+from collections import deque
+from typing import Optional
+import google.generativeai as genai
+import config
+from video_transcoder import transcode_for_upload
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다 (청크 단위로 읽어 메모리 사용 최소화).
+
+    Args:
+        path: 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class ProcessingPoller:
+    """
+    업로드된 영상의 PROCESSING 상태를 적응형 간격으로 확인하는 폴러
+
+    - 빠른 단계: 처음 POLL_FAST_COUNT회는 POLL_INITIAL_INTERVAL 간격 (짧은 영상은 금방 ACTIVE)
+    - 이후 POLL_BACKOFF_FACTOR배씩 간격 증가, 상한은 파일 크기 기반 추정치
+      (MB당 POLL_SECONDS_PER_MB초, POLL_MIN_CAP ~ POLL_MAX_CAP 사이)
+    - PROCESSING_TIMEOUT 초과 시 실패, cancel_event가 설정되면 즉시 중단
+    - 파일 크기별 처리 시간을 기록하여 간격 설정 튜닝에 사용
+    """
+
+    def __init__(self, history_size: int = 100):
+        self._history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def interval_cap(self, size_bytes: int) -> float:
+        """파일 크기로 추정한 폴링 간격 상한 (초)"""
+        size_mb = (size_bytes or 0) / (1024 * 1024)
+        return max(config.POLL_MIN_CAP, min(config.POLL_MAX_CAP, size_mb * config.POLL_SECONDS_PER_MB))
+
+    def wait(self, uploaded_file, size_bytes: int = None, cancel_event: threading.Event = None, timeout: float = None):
+        """
+        파일이 PROCESSING 상태를 벗어날 때까지 대기합니다.
+
+        Args:
+            uploaded_file: genai.upload_file / genai.get_file 결과
+            size_bytes: 파일 크기 (간격 상한 추정용, 선택)
+            cancel_event: 설정되면 대기를 중단하는 이벤트 (선택)
+            timeout: 최대 대기 시간 (초, 기본값: config.PROCESSING_TIMEOUT)
+
+        Returns:
+            ACTIVE 상태의 파일 객체
+
+        Raises:
+            Exception: 영상 처리 실패(FAILED), 시간 초과, 취소 시
+        """
+        if timeout is None:
+            timeout = config.PROCESSING_TIMEOUT
+
+        cap = self.interval_cap(size_bytes)
+        interval = config.POLL_INITIAL_INTERVAL
+        started = time.monotonic()
+        polls = 0
+
+        print(f"\n⏳ 영상 처리 중... (폴링 간격 상한 {cap:.1f}초)")
+
+        while uploaded_file.state.name == "PROCESSING":
+            elapsed = time.monotonic() - started
+            if elapsed >= timeout:
+                self._record(size_bytes, elapsed, polls, "timeout")
+                raise Exception(f"영상 처리 시간 초과 ({timeout:.0f}초)")
+
+            wait_time = min(interval, timeout - elapsed)
+            print(f"   상태: {uploaded_file.state.name} - {elapsed:.1f}초 경과...", end="\r")
+
+            # cancel_event가 있으면 대기 중에도 즉시 취소 가능
+            if cancel_event is not None:
+                if cancel_event.wait(wait_time):
+                    self._record(size_bytes, time.monotonic() - started, polls, "cancelled")
+                    raise Exception("영상 처리 대기가 취소되었습니다")
+            else:
+                time.sleep(wait_time)
+
+            uploaded_file = genai.get_file(uploaded_file.name)
+            polls += 1
+
+            if polls >= config.POLL_FAST_COUNT:
+                interval = min(cap, interval * config.POLL_BACKOFF_FACTOR)
+
+        elapsed = time.monotonic() - started
+
+        if uploaded_file.state.name == "FAILED":
+            self._record(size_bytes, elapsed, polls, "failed")
+            raise Exception(f"영상 처리 실패: {uploaded_file.state.name}")
+
+        self._record(size_bytes, elapsed, polls, "active")
+        print(f"✅ 영상 처리 완료! 상태: {uploaded_file.state.name} ({elapsed:.1f}초, 상태 확인 {polls}회)\n")
+        return uploaded_file
+
+    def _record(self, size_bytes: int, elapsed: float, polls: int, outcome: str):
+        """처리 시간 기록 (메모리 + config.PROCESSING_METRICS_PATH JSONL)"""
+        record = {
+            "size_mb": round((size_bytes or 0) / (1024 * 1024), 3),
+            "seconds": round(elapsed, 3),
+            "polls": polls,
+            "outcome": outcome,
+            "recorded_at": time.time()
+        }
+
+        with self._lock:
+            self._history.append(record)
+
+            if config.PROCESSING_METRICS_PATH:
+                try:
+                    directory = os.path.dirname(config.PROCESSING_METRICS_PATH)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    with open(config.PROCESSING_METRICS_PATH, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(record) + "\n")
+                except OSError:
+                    pass
+
+    def metrics(self) -> dict:
+        """
+        최근 처리 기록 요약을 반환합니다.
+
+        Returns:
+            {"count", "avg_seconds", "avg_seconds_per_mb", "avg_polls", "outcomes", "history"}
+        """
+        with self._lock:
+            history = list(self._history)
+
+        active = [r for r in history if r["outcome"] == "active"]
+        sized = [r for r in active if r["size_mb"] > 0]
+        outcomes = {}
+        for record in history:
+            outcomes[record["outcome"]] = outcomes.get(record["outcome"], 0) + 1
+
+        return {
+            "count": len(history),
+            "avg_seconds": round(sum(r["seconds"] for r in active) / len(active), 3) if active else None,
+            "avg_seconds_per_mb": round(sum(r["seconds"] for r in sized) / sum(r["size_mb"] for r in sized), 3) if sized else None,
+            "avg_polls": round(sum(r["polls"] for r in active) / len(active), 2) if active else None,
+            "outcomes": outcomes,
+            "history": history
+        }
+
+
+PROCESSING_POLLER = ProcessingPoller()
+
+
+def wait_for_file_active(uploaded_file, size_bytes: int = None, cancel_event: threading.Event = None):
+    """
+    업로드된 파일이 PROCESSING 상태를 벗어날 때까지 적응형 간격으로 대기합니다.
+
+    Args:
+        uploaded_file: genai.upload_file / genai.get_file 결과
+        size_bytes: 파일 크기 (선택)
+        cancel_event: 설정되면 대기를 중단하는 이벤트 (선택)
+
+    Returns:
+        ACTIVE 상태의 파일 객체
+
+    Raises:
+        Exception: 영상 처리 실패, 시간 초과, 취소 시
+    """
+    return PROCESSING_POLLER.wait(uploaded_file, size_bytes=size_bytes, cancel_event=cancel_event)
+
+
+def get_processing_metrics() -> dict:
+    """영상 처리(PROCESSING) 대기 지표를 반환합니다 (ProcessingPoller.metrics 참고)."""
+    return PROCESSING_POLLER.metrics()
+
+
+def _expiration_timestamp(uploaded_file) -> Optional[float]:
+    """파일 객체의 서버 만료 시각(expiration_time)을 UNIX 타임스탬프로 변환합니다."""
+    expiration = getattr(uploaded_file, "expiration_time", None)
+
+    try:
+        return expiration.timestamp() if expiration else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class UploadRegistry:
+    """
+    내용 해시 → 업로드된 원격 파일 기록 (LRU + 만료 관리)
+
+    - get_or_upload(): 같은 해시의 ACTIVE 파일이 만료 전이면 재사용, 아니면 새로 업로드
+    - release(): 재사용이 꺼져 있으면 원격 파일 삭제 (기존 동작), 켜져 있으면 유지
+    - 파일 수가 max_files를 넘으면 가장 오래 사용하지 않은 원격 파일부터 삭제
+      (get_or_upload ~ release 사이에 사용 중인 파일은 삭제하지 않음)
+    """
+
+    def __init__(self, index_path: str = None, max_files: int = None, lifetime: float = None, reuse_margin: float = None):
+        self.index_path = index_path or config.UPLOAD_REGISTRY_PATH
+        self.max_files = config.UPLOAD_REGISTRY_MAX_FILES if max_files is None else max_files
+        self.lifetime = config.UPLOAD_FILE_LIFETIME if lifetime is None else lifetime
+        self.reuse_margin = config.UPLOAD_REUSE_MARGIN if reuse_margin is None else reuse_margin
+        self._lock = threading.Lock()
+        self._hash_locks = {}  # 내용 해시 → [잠금, 사용 중인 호출 수]
+        self._in_use = {}      # 원격 파일 이름 → 사용 중인 작업 수 (LRU 삭제 제외)
+        self._entries = None
+
+    # ----- 기록 파일 -----
+
+    def _load(self) -> dict:
+        """기록 파일을 (최초 1회) 읽습니다."""
+        if self._entries is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+        return self._entries
+
+    def _save(self):
+        """기록 파일을 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    @contextlib.contextmanager
+    def _hash_lock(self, content_hash: str):
+        """
+        같은 영상의 동시 업로드를 막기 위한 해시별 잠금
+
+        잠금마다 사용 중인 호출 수를 세어, 업로드가 끝나 아무도 쓰지 않으면 제거합니다
+        (오래 실행되는 서버에서 영상마다 잠금이 쌓이지 않도록).
+        """
+        with self._lock:
+            holder = self._hash_locks.setdefault(content_hash, [threading.Lock(), 0])
+            holder[1] += 1
+
+        try:
+            with holder[0]:
+                yield
+        finally:
+            with self._lock:
+                holder[1] -= 1
+                if holder[1] == 0:
+                    self._hash_locks.pop(content_hash, None)
+
+    # ----- 공개 API -----
+
+    def get_or_upload(self, video_path: str, content_hash: str = None, cancel_event: threading.Event = None):
+        """
+        영상의 ACTIVE 원격 파일을 반환합니다 (재사용 가능하면 업로드 생략).
+
+        Args:
+            video_path: 로컬 영상 파일 경로
+            content_hash: 미리 계산한 내용 해시 (선택, 없으면 계산)
+            cancel_event: 설정되면 처리 대기를 중단하는 이벤트 (선택)
+
+        Returns:
+            ACTIVE 상태의 genai 파일 객체
+
+        Raises:
+            Exception: 업로드 또는 영상 처리 실패 시
+        """
+        if not config.UPLOAD_REUSE_ENABLED:
+            return self._upload(video_path, cancel_event=cancel_event)
+
+        if content_hash is None:
+            content_hash = hash_file(video_path)
+
+        with self._hash_lock(content_hash):
+            reused = self._reuse(content_hash, cancel_event)
+            if reused is not None:
+                return reused
+
+            uploaded_file = self._upload(video_path, display_name=f"viralizer-{content_hash[:16]}", cancel_event=cancel_event)
+
+            now = time.time()
+            with self._lock:
+                self._retain_locked(uploaded_file.name)
+                self._load()[content_hash] = {
+                    "name": uploaded_file.name,
+                    "uri": getattr(uploaded_file, "uri", None),
+                    "size": os.path.getsize(video_path),
+                    "uploaded_at": now,
+                    "expires_at": _expiration_timestamp(uploaded_file) or now + self.lifetime,
+                    "last_used": now
+                }
+                evicted = self._evict_locked(now)
+                self._save()
+
+            # 원격 삭제는 네트워크 호출이므로 잠금 밖에서
+            for name in evicted:
+                self._delete_remote(name)
+
+            return uploaded_file
+
+    def release(self, uploaded_file):
+        """
+        분석이 끝난 원격 파일을 반환합니다.
+
+        재사용이 켜져 있으면 원격 파일을 유지하고(만료/LRU 정리 시 삭제),
+        꺼져 있으면 즉시 삭제합니다.
+
+        Args:
+            uploaded_file: get_or_upload 결과
+        """
+        if config.UPLOAD_REUSE_ENABLED:
+            self._unretain(uploaded_file.name)
+            return
+
+        self._delete_remote(uploaded_file.name)
+
+    def evict(self, content_hash: str):
+        """특정 영상의 기록과 원격 파일을 삭제합니다."""
+        with self._lock:
+            entry = self._load().pop(content_hash, None)
+            if entry:
+                self._save()
+
+        if entry:
+            self._delete_remote(entry["name"])
+
+    def purge(self):
+        """모든 기록과 원격 파일을 삭제합니다."""
+        with self._lock:
+            entries = self._load()
+            names = [entry["name"] for entry in entries.values()]
+            entries.clear()
+            self._save()
+
+        for name in names:
+            self._delete_remote(name)
+
+    # ----- 내부 동작 -----
+
+    def _retain_locked(self, name: str):
+        """원격 파일을 사용 중으로 표시합니다 (self._lock 보유 상태에서 호출)."""
+        self._in_use[name] = self._in_use.get(name, 0) + 1
+
+    def _unretain(self, name: str):
+        """원격 파일의 사용 중 표시를 하나 줄입니다."""
+        with self._lock:
+            count = self._in_use.get(name, 0) - 1
+            if count > 0:
+                self._in_use[name] = count
+            else:
+                self._in_use.pop(name, None)
+
+    def _reuse(self, content_hash: str, cancel_event: threading.Event = None):
+        """만료 전의 기록이 있으면 원격 파일 상태를 확인하여 재사용합니다 (없으면 None, 재사용 시 사용 중으로 표시)."""
+        now = time.time()
+
+        with self._lock:
+            entry = self._load().get(content_hash)
+            if entry is None:
+                return None
+            # 상태를 확인하는 동안 다른 작업의 LRU 정리로 삭제되지 않도록 먼저 표시
+            self._retain_locked(entry["name"])
+
+        try:
+            remote_file = self._check_reusable(content_hash, entry, now, cancel_event)
+        except BaseException:
+            self._unretain(entry["name"])
+            raise
+
+        if remote_file is None:
+            self._unretain(entry["name"])
+        return remote_file
+
+    def _check_reusable(self, content_hash: str, entry: dict, now: float, cancel_event: threading.Event = None):
+        """기록의 원격 파일이 만료 전이고 ACTIVE이면 반환합니다 (아니면 기록을 지우고 None)."""
+        if entry["expires_at"] - now <= self.reuse_margin:
+            print(f"⌛ 업로드 기록 만료: {entry['name']}")
+            self.evict(content_hash)
+            return None
+
+        try:
+            remote_file = genai.get_file(entry["name"])
+            if remote_file.state.name == "PROCESSING":
+                remote_file = wait_for_file_active(remote_file, entry.get("size"), cancel_event)
+        except Exception as e:
+            # 서버에서 이미 삭제되었거나 처리 실패한 파일
+            print(f"⚠️  기존 업로드 재사용 불가 ({entry['name']}): {str(e)}")
+            self.evict(content_hash)
+            return None
+
+        if remote_file.state.name != "ACTIVE":
+            self.evict(content_hash)
+            return None
+
+        with self._lock:
+            entry["last_used"] = now
+            self._save()
+
+        print(f"♻️  업로드된 영상 재사용: {remote_file.name} (업로드/처리 생략)")
+        return remote_file
+
+    def _upload(self, video_path: str, display_name: str = None, cancel_event: threading.Event = None):
+        """
+        영상을 업로드용으로 변환(video_transcoder)한 뒤 업로드하고
+        ACTIVE 상태가 될 때까지 대기합니다 (실패 시 원격 파일 삭제).
+        """
+        prepared = transcode_for_upload(video_path)
+        upload_path = prepared["path"]
+        size_bytes = prepared["output_size"]
+
+        print(f"📤 Google AI 서버에 영상 업로드 중...")
+        print(f"   파일: {video_path}")
+        print(f"   크기: {size_bytes / (1024*1024):.2f} MB")
+
+        try:
+            if display_name:
+                uploaded_file = genai.upload_file(path=upload_path, display_name=display_name)
+            else:
+                uploaded_file = genai.upload_file(path=upload_path)
+        finally:
+            if prepared["transcoded"]:
+                try:
+                    os.remove(upload_path)
+                except OSError:
+                    pass
+
+        print(f"✅ 업로드 완료!")
+        print(f"   파일 이름: {uploaded_file.name}")
+        print(f"   URI: {getattr(uploaded_file, 'uri', '')}")
+
+        try:
+            return wait_for_file_active(uploaded_file, size_bytes, cancel_event)
+        except BaseException:
+            self._delete_remote(uploaded_file.name)
+            raise
+
+    def _evict_locked(self, now: float) -> list:
+        """
+        만료된 기록과 LRU 한도를 넘는 기록을 정리합니다 (self._lock 보유 상태에서 호출).
+
+        사용 중인 파일은 한도를 넘어도 남겨 두고 다음 정리 때 다시 확인합니다.
+
+        Returns:
+            삭제 요청할 원격 파일 이름 목록 (호출자가 잠금을 푼 뒤 _delete_remote로 삭제)
+        """
+        entries = self._entries
+        expired = [key for key, entry in entries.items() if entry["expires_at"] <= now]
+        overflow = sorted(
+            (key for key in entries if key not in expired and entries[key]["name"] not in self._in_use),
+            key=lambda key: entries[key]["last_used"]
+        )[:max(0, len(entries) - len(expired) - self.max_files)]
+
+        for key in expired:
+            # 만료된 파일은 서버가 이미 삭제했으므로 기록만 제거
+            entries.pop(key)
+
+        return [entries.pop(key)["name"] for key in overflow]
+
+    @staticmethod
+    def _delete_remote(name: str):
+        """원격 파일을 삭제합니다 (실패해도 예외를 발생시키지 않음)."""
+        try:
+            genai.delete_file(name)
+            print(f"🧹 Google Cloud 파일 삭제 완료: {name}")
+        except Exception as e:
+            print(f"⚠️  Google Cloud 파일 삭제 실패: {str(e)}")
+
+
+UPLOAD_REGISTRY = UploadRegistry()
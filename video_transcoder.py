@@ -0,0 +1,158 @@
+"""
+업로드 전 영상 변환 모듈
+
+Gemini는 영상을 초당 1프레임 수준으로 샘플링하므로 원본 해상도/프레임 수가 필요하지 않습니다.
+업로드 전에 로컬 ffmpeg로 해상도·비트레이트·프레임 수를 낮추고 길이를
+config.MAX_VIDEO_LENGTH로 자르면, 업로드 용량과 서버 처리(PROCESSING) 시간이 함께 줄어듭니다.
+
+ffmpeg가 없거나 변환에 실패하면 원본 파일을 그대로 사용합니다.
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import subprocess
+from typing import Dict, Optional
+import config
+
+
+def build_ffmpeg_command(input_path: str, output_path: str) -> list:
+    """
+    업로드용 저용량 변환 ffmpeg 명령을 구성합니다.
+
+    Args:
+        input_path: 원본 영상 경로
+        output_path: 변환 결과 경로 (.mp4)
+
+    Returns:
+        subprocess에 전달할 명령 리스트
+    """
+    # 원본보다 크게 키우지 않고 짝수 너비 유지
+    video_filter = f"scale=-2:'min({config.TRANSCODE_MAX_HEIGHT},ih)',fps={config.TRANSCODE_FPS}"
+
+    return [
+        "ffmpeg", "-y", "-v", "error",
+        "-i", input_path,
+        "-t", str(config.MAX_VIDEO_LENGTH),
+        "-vf", video_filter,
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", str(config.TRANSCODE_CRF),
+        "-maxrate", config.TRANSCODE_VIDEO_MAXRATE, "-bufsize", config.TRANSCODE_VIDEO_BUFSIZE,
+        "-c:a", "aac", "-b:a", config.TRANSCODE_AUDIO_BITRATE, "-ac", "1",
+        "-movflags", "+faststart",
+        output_path
+    ]
+
+
+def probe_duration(video_path: str) -> Optional[float]:
+    """
+    ffprobe로 영상 길이를 구합니다.
+
+    Args:
+        video_path: 영상 경로
+
+    Returns:
+        길이 (초) 또는 None (ffprobe가 없거나 실패한 경우)
+    """
+    if shutil.which("ffprobe") is None:
+        return None
+
+    try:
+        proc = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", video_path],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        return float(proc.stdout.strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def transcode_for_upload(video_path: str) -> Dict:
+    """
+    영상을 업로드용으로 변환합니다.
+
+    Args:
+        video_path: 원본 영상 경로
+
+    Returns:
+        {
+            "path": 업로드할 파일 경로 (변환본 또는 원본),
+            "transcoded": 변환본 사용 여부 (True면 업로드 후 path 삭제 필요),
+            "original_size": 원본 크기 (바이트),
+            "output_size": 업로드할 파일 크기 (바이트),
+            "elapsed": 변환 소요 시간 (초),
+            "reason": 원본을 사용한 경우 그 이유 (변환본 사용 시 None)
+        }
+    """
+    original_size = os.path.getsize(video_path)
+    result = {
+        "path": video_path,
+        "transcoded": False,
+        "original_size": original_size,
+        "output_size": original_size,
+        "elapsed": 0.0,
+        "reason": None
+    }
+
+    if not config.TRANSCODE_ENABLED:
+        result["reason"] = "변환 비활성화"
+        return result
+
+    if shutil.which("ffmpeg") is None:
+        result["reason"] = "ffmpeg 없음"
+        print("⚠️  ffmpeg를 찾을 수 없어 원본 영상을 업로드합니다")
+        return result
+
+    fd, output_path = tempfile.mkstemp(prefix="viralizer_upload_", suffix=".mp4")
+    os.close(fd)
+
+    print(f"🎞️  업로드용 영상 변환 중... (최대 {config.TRANSCODE_MAX_HEIGHT}p, {config.TRANSCODE_FPS}fps, {config.MAX_VIDEO_LENGTH}초)")
+    start = time.perf_counter()
+
+    try:
+        proc = subprocess.run(
+            build_ffmpeg_command(video_path, output_path),
+            capture_output=True,
+            text=True,
+            timeout=config.TRANSCODE_TIMEOUT
+        )
+        result["elapsed"] = time.perf_counter() - start
+
+        if proc.returncode != 0:
+            raise Exception(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}")
+
+        output_size = os.path.getsize(output_path)
+
+        if output_size == 0:
+            raise Exception("변환 결과가 비어 있습니다")
+
+        # 변환본이 더 크면(이미 저용량인 영상) 원본 사용
+        # 단, 원본이 MAX_VIDEO_LENGTH보다 길면(또는 길이를 알 수 없으면) 길이 제한을 지키기 위해 잘라낸 변환본 사용
+        if output_size >= original_size:
+            duration = probe_duration(video_path)
+            if duration is not None and duration <= config.MAX_VIDEO_LENGTH:
+                os.remove(output_path)
+                result["reason"] = "변환본이 원본보다 작지 않음"
+                print(f"   변환 생략: 원본이 이미 충분히 작습니다 ({original_size / (1024*1024):.2f} MB)")
+                return result
+
+            print(f"   변환본이 원본보다 크지만 {config.MAX_VIDEO_LENGTH}초로 자른 변환본을 사용합니다 (원본 길이: {f'{duration:.0f}초' if duration is not None else '알 수 없음'})")
+
+    except Exception as e:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        result["elapsed"] = time.perf_counter() - start
+        result["reason"] = f"변환 실패: {str(e)}"
+        print(f"⚠️  영상 변환 실패, 원본을 업로드합니다: {str(e)}")
+        return result
+
+    result.update(path=output_path, transcoded=True, output_size=output_size)
+
+    print(f"✅ 영상 변환 완료 ({result['elapsed']:.1f}초)")
+    reduction = 100 * (1 - output_size / original_size)
+    print(f"   크기: {original_size / (1024*1024):.2f} MB → {output_size / (1024*1024):.2f} MB "
+          f"({f'{reduction:.0f}% 감소' if reduction >= 0 else f'{-reduction:.0f}% 증가'})")
+
+    return result
@@ -7,56 +7,323 @@ OpenCV로 로컬 파일에서 프레임을 추출합니다.
 
 import yt_dlp
 import cv2
-import tempfile
+import io
+import re
 import os
+import copy
+import time
 from PIL import Image
 from typing import List, Dict, Optional
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import config
-
-
-def download_video_for_ai(youtube_url: str) -> str:
+from frame_selector import select_keyframes
+from media_workspace import MEDIA_WORKSPACE, MediaJob
+
+
+YOUTUBE_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{11}')
+
+# 모든 yt-dlp 호출에 공통으로 쓰는 옵션
+YDL_BASE_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'socket_timeout': 30,
+    # 보안 우회 설정 (403 Forbidden 방지)
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'referer': 'https://www.google.com/',
+    'nocheckcertificate': True,
+    'geo_bypass': True,
+    # 추가 우회 옵션
+    'extractor_args': {'youtube': {'skip': ['dash', 'hls']}},
+}
+
+# AI 분석용 다운로드 옵션
+YDL_DOWNLOAD_OPTS = {
+    # 가장 낮은 화질 선택 (용량 최소화)
+    'format': 'worst[ext=mp4]/worst/bestvideo[height<=360][ext=mp4]/bestvideo[height<=360]',
+    # 다운로드 속도 최적화
+    'concurrent_fragment_downloads': 4,
+    'http_chunk_size': 10485760,  # 10MB chunks
+}
+
+# 스트림 URL 포맷 (Shorts는 낮은 해상도 우선)
+STREAM_FORMAT = 'best[ext=mp4]/best'
+SHORTS_STREAM_FORMAT = 'worst[ext=mp4]/worst/best[ext=mp4]/best'
+
+# 저장하지 않는 info dict 항목 (용량이 크고 메타데이터 조회에 쓰이지 않음)
+INFO_DROP_KEYS = ('thumbnails', 'subtitles', 'automatic_captions', 'heatmap', 'requested_subtitles')
+
+_frame_pool = None
+_frame_pool_lock = threading.Lock()
+
+
+def parse_youtube_video_id(youtube_url: str) -> Optional[str]:
     """
-    yt-dlp를 사용하여 영상을 가장 낮은 화질로 다운로드합니다.
-    AI 분석용이므로 파일 용량을 최소화하여 속도를 극대화합니다.
+    YouTube URL에서 영상 ID를 추출합니다 (watch, youtu.be, shorts, embed 형식).
 
     Args:
         youtube_url: YouTube 비디오 URL
 
     Returns:
-        다운로드된 mp4 파일의 경로
+        11자리 영상 ID 또는 None
+    """
+    parsed = urlparse(youtube_url.strip())
+    host = parsed.netloc.lower().split(':')[0]
+
+    if host.endswith('youtu.be'):
+        candidate = parsed.path.lstrip('/').split('/')[0]
+    elif host.endswith('youtube.com'):
+        parts = [part for part in parsed.path.split('/') if part]
+        if parts[:1] == ['watch']:
+            candidate = parse_qs(parsed.query).get('v', [''])[0]
+        elif len(parts) >= 2 and parts[0] in ('shorts', 'embed', 'live', 'v'):
+            candidate = parts[1]
+        else:
+            return None
+    else:
+        return None
 
-    Raises:
-        Exception: 다운로드 실패 시
+    return candidate if YOUTUBE_ID_PATTERN.fullmatch(candidate or '') else None
+
+
+def _cacheable_info(info: dict) -> dict:
+    """yt-dlp info dict를 JSON으로 저장할 수 있게 정리합니다 (용량이 큰 자막/썸네일 목록 제외)."""
+    info = yt_dlp.YoutubeDL.sanitize_info(info)
+    for key in INFO_DROP_KEYS:
+        info.pop(key, None)
+    return info
+
+
+def _stream_url_valid(url: str) -> bool:
+    """스트림 URL의 expire 파라미터가 config.MEDIA_STREAM_URL_MARGIN초 이상 남았는지 확인합니다."""
+    expire = parse_qs(urlparse(url).query).get('expire', [''])[0]
+    if not expire.isdigit():
+        return False  # 만료 시각을 알 수 없으면 재사용하지 않음
+    return int(expire) - time.time() > config.MEDIA_STREAM_URL_MARGIN
+
+
+def _pick_cached_stream_url(info: dict, worst: bool = False) -> Optional[str]:
     """
-    # 임시 파일 경로 생성
-    temp_dir = tempfile.gettempdir()
-    temp_video_path = os.path.join(temp_dir, f"youtube_ai_{os.getpid()}.mp4")
-
-    ydl_opts = {
-        # 가장 낮은 화질 선택 (용량 최소화)
-        'format': 'worst[ext=mp4]/worst/bestvideo[height<=360][ext=mp4]/bestvideo[height<=360]',
-        'outtmpl': temp_video_path,
-        'quiet': True,
-        'no_warnings': True,
-        # 다운로드 속도 최적화
-        'concurrent_fragment_downloads': 4,
-        'http_chunk_size': 10485760,  # 10MB chunks
-        # 보안 우회 설정 (403 Forbidden 방지)
-        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'referer': 'https://www.google.com/',
-        'nocheckcertificate': True,
-        'geo_bypass': True,
-        # 추가 우회 옵션
-        'extractor_args': {'youtube': {'skip': ['dash', 'hls']}},
-    }
+    저장된 info dict의 포맷 목록에서 get_youtube_info와 같은 기준으로 스트림 URL을 고릅니다.
 
-    try:
-        print(f"📥 YouTube 영상 다운로드 중 (가장 낮은 화질)...")
-        print(f"   URL: {youtube_url}")
+    영상과 음성이 모두 있는 포맷 중 mp4를 우선하여 해상도가 가장 높은(worst면 가장 낮은) 것을 선택하며,
+    URL이 곧 만료되면 None을 반환합니다.
+    """
+    formats = [
+        fmt for fmt in info.get('formats') or []
+        if fmt.get('url') and fmt.get('vcodec') != 'none' and fmt.get('acodec') != 'none'
+    ]
+    if not formats:
+        return None
+
+    mp4 = [fmt for fmt in formats if fmt.get('ext') == 'mp4']
+    candidates = mp4 or formats
+    chosen = (min if worst else max)(candidates, key=lambda fmt: fmt.get('height') or 0)
+
+    return chosen['url'] if _stream_url_valid(chosen['url']) else None
+
+
+def _friendly_error(error_msg: str, action: str) -> Exception:
+    """yt-dlp 에러 메시지를 사용자에게 보여줄 한국어 메시지로 바꿉니다."""
+    if "403" in error_msg or "Forbidden" in error_msg or "HTTP Error 403" in error_msg:
+        return Exception(
+            "🚫 유튜브의 일시적인 차단으로 URL 분석이 불가능합니다.\n\n"
+            "💡 해결 방법:\n"
+            "1. 영상 파일을 직접 업로드해 주세요 (아래 파일 업로드 기능 이용)\n"
+            "2. 잠시 후 다시 시도해 주세요\n"
+            "3. 다른 YouTube 영상을 시도해 주세요"
+        )
+    elif "Video unavailable" in error_msg:
+        return Exception("영상을 사용할 수 없습니다. 영상이 삭제되었거나 비공개일 수 있습니다.")
+    elif "Sign in to confirm your age" in error_msg or "age" in error_msg.lower():
+        return Exception("연령 제한이 있는 영상입니다. 다른 영상을 시도해주세요.")
+    elif "This video is not available" in error_msg or "not available" in error_msg.lower():
+        return Exception("이 영상은 사용할 수 없습니다. 지역 제한이나 저작권 문제일 수 있습니다.")
+    elif "Private video" in error_msg:
+        return Exception("비공개 영상입니다. 공개 영상을 시도해주세요.")
+    elif "members-only" in error_msg.lower():
+        return Exception("멤버십 전용 영상입니다. 일반 공개 영상을 시도해주세요.")
+    else:
+        return Exception(f"YouTube {action} 실패: {error_msg}")
+
+
+class YouTubeJob:
+    """
+    YouTube 영상 하나에 대한 작업
+
+    페이지/플레이어 분석(extract_info)은 작업당 한 번만 실행하고, 그 결과를 메타데이터 조회,
+    스트림 URL 선택, 다운로드, 프레임 추출이 함께 사용합니다. 포맷 선택과 다운로드는 이미 분석된
+    info dict에 process_ie_result를 적용하므로 다시 분석하지 않습니다.
+    분석 결과와 영상은 작업 공간(MEDIA_WORKSPACE)에 영상 ID별로 저장되어, 저장된 항목이 있으면
+    메타데이터 조회와 다운로드는 분석 없이 처리됩니다.
+
+    with 문으로 사용하면 블록을 벗어날 때 close()가 호출됩니다.
+
+    Attributes:
+        youtube_url: 요청된 URL
+        video_id: YouTube 영상 ID (인식할 수 없는 URL이면 None)
+        is_shorts: Shorts URL 여부
+    """
+
+    def __init__(self, youtube_url: str, job: Optional[MediaJob] = None):
+        self.youtube_url = youtube_url
+        self.video_id = parse_youtube_video_id(youtube_url)
+        self.is_shorts = '/shorts/' in youtube_url
+
+        self._media_job = job
+        self._owns_media_job = job is None
+        self._info = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """분석에 사용할 URL (Shorts 등은 일반 watch URL로 변환)"""
+        if self.video_id:
+            return f"https://www.youtube.com/watch?v={self.video_id}"
+        return self.youtube_url
+
+    @property
+    def media_job(self) -> MediaJob:
+        """영상 파일을 보관하는 작업 공간 작업 (최초 사용 시 생성)"""
+        if self._media_job is None:
+            self._media_job = MEDIA_WORKSPACE.start_job()
+        return self._media_job
+
+    @property
+    def info(self) -> dict:
+        """
+        포맷 선택 전의 info dict (최초 접근 시 한 번만 extract_info 실행)
+
+        Raises:
+            Exception: 정보 추출 실패 시
+        """
+        with self._lock:
+            if self._info is None:
+                print(f"🔍 YouTube 비디오 정보 추출 중...")
+                print(f"   URL: {self.url}")
+
+                with yt_dlp.YoutubeDL(YDL_BASE_OPTS) as ydl:
+                    self._info = ydl.extract_info(self.url, download=False, process=False)
+
+                if self.video_id:
+                    MEDIA_WORKSPACE.save_info(self.video_id, _cacheable_info(self._info))
+
+            return self._info
+
+    def _process(self, download: bool, **opts) -> dict:
+        """이미 분석된 info dict의 사본에 포맷 선택(및 다운로드)을 적용합니다."""
+        info = copy.deepcopy(self.info)
+        with yt_dlp.YoutubeDL({**YDL_BASE_OPTS, **opts}) as ydl:
+            return ydl.process_ie_result(info, download=download)
+
+    def metadata(self) -> Dict[str, any]:
+        """
+        메타데이터를 반환합니다 (분석 결과나 저장된 정보가 있으면 네트워크 접근 없음).
+
+        Returns:
+            메타데이터 딕셔너리 (title, duration, uploader, view_count, upload_date, description)
+        """
+        info = self._info
+        if info is None and self.video_id:
+            info = MEDIA_WORKSPACE.load_info(self.video_id)
+            if info is not None:
+                print(f"♻️  저장된 영상 정보 사용: {self.video_id}")
+        if info is None:
+            info = self.info
+
+        return {
+            'title': info.get('title', 'Unknown'),
+            'duration': info.get('duration', 0),
+            'uploader': info.get('uploader', 'Unknown'),
+            'view_count': info.get('view_count', 0),
+            'upload_date': info.get('upload_date', ''),
+            'description': info.get('description', ''),
+        }
+
+    def stream_info(self) -> Dict[str, any]:
+        """
+        재생용 스트림 URL과 기본 정보를 반환합니다 (Shorts는 낮은 해상도 우선).
+
+        Returns:
+            비디오 정보 딕셔너리 (url, title, duration, width, height)
+        """
+        # 저장된 정보에 아직 만료되지 않은 스트림 URL이 있으면 네트워크 없이 반환
+        cached = MEDIA_WORKSPACE.load_info(self.video_id) if self._info is None and self.video_id else None
+        cached_url = _pick_cached_stream_url(cached, worst=self.is_shorts) if cached else None
+
+        if cached_url:
+            print(f"♻️  저장된 영상 정보 사용: {self.video_id}")
+            info, video_url = cached, cached_url
+        else:
+            # Shorts 최적화 포맷 (낮은 해상도, 세로 영상 우선)
+            if self.is_shorts:
+                print(f"📱 Shorts 모드: 낮은 해상도 우선 선택")
+
+            info = self._process(False, format=SHORTS_STREAM_FORMAT if self.is_shorts else STREAM_FORMAT)
+
+            # 디버깅: 사용 가능한 포맷 출력
+            if 'formats' in info:
+                print(f"   사용 가능한 포맷 수: {len(info['formats'])}")
+                # 처음 3개 포맷만 출력
+                for i, fmt in enumerate(info['formats'][:3]):
+                    print(f"   포맷 {i+1}: {fmt.get('format_id')} - {fmt.get('ext')} ({fmt.get('resolution', 'N/A')})")
+
+            # 비디오 URL 찾기
+            video_url = info.get('url')
+            if not video_url:
+                # 대체 URL 찾기
+                for fmt in info.get('formats') or []:
+                    if fmt.get('url'):
+                        video_url = fmt['url']
+                        print(f"   대체 URL 사용: {fmt.get('format_id')}")
+                        break
+
+                if not video_url:
+                    raise Exception("비디오 URL을 찾을 수 없습니다")
+
+        duration = info.get('duration', 0)
+
+        print(f"✅ 비디오 정보 추출 완료")
+        print(f"   제목: {info.get('title', 'Unknown')}")
+        print(f"   길이: {duration}초")
+        print(f"   업로더: {info.get('uploader', 'Unknown')}")
+
+        return {
+            'url': video_url,
+            'title': info.get('title', 'Unknown'),
+            'duration': duration,
+            'width': info.get('width', 0),
+            'height': info.get('height', 0),
+        }
+
+    def download(self) -> str:
+        """
+        가장 낮은 화질로 영상을 다운로드합니다 (저장된 영상이 있으면 분석 없이 재사용).
+
+        Returns:
+            mp4 파일 경로 (작업이 끝날 때까지 유지, 직접 삭제하지 말 것)
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=True)
+        Raises:
+            Exception: 다운로드 실패 시
+        """
+        if self.video_id:
+            return self.media_job.acquire_video(self.video_id, self._download_to)
+
+        video_path = self.media_job.path("video.mp4")
+        if not os.path.exists(video_path):
+            self._download_to(video_path)
+        return video_path
+
+    def _download_to(self, temp_video_path: str):
+        """분석된 info dict에서 다운로드용 포맷을 골라 temp_video_path에 저장합니다."""
+        try:
+            print(f"📥 YouTube 영상 다운로드 중 (가장 낮은 화질)...")
+            print(f"   URL: {self.url}")
+
+            info = self._process(True, **YDL_DOWNLOAD_OPTS, outtmpl=temp_video_path)
 
             print(f"✅ 다운로드 완료!")
             print(f"   제목: {info.get('title', 'Unknown')}")
@@ -67,42 +334,74 @@ def download_video_for_ai(youtube_url: str) -> str:
                 file_size_mb = os.path.getsize(temp_video_path) / (1024 * 1024)
                 print(f"   파일 크기: {file_size_mb:.2f} MB")
                 print(f"   저장 경로: {temp_video_path}")
-                return temp_video_path
             else:
                 raise Exception("다운로드된 파일을 찾을 수 없습니다")
 
-    except Exception as e:
-        error_msg = str(e)
-        print(f"\n❌ 다운로드 실패: {error_msg}\n")
+        except Exception as e:
+            error_msg = str(e)
+            print(f"\n❌ 다운로드 실패: {error_msg}\n")
 
-        # 에러 파일이 있으면 삭제
-        if os.path.exists(temp_video_path):
-            try:
-                os.remove(temp_video_path)
-            except:
-                pass
-
-        # 더 자세한 에러 메시지
-        if "403" in error_msg or "Forbidden" in error_msg or "HTTP Error 403" in error_msg:
-            raise Exception(
-                "🚫 유튜브의 일시적인 차단으로 URL 분석이 불가능합니다.\n\n"
-                "💡 해결 방법:\n"
-                "1. 영상 파일을 직접 업로드해 주세요 (아래 파일 업로드 기능 이용)\n"
-                "2. 잠시 후 다시 시도해 주세요\n"
-                "3. 다른 YouTube 영상을 시도해 주세요"
-            )
-        elif "Video unavailable" in error_msg:
-            raise Exception("영상을 사용할 수 없습니다. 영상이 삭제되었거나 비공개일 수 있습니다.")
-        elif "Sign in to confirm your age" in error_msg or "age" in error_msg.lower():
-            raise Exception("연령 제한이 있는 영상입니다. 다른 영상을 시도해주세요.")
-        elif "This video is not available" in error_msg or "not available" in error_msg.lower():
-            raise Exception("이 영상은 사용할 수 없습니다. 지역 제한이나 저작권 문제일 수 있습니다.")
-        elif "Private video" in error_msg:
-            raise Exception("비공개 영상입니다. 공개 영상을 시도해주세요.")
-        elif "members-only" in error_msg.lower():
-            raise Exception("멤버십 전용 영상입니다. 일반 공개 영상을 시도해주세요.")
-        else:
-            raise Exception(f"YouTube 다운로드 실패: {error_msg}")
+            # 에러 파일이 있으면 삭제
+            if os.path.exists(temp_video_path):
+                try:
+                    os.remove(temp_video_path)
+                except:
+                    pass
+
+            raise _friendly_error(error_msg, "다운로드")
+
+    def extract_frames(self, num_frames: int = None) -> tuple[List[Image.Image], str]:
+        """
+        이 작업의 영상으로 프레임을 추출합니다 (extract_frames_from_youtube 참고).
+
+        Returns:
+            (PIL.Image 객체 리스트, 영상 파일 경로)
+        """
+        return extract_frames_from_youtube(self.youtube_url, num_frames, youtube_job=self)
+
+    def close(self):
+        """작업 공간 작업을 종료합니다 (직접 만든 경우에만, 여러 번 호출해도 안전)."""
+        if self._owns_media_job and self._media_job is not None:
+            self._media_job.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def download_video_for_ai(youtube_url: str, job: Optional[MediaJob] = None) -> str:
+    """
+    yt-dlp를 사용하여 영상을 가장 낮은 화질로 다운로드합니다.
+    AI 분석용이므로 파일 용량을 최소화하여 속도를 극대화합니다.
+
+    영상은 작업 공간(MEDIA_WORKSPACE)의 공용 저장소에 영상 ID별로 info dict와 함께 보관되어,
+    같은 영상을 참조하는 다른 작업은 (Shorts/watch URL 구분 없이) 다시 다운로드하지 않습니다.
+    메타데이터도 필요하면 YouTubeJob을 사용하세요 (정보 추출을 한 번만 실행).
+
+    Args:
+        youtube_url: YouTube 비디오 URL
+        job: 영상을 사용할 작업 (None이면 새로 만들고, 사용 후 MEDIA_WORKSPACE.release(경로)로 종료)
+
+    Returns:
+        다운로드된 mp4 파일의 경로 (직접 삭제하지 말 것)
+
+    Raises:
+        Exception: 다운로드 실패 시
+    """
+    youtube_job = YouTubeJob(youtube_url, job)
+
+    try:
+        video_path = youtube_job.download()
+    except Exception:
+        youtube_job.close()
+        raise
+
+    if job is None:
+        MEDIA_WORKSPACE.detach(youtube_job.media_job, video_path)
+
+    return video_path
 
 
 def get_youtube_info(youtube_url: str) -> Dict[str, any]:
@@ -118,89 +417,124 @@ def get_youtube_info(youtube_url: str) -> Dict[str, any]:
     Raises:
         Exception: 정보 추출 실패 시
     """
-    # Shorts 감지
-    is_shorts = '/shorts/' in youtube_url
+    try:
+        return YouTubeJob(youtube_url).stream_info()
 
-    # Shorts 최적화 포맷 (낮은 해상도, 세로 영상 우선)
-    if is_shorts:
-        format_str = 'worst[ext=mp4]/worst/best[ext=mp4]/best'
-        print(f"📱 Shorts 모드: 낮은 해상도 우선 선택")
-    else:
-        format_str = 'best[ext=mp4]/best'
-
-    ydl_opts = {
-        'format': format_str,
-        'quiet': False,  # 디버깅을 위해 False로 변경
-        'no_warnings': False,  # 경고 메시지 출력
-        'extract_flat': False,
-        'socket_timeout': 30,
-        'ignoreerrors': False,  # 에러를 명확히 표시
-        # 추가 옵션
-        'geo_bypass': True,  # 지역 제한 우회 시도
-        'nocheckcertificate': True,  # SSL 인증서 검사 무시
-    }
+    except Exception as e:
+        error_msg = str(e)
+
+        print(f"\n❌ 에러 발생: {error_msg}\n")
+
+        raise _friendly_error(error_msg, "정보 추출")
+
+
+# Skip-and-Retry: 비어있는 프레임이면 0, +30, +60, +90 프레임씩 앞으로 이동
+RETRY_OFFSETS = [0, 30, 60, 90]
+
+
+def _frame_to_image(frame) -> Optional[Image.Image]:
+    """OpenCV BGR 프레임을 PIL Image로 변환합니다 (비어있으면 None)."""
+    if frame is None or frame.size == 0:
+        return None
+
+    # BGR → RGB 변환 후 PIL Image로 변환
+    return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+
+def _frame_to_jpeg(frame) -> Optional[bytes]:
+    """OpenCV BGR 프레임을 JPEG 바이트로 인코딩합니다 (워커 → 메인 프로세스 전달용)."""
+    if frame is None or frame.size == 0:
+        return None
+
+    ok, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, config.FRAME_JPEG_QUALITY])
+    return buffer.tobytes() if ok else None
+
+
+def _jpeg_to_image(data: Optional[bytes]) -> Optional[Image.Image]:
+    """JPEG 바이트를 PIL Image로 디코딩합니다."""
+    if not data:
+        return None
+
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def extract_frames_from_video(video_path: str, frame_positions: List[int], skip_retry: bool = True, verbose: bool = False) -> List[Optional[Image.Image]]:
+    """
+    VideoCapture를 한 번만 열고 한 번의 순방향 탐색으로 여러 프레임을 추출합니다.
+
+    위치를 정렬한 뒤 앞으로 진행하면서, 다음 목표까지의 거리가
+    config.FRAME_SEEK_THRESHOLD_SECONDS 이하면 grab()으로 건너뛰고(디코딩만, 색 변환 없음)
+    그보다 멀면 CAP_PROP_POS_FRAMES로 탐색합니다. 목표 위치에서만 retrieve()로 이미지를 꺼냅니다.
+    탐색은 매번 직전 키프레임부터 다시 디코딩하므로, 간격이 좁은 위치들(Skip-and-Retry 포함)은
+    grab()이 빠르고 간격이 넓으면 탐색이 빠릅니다. 어느 쪽이든 캡처 열기는 한 번뿐입니다.
+
+    Args:
+        video_path: 로컬 비디오 파일 경로
+        frame_positions: 추출할 프레임 위치 리스트 (순서 무관)
+        skip_retry: Skip-and-Retry 활성화 여부 (기본값: True)
+        verbose: 위치별 진행 상황 출력 여부 (기본값: False)
+
+    Returns:
+        frame_positions와 같은 순서의 PIL.Image 리스트 (실패한 위치는 None)
+    """
+    return _sweep_frames(video_path, frame_positions, _frame_to_image, skip_retry, verbose)
+
+
+def _sweep_frames(video_path: str, frame_positions: List[int], convert, skip_retry: bool = True, verbose: bool = False) -> list:
+    """extract_frames_from_video의 구현부. 목표 프레임마다 convert(BGR 프레임)의 결과를 담습니다."""
+    results = [None] * len(frame_positions)
+
+    cap = cv2.VideoCapture(video_path)
+
+    if not cap.isOpened():
+        return results
+
+    offsets = RETRY_OFFSETS if skip_retry else [0]
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    seek_threshold = int(fps * config.FRAME_SEEK_THRESHOLD_SECONDS)
+    next_position = 0  # 다음 grab()이 읽을 프레임 번호
 
     try:
-        print(f"🔍 YouTube 비디오 정보 추출 중...")
-        print(f"   URL: {youtube_url}")
+        for index in sorted(range(len(frame_positions)), key=lambda k: frame_positions[k]):
+            frame_position = frame_positions[index]
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
+            if verbose:
+                print(f"   [{index+1}/{len(frame_positions)}] 프레임 {frame_position} 추출 중...", end=" ")
 
-            # 디버깅: 사용 가능한 포맷 출력
-            if 'formats' in info:
-                print(f"   사용 가능한 포맷 수: {len(info['formats'])}")
-                # 처음 3개 포맷만 출력
-                for i, fmt in enumerate(info['formats'][:3]):
-                    print(f"   포맷 {i+1}: {fmt.get('format_id')} - {fmt.get('ext')} ({fmt.get('resolution', 'N/A')})")
+            for offset in offsets:
+                target = frame_position + offset
 
-            # 비디오 URL 찾기
-            video_url = info.get('url')
-            if not video_url:
-                # 대체 URL 찾기
-                if 'formats' in info and len(info['formats']) > 0:
-                    for fmt in info['formats']:
-                        if fmt.get('url'):
-                            video_url = fmt['url']
-                            print(f"   대체 URL 사용: {fmt.get('format_id')}")
-                            break
+                if offset > 0 and verbose:
+                    print(f"\n      ↻ Skip-and-Retry: +{offset} 프레임 앞으로...", end=" ")
 
-                if not video_url:
-                    raise Exception("비디오 URL을 찾을 수 없습니다")
+                # 뒤로 가야 하거나(이전 위치의 재시도가 지나침) 멀리 떨어져 있으면 탐색, 가까우면 grab()
+                if target < next_position or target - next_position > seek_threshold:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                    next_position = target
 
-            duration = info.get('duration', 0)
+                while next_position < target and cap.grab():
+                    next_position += 1
 
-            print(f"✅ 비디오 정보 추출 완료")
-            print(f"   제목: {info.get('title', 'Unknown')}")
-            print(f"   길이: {duration}초")
-            print(f"   업로더: {info.get('uploader', 'Unknown')}")
+                if next_position < target or not cap.grab():
+                    break  # 영상 끝
 
-            return {
-                'url': video_url,
-                'title': info.get('title', 'Unknown'),
-                'duration': duration,
-                'width': info.get('width', 0),
-                'height': info.get('height', 0),
-            }
+                next_position += 1
+                ret, frame = cap.retrieve()
+                image = convert(frame) if ret else None
 
-    except Exception as e:
-        error_msg = str(e)
+                if image is not None:
+                    results[index] = image
+                    break
 
-        print(f"\n❌ 에러 발생: {error_msg}\n")
+            if verbose:
+                print("✅" if results[index] is not None else "❌ 모든 재시도 실패")
 
-        # 더 자세한 에러 메시지
-        if "Video unavailable" in error_msg:
-            raise Exception("영상을 사용할 수 없습니다. 영상이 삭제되었거나 비공개일 수 있습니다.")
-        elif "Sign in to confirm your age" in error_msg or "age" in error_msg.lower():
-            raise Exception("연령 제한이 있는 영상입니다. 다른 영상을 시도해주세요.")
-        elif "This video is not available" in error_msg or "not available" in error_msg.lower():
-            raise Exception("이 영상은 사용할 수 없습니다. 지역 제한이나 저작권 문제일 수 있습니다.")
-        elif "Private video" in error_msg:
-            raise Exception("비공개 영상입니다. 공개 영상을 시도해주세요.")
-        elif "members-only" in error_msg.lower():
-            raise Exception("멤버십 전용 영상입니다. 일반 공개 영상을 시도해주세요.")
-        else:
-            raise Exception(f"YouTube 정보 추출 실패: {error_msg}")
+        return results
+
+    finally:
+        cap.release()
 
 
 def extract_frame_from_video(video_path: str, frame_position: int, skip_retry: bool = True) -> Optional[Image.Image]:
@@ -208,6 +542,8 @@ def extract_frame_from_video(video_path: str, frame_position: int, skip_retry: b
     OpenCV를 사용하여 로컬 비디오 파일에서 특정 프레임을 추출합니다.
     Skip-and-Retry: 비어있는 프레임을 만나면 앞으로 이동하여 재시도
 
+    여러 프레임이 필요하면 캡처를 한 번만 여는 extract_frames_from_video를 사용하세요.
+
     Args:
         video_path: 로컬 비디오 파일 경로
         frame_position: 프레임 위치 (번호)
@@ -216,39 +552,89 @@ def extract_frame_from_video(video_path: str, frame_position: int, skip_retry: b
     Returns:
         PIL.Image 객체 또는 None
     """
-    cap = cv2.VideoCapture(video_path)
+    return extract_frames_from_video(video_path, [frame_position], skip_retry=skip_retry)[0]
 
-    if not cap.isOpened():
-        return None
 
-    try:
-        # Skip-and-Retry: 0, +30, +60, +90 프레임씩 앞으로 이동
-        retry_offsets = [0, 30, 60, 90] if skip_retry else [0]
+def frame_workers() -> int:
+    """프레임 디코딩 워커 수 (config.FRAME_PARALLEL_WORKERS, None이면 CPU 코어 수)"""
+    return config.FRAME_PARALLEL_WORKERS or os.cpu_count() or 1
 
-        for offset in retry_offsets:
-            adjusted_position = frame_position + offset
 
-            if offset > 0:
-                print(f"\n      ↻ Skip-and-Retry: +{offset} 프레임 앞으로...", end=" ")
+def get_frame_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    프레임 디코딩용 공용 프로세스 풀을 반환합니다 (최초 호출 시 생성).
 
-            # 프레임 위치 설정
-            cap.set(cv2.CAP_PROP_POS_FRAMES, adjusted_position)
-            ret, frame = cap.read()
+    Streamlit은 여러 스레드에서 실행되므로 fork 대신 spawn으로 워커를 시작합니다.
+    워커는 프로세스가 끝날 때까지 재사용되어 시작 비용은 한 번만 발생합니다.
 
-            if ret and frame is not None and frame.size > 0:
-                # BGR → RGB 변환
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                # PIL Image로 변환
-                pil_image = Image.fromarray(frame_rgb)
-                return pil_image
+    Returns:
+        ProcessPoolExecutor (워커 수가 1 이하면 None)
+    """
+    global _frame_pool
 
+    workers = frame_workers()
+    if workers <= 1:
         return None
 
-    finally:
-        cap.release()
+    if _frame_pool is None:
+        with _frame_pool_lock:
+            if _frame_pool is None:
+                _frame_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+
+    return _frame_pool
+
+
+def _decode_segment(video_path: str, frame_positions: List[int], skip_retry: bool) -> List[Optional[bytes]]:
+    """워커 프로세스에서 자기 VideoCapture로 한 구간의 프레임을 JPEG 바이트로 추출합니다."""
+    return _sweep_frames(video_path, frame_positions, _frame_to_jpeg, skip_retry)
 
 
-def extract_frames_from_youtube(youtube_url: str, num_frames: int = None) -> tuple[List[Image.Image], str]:
+def extract_frames_parallel(video_path: str, frame_positions: List[int], skip_retry: bool = True, executor: Optional[ProcessPoolExecutor] = None) -> List[Optional[Image.Image]]:
+    """
+    정렬된 위치를 워커 수만큼 연속 구간으로 나누어 여러 프로세스에서 동시에 추출합니다.
+
+    각 워커는 자기 VideoCapture를 열어 구간을 순방향으로 훑고, 프레임을 PIL 객체 대신
+    JPEG 바이트로 돌려주어 프로세스 간 전달 비용을 줄입니다.
+    풀을 사용할 수 없으면 extract_frames_from_video로 순차 추출합니다.
+
+    Args:
+        video_path: 로컬 비디오 파일 경로
+        frame_positions: 추출할 프레임 위치 리스트 (순서 무관)
+        skip_retry: Skip-and-Retry 활성화 여부 (기본값: True)
+        executor: 사용할 프로세스 풀 (None이면 get_frame_pool())
+
+    Returns:
+        frame_positions와 같은 순서의 PIL.Image 리스트 (실패한 위치는 None)
+    """
+    executor = executor or get_frame_pool()
+    if executor is None or len(frame_positions) <= 1:
+        return extract_frames_from_video(video_path, frame_positions, skip_retry)
+
+    order = sorted(range(len(frame_positions)), key=lambda k: frame_positions[k])
+    # 구간마다 연속된 위치를 맡도록 정렬 순서를 균등하게 자름
+    size = -(-len(order) // min(frame_workers(), len(order)))
+    segments = [order[i:i + size] for i in range(0, len(order), size)]
+
+    try:
+        futures = [
+            executor.submit(_decode_segment, video_path, [frame_positions[k] for k in segment], skip_retry)
+            for segment in segments
+        ]
+        results = [None] * len(frame_positions)
+        for segment, future in zip(segments, futures):
+            for k, data in zip(segment, future.result()):
+                results[k] = _jpeg_to_image(data)
+        return results
+
+    except Exception as e:
+        print(f"   ⚠️  병렬 추출 실패, 순차 추출로 전환합니다: {str(e)}")
+        return extract_frames_from_video(video_path, frame_positions, skip_retry)
+
+
+def extract_frames_from_youtube(youtube_url: str, num_frames: int = None, youtube_job: Optional[YouTubeJob] = None) -> tuple[List[Image.Image], str]:
     """
     YouTube URL에서 프레임을 추출합니다.
     yt-dlp로 가장 낮은 화질의 영상을 다운로드하고 OpenCV로 프레임을 추출합니다.
@@ -256,9 +642,11 @@ def extract_frames_from_youtube(youtube_url: str, num_frames: int = None) -> tup
     Args:
         youtube_url: YouTube 비디오 URL
         num_frames: 추출할 프레임 수 (기본값: config.MAX_FRAMES)
+        youtube_job: 이미 정보를 추출한 작업 (지정하면 분석 결과를 재사용하고, 영상은 작업 종료 시 정리)
 
     Returns:
-        PIL.Image 객체 리스트
+        (PIL.Image 객체 리스트, 영상 파일 경로)
+        youtube_job 없이 호출한 경우 사용 후 MEDIA_WORKSPACE.release(영상 파일 경로)를 호출합니다
 
     Raises:
         Exception: 프레임 추출 실패 시
@@ -284,7 +672,7 @@ def extract_frames_from_youtube(youtube_url: str, num_frames: int = None) -> tup
 
     try:
         # 1. 영상 다운로드 (가장 낮은 화질)
-        video_path = download_video_for_ai(youtube_url)
+        video_path = youtube_job.download() if youtube_job else download_video_for_ai(youtube_url)
 
         # 2. OpenCV로 비디오 열기
         print(f"\n🎬 {num_frames}개 프레임 추출 중 (OpenCV 사용)...")
@@ -310,31 +698,38 @@ def extract_frames_from_youtube(youtube_url: str, num_frames: int = None) -> tup
             print(f"   처음 {config.MAX_VIDEO_LENGTH}초만 처리합니다.")
             total_frames = min(total_frames, int(fps * config.MAX_VIDEO_LENGTH))
 
-        # 3. 프레임 위치 계산 (균등 분포)
-        interval = total_frames // num_frames
-        frame_positions = [i * interval for i in range(num_frames)]
+        # 긴 영상은 구간별로 나누어 여러 프로세스에서 디코딩
+        executor = None
+        if config.FRAME_PARALLEL_ENABLED and min(duration, config.MAX_VIDEO_LENGTH) >= config.FRAME_PARALLEL_MIN_SECONDS:
+            executor = get_frame_pool()
+            if executor is not None:
+                print(f"   병렬 디코딩: {frame_workers()}개 프로세스")
 
-        print(f"   추출 위치: {[f'{p}번째' for p in frame_positions]}\n")
+        # 3. 프레임 위치 계산 (장면 전환 기반 선택, 실패하거나 비활성화면 균등 분포)
+        frame_positions = []
 
-        # 4. 각 위치에서 프레임 추출 (Skip-and-Retry)
-        frames = []
-        success_count = 0
-        fail_count = 0
+        if config.SCENE_SELECTION_ENABLED:
+            try:
+                frame_positions = select_keyframes(video_path, num_frames, max_frame=total_frames, executor=executor, segments=frame_workers())
+                print(f"   장면 전환 기반 선택: {len(frame_positions)}개 장면")
+            except Exception as e:
+                print(f"   ⚠️  장면 분석 실패, 균등 간격으로 추출합니다: {str(e)}")
 
-        for i, frame_pos in enumerate(frame_positions):
-            print(f"   [{i+1}/{num_frames}] 프레임 {frame_pos} 추출 중...", end=" ")
+        if not frame_positions:
+            interval = total_frames // num_frames
+            frame_positions = [i * interval for i in range(num_frames)]
 
-            # OpenCV로 프레임 추출 (Skip-and-Retry 활성화)
-            pil_image = extract_frame_from_video(video_path, frame_pos, skip_retry=True)
+        print(f"   추출 위치: {[f'{p}번째' for p in frame_positions]}\n")
 
-            if pil_image is None:
-                print(f"❌ 모든 재시도 실패")
-                fail_count += 1
-                continue
+        # 4. 캡처를 한 번만 열고 순방향 탐색으로 모든 위치의 프레임 추출 (Skip-and-Retry)
+        if executor is not None:
+            extracted = extract_frames_parallel(video_path, frame_positions, skip_retry=True, executor=executor)
+        else:
+            extracted = extract_frames_from_video(video_path, frame_positions, skip_retry=True, verbose=True)
 
-            frames.append(pil_image)
-            success_count += 1
-            print(f"✅")
+        frames = [image for image in extracted if image is not None]
+        success_count = len(frames)
+        fail_count = len(extracted) - success_count
 
         # 5. 프레임 추출 결과 확인 (1개 이상이면 진행)
         print(f"\n{'='*60}")
@@ -352,25 +747,21 @@ def extract_frames_from_youtube(youtube_url: str, num_frames: int = None) -> tup
             error_details += "- 방법 3: 직접 입력 사용"
             raise Exception(error_details)
 
-        if len(frames) < num_frames:
-            print(f"⚠️  경고: {len(frames)}개만 추출됨 (목표: {num_frames}개)")
+        if len(frames) < len(frame_positions):
+            print(f"⚠️  경고: {len(frames)}개만 추출됨 (목표: {len(frame_positions)}개)")
             print(f"   → 추출된 프레임으로 분석을 진행합니다\n")
 
         print(f"✅ 총 {len(frames)}개 프레임 추출 완료!")
         print(f"📦 영상 파일 보관: {video_path}")
-        print(f"   (Gemini 분석 후 자동 삭제됩니다)\n")
+        print(f"   (Gemini 분석 후 작업이 종료됩니다)\n")
 
         # 프레임 리스트와 비디오 파일 경로를 함께 반환
         return frames, video_path
 
     except Exception as e:
-        # 에러 발생 시 비디오 파일 삭제
-        if video_path and os.path.exists(video_path):
-            try:
-                os.remove(video_path)
-                print(f"🔒 에러로 인한 임시 파일 삭제")
-            except:
-                pass
+        # 에러 발생 시 작업 종료 (작업 디렉토리 삭제, 공용 영상은 다른 작업을 위해 보관)
+        if video_path and youtube_job is None and MEDIA_WORKSPACE.release(video_path):
+            print(f"🔒 에러로 인한 작업 종료")
         raise Exception(f"프레임 추출 중 오류 발생: {str(e)}")
 
 
@@ -387,24 +778,8 @@ def get_youtube_metadata(youtube_url: str) -> Dict[str, any]:
     Raises:
         Exception: 메타데이터 추출 실패 시
     """
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': True,
-    }
-
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
-
-            return {
-                'title': info.get('title', 'Unknown'),
-                'duration': info.get('duration', 0),
-                'uploader': info.get('uploader', 'Unknown'),
-                'view_count': info.get('view_count', 0),
-                'upload_date': info.get('upload_date', ''),
-                'description': info.get('description', ''),
-            }
+        return YouTubeJob(youtube_url).metadata()
 
     except Exception as e:
         raise Exception(f"메타데이터 추출 실패: {str(e)}")
@@ -419,16 +794,18 @@ if __name__ == "__main__":
     print("=" * 80)
 
     try:
-        # 메타데이터 추출 테스트
-        print("\n📊 메타데이터 추출 테스트:")
-        metadata = get_youtube_metadata(test_url)
-        print(f"   제목: {metadata['title']}")
-        print(f"   길이: {metadata['duration']}초")
-        print(f"   업로더: {metadata['uploader']}")
-
-        # 프레임 추출 테스트
-        print("\n🎬 프레임 추출 테스트 (5개 프레임):")
-        frames = extract_frames_from_youtube(test_url, num_frames=5)
+        # 메타데이터와 프레임 추출이 정보 추출 결과를 공유
+        with YouTubeJob(test_url) as job:
+            # 메타데이터 추출 테스트
+            print("\n📊 메타데이터 추출 테스트:")
+            metadata = job.metadata()
+            print(f"   제목: {metadata['title']}")
+            print(f"   길이: {metadata['duration']}초")
+            print(f"   업로더: {metadata['uploader']}")
+
+            # 프레임 추출 테스트
+            print("\n🎬 프레임 추출 테스트 (5개 프레임):")
+            frames, _ = job.extract_frames(num_frames=5)
 
         print(f"\n✅ 성공! {len(frames)}개 프레임 추출됨")
         print(f"   첫 프레임 크기: {frames[0].size}")